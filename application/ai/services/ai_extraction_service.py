@@ -8,6 +8,18 @@ from domain.ai.value_objects.extraction_result import ExtractionResult
 from domain.ai.value_objects.extraction_type import ExtractionType
 from domain.mail.entities.email import Email
 
+# 空内容时的固定结果（值对象不可变，可安全共享）
+_EMPTY_EMAIL_BODY_RESULT = ExtractionResult(
+    type=ExtractionType.UNKNOWN,
+    confidence=0.0,
+    raw_response="Empty email body",
+)
+_EMPTY_CONTENT_RESULT = ExtractionResult(
+    type=ExtractionType.UNKNOWN,
+    confidence=0.0,
+    raw_response="Empty content",
+)
+
 
 class AiExtractionService:
     """
@@ -61,11 +73,7 @@ class AiExtractionService:
             self._logger.warning(
                 f"Email {email.id} has no body content, skipping extraction"
             )
-            return ExtractionResult(
-                type=ExtractionType.UNKNOWN,
-                confidence=0.0,
-                raw_response="Empty email body",
-            )
+            return _EMPTY_EMAIL_BODY_RESULT
 
         # 调用提取器
         self._logger.debug(
@@ -105,11 +113,7 @@ class AiExtractionService:
             self._logger.warning(
                 f"Email {email.id} has no body content, skipping extraction"
             )
-            return ExtractionResult(
-                type=ExtractionType.UNKNOWN,
-                confidence=0.0,
-                raw_response="Empty email body",
-            )
+            return _EMPTY_EMAIL_BODY_RESULT
 
         self._logger.debug(
             f"Extracting code from email {email.id} (async), "
@@ -137,11 +141,7 @@ class AiExtractionService:
             ExtractionResult 包含提取结果
         """
         if not content:
-            return ExtractionResult(
-                type=ExtractionType.UNKNOWN,
-                confidence=0.0,
-                raw_response="Empty content",
-            )
+            return _EMPTY_CONTENT_RESULT
 
         return self._extractor.extract_code(content)
 
@@ -158,11 +158,7 @@ class AiExtractionService:
             ExtractionResult 包含提取结果
         """
         if not content:
-            return ExtractionResult(
-                type=ExtractionType.UNKNOWN,
-                confidence=0.0,
-                raw_response="Empty content",
-            )
+            return _EMPTY_CONTENT_RESULT
 
         return await self._extractor.extract_code_async(content)
 
@@ -189,11 +185,7 @@ class AiExtractionService:
             self._logger.warning(
                 f"Email {email.id} has no body content, skipping link extraction"
             )
-            return ExtractionResult(
-                type=ExtractionType.UNKNOWN,
-                confidence=0.0,
-                raw_response="Empty email body",
-            )
+            return _EMPTY_EMAIL_BODY_RESULT
 
         self._logger.debug(
             f"Extracting link from email {email.id}, "
@@ -231,11 +223,7 @@ class AiExtractionService:
             self._logger.warning(
                 f"Email {email.id} has no body content, skipping link extraction"
             )
-            return ExtractionResult(
-                type=ExtractionType.UNKNOWN,
-                confidence=0.0,
-                raw_response="Empty email body",
-            )
+            return _EMPTY_EMAIL_BODY_RESULT
 
         self._logger.debug(
             f"Extracting link from email {email.id} (async), "
@@ -263,11 +251,7 @@ class AiExtractionService:
             ExtractionResult 包含提取结果
         """
         if not content:
-            return ExtractionResult(
-                type=ExtractionType.UNKNOWN,
-                confidence=0.0,
-                raw_response="Empty content",
-            )
+            return _EMPTY_CONTENT_RESULT
 
         return self._extractor.extract_link(content)
 
@@ -284,11 +268,7 @@ class AiExtractionService:
             ExtractionResult 包含提取结果
         """
         if not content:
-            return ExtractionResult(
-                type=ExtractionType.UNKNOWN,
-                confidence=0.0,
-                raw_response="Empty content",
-            )
+            return _EMPTY_CONTENT_RESULT
 
         return await self._extractor.extract_link_async(content)
 
@@ -306,11 +286,7 @@ class AiExtractionService:
             ExtractionResult 包含提取结果
         """
         if not content:
-            return ExtractionResult(
-                type=ExtractionType.UNKNOWN,
-                confidence=0.0,
-                raw_response="Empty content",
-            )
+            return _EMPTY_CONTENT_RESULT
 
         return self._extractor.extract(content)
 
@@ -328,11 +304,7 @@ class AiExtractionService:
             ExtractionResult 包含提取结果
         """
         if not content:
-            return ExtractionResult(
-                type=ExtractionType.UNKNOWN,
-                confidence=0.0,
-                raw_response="Empty content",
-            )
+            return _EMPTY_CONTENT_RESULT
 
         return await self._extractor.extract_async(content)
 
@@ -360,11 +332,7 @@ class AiExtractionService:
             self._logger.warning(
                 f"Email {email.id} has no body content, skipping unified extraction"
             )
-            return ExtractionResult(
-                type=ExtractionType.UNKNOWN,
-                confidence=0.0,
-                raw_response="Empty email body",
-            )
+            return _EMPTY_EMAIL_BODY_RESULT
 
         self._logger.debug(
             f"Unified extracting from email {email.id}, "
@@ -403,11 +371,7 @@ class AiExtractionService:
             self._logger.warning(
                 f"Email {email.id} has no body content, skipping unified extraction"
             )
-            return ExtractionResult(
-                type=ExtractionType.UNKNOWN,
-                confidence=0.0,
-                raw_response="Empty email body",
-            )
+            return _EMPTY_EMAIL_BODY_RESULT
 
         self._logger.debug(
             f"Unified extracting from email {email.id} (async), "
@@ -140,6 +140,9 @@ class AsyncMailPollingService(MailPollingService):
             self._executor.shutdown(wait=False, cancel_futures=True)
             self._executor = None
 
+        # 断开 IMAP 服务持有的空闲连接
+        self._imap_service.close()
+
         self._semaphore = None
         self._loop = None
         self._logger.info("Mail polling service stopped")
@@ -55,6 +55,13 @@ class ImapMailFetchService(ABC):
         """
         raise NotImplementedError
 
+    def close(self) -> None:
+        """
+        释放实现持有的连接等资源
+
+        默认无操作；持有连接池的实现应覆盖此方法。
+        """
+
 
 class ImapConnectionError(Exception):
     """IMAP 连接错误"""
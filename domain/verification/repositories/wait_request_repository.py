@@ -22,6 +22,14 @@ class WaitRequestRepository(Protocol):
         """
         ...
 
+    def add_many(self, wait_requests: List[WaitRequest]) -> None:
+        """批量添加等待请求（单次提交）
+
+        Args:
+            wait_requests: 要添加的等待请求实体列表
+        """
+        ...
+
     def get_by_id(self, request_id: UUID) -> Optional[WaitRequest]:
         """按 ID 获取等待请求
 
@@ -1,8 +1,10 @@
 """使用 LangChain 的验证信息提取器实现"""
 
+import asyncio
 import json
 import logging
-from typing import Optional
+import re
+from typing import Callable, Optional
 
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage
@@ -10,6 +12,9 @@ from langchain_core.messages import HumanMessage
 from domain.ai.value_objects.extraction_result import ExtractionResult
 from domain.ai.value_objects.extraction_type import ExtractionType
 
+# http(s) 协议 + 含点号的域名 + 可选端口（允许为空，如 example.com:/x），之后必须是路径/查询/片段或结尾
+_URL_PATTERN = re.compile(r"https?://[^/\s:?#]+\.[^/\s:?#]+(?::\d*)?(?:[/?#]|$)")
+
 
 class LlmVerificationExtractor:
     """
@@ -21,6 +26,7 @@ class LlmVerificationExtractor:
 
     功能:
         - 验证码提取 (extract_code/extract_code_async)
+        - 批量验证码提取 (extract_code_batch_async)
         - 验证链接提取 (extract_link/extract_link_async)
 
     Attributes:
@@ -29,15 +35,19 @@ class LlmVerificationExtractor:
         DEFAULT_MODEL: 默认使用的模型
         DEFAULT_API_BASE: 默认 API 地址
         DEFAULT_TIMEOUT: 默认超时时间
+        DEFAULT_REQUEST_TIMEOUT: 异步调用整体超时的默认值（超时后重试一次），不低于 DEFAULT_TIMEOUT
         MAX_CONTENT_LENGTH: 邮件内容最大长度（避免 token 超限）
         DEFAULT_MAX_RETRIES: 默认最大重试次数
+        ASYNC_PARSE_THRESHOLD: 异步方法中超过该长度的响应放到线程中解析
     """
 
     DEFAULT_MODEL = "gpt-4o-mini"
     DEFAULT_API_BASE = "https://api.openai.com/v1"
     DEFAULT_TIMEOUT = 30.0
+    DEFAULT_REQUEST_TIMEOUT = DEFAULT_TIMEOUT
     MAX_CONTENT_LENGTH = 4000
     DEFAULT_MAX_RETRIES = 3
+    ASYNC_PARSE_THRESHOLD = 100_000
 
     PROMPT_TEMPLATE = """你是一个专门提取验证码的 AI 助手。请分析以下邮件内容，提取其中的验证码。
 
@@ -143,6 +153,7 @@ class LlmVerificationExtractor:
         timeout: float = DEFAULT_TIMEOUT,
         max_retries: int = DEFAULT_MAX_RETRIES,
         max_tokens: int = DEFAULT_MAX_TOKENS,
+        request_timeout: float = DEFAULT_REQUEST_TIMEOUT,
         logger: Optional[logging.Logger] = None,
     ):
         """
@@ -155,6 +166,8 @@ class LlmVerificationExtractor:
             timeout: API 调用超时时间（秒）
             max_retries: 最大重试次数，默认 3 次
             max_tokens: 最大生成 token 数，默认 1024
+            request_timeout: 异步调用整体超时时间（秒），超时后重试一次；
+                包含客户端自身的重试，小于 timeout 时按 timeout 计算
             logger: 日志记录器
 
         Raises:
@@ -173,6 +186,8 @@ class LlmVerificationExtractor:
         self._timeout = timeout
         self._max_retries = max_retries
         self._max_tokens = max_tokens
+        # 截断上限低于客户端超时会在客户端自身超时/重试之前取消请求
+        self._request_timeout = max(request_timeout, timeout)
         self._logger = logger or logging.getLogger(__name__)
 
         # 初始化 LangChain ChatOpenAI
@@ -198,10 +213,9 @@ class LlmVerificationExtractor:
             ExtractionResult 包含提取结果
         """
         try:
-            truncated_content = content[: self.MAX_CONTENT_LENGTH]
-            prompt = self.PROMPT_TEMPLATE.format(content=truncated_content)
+            prompt = self._build_prompt(self.PROMPT_TEMPLATE, content)
 
-            response = self._llm.invoke([HumanMessage(content=prompt)])
+            response = self._llm.invoke(self._build_messages(prompt))
             return self._parse_response(response.content)
 
         except Exception as e:
@@ -223,11 +237,10 @@ class LlmVerificationExtractor:
             ExtractionResult 包含提取结果
         """
         try:
-            truncated_content = content[: self.MAX_CONTENT_LENGTH]
-            prompt = self.PROMPT_TEMPLATE.format(content=truncated_content)
+            prompt = self._build_prompt(self.PROMPT_TEMPLATE, content)
 
-            response = await self._llm.ainvoke([HumanMessage(content=prompt)])
-            return self._parse_response(response.content)
+            response = await self._ainvoke(prompt)
+            return await self._parse_async(self._parse_response, response.content)
 
         except Exception as e:
             self._logger.error(f"AI extraction failed (async): {e}")
@@ -237,6 +250,110 @@ class LlmVerificationExtractor:
                 raw_response=str(e),
             )
 
+    async def extract_code_batch_async(
+        self, contents: list[str]
+    ) -> list[ExtractionResult]:
+        """
+        并发提取多封邮件中的验证码（异步版本）
+
+        LLM 调用以网络等待为主，使用 asyncio.gather 并发发起请求。
+        单封邮件提取失败不影响其他邮件，对应结果为 type=UNKNOWN。
+
+        Args:
+            contents: 邮件正文内容列表（纯文本或 HTML）
+
+        Returns:
+            与 contents 顺序一致的 ExtractionResult 列表
+        """
+        return list(
+            await asyncio.gather(
+                *(self.extract_code_async(content) for content in contents)
+            )
+        )
+
+    def _build_prompt(self, template: str, content: str) -> str:
+        """
+        截断邮件内容并填充 prompt 模板
+
+        Args:
+            template: prompt 模板（包含 {content} 占位符）
+            content: 邮件正文内容
+
+        Returns:
+            填充后的 prompt，邮件内容不超过 MAX_CONTENT_LENGTH
+        """
+        return template.format(content=content[: self.MAX_CONTENT_LENGTH])
+
+    @staticmethod
+    def _build_messages(prompt: str) -> list[HumanMessage]:
+        """
+        构造发送给 LLM 的消息列表
+
+        prompt 由内部模板生成，内容必然是字符串，使用 model_construct
+        跳过 Pydantic 校验。每次调用返回新列表，并发调用互不影响。
+
+        Args:
+            prompt: 发送给 LLM 的 prompt
+
+        Returns:
+            仅包含一条 HumanMessage 的消息列表
+        """
+        return [HumanMessage.model_construct(content=prompt)]
+
+    async def _ainvoke(self, prompt: str):
+        """
+        异步调用 LLM，整体超时后重试一次
+
+        超时上限不低于客户端的 timeout，因此不会打断客户端单次请求；
+        超过上限时客户端尚未完成的重试会被取消，改为由这里重新发起一次。
+
+        Args:
+            prompt: 发送给 LLM 的 prompt
+
+        Returns:
+            LLM 响应消息
+
+        Raises:
+            TimeoutError: 重试后仍然超时
+        """
+        messages = self._build_messages(prompt)
+        try:
+            return await asyncio.wait_for(
+                self._llm.ainvoke(messages), timeout=self._request_timeout
+            )
+        except TimeoutError:
+            self._logger.warning(
+                f"LLM request timed out after {self._request_timeout}s, retrying once"
+            )
+
+        try:
+            return await asyncio.wait_for(
+                self._llm.ainvoke(messages), timeout=self._request_timeout
+            )
+        except TimeoutError:
+            raise TimeoutError(
+                f"LLM request timed out after {self._request_timeout}s"
+            ) from None
+
+    async def _parse_async(
+        self, parser: Callable[[str], ExtractionResult], response: str
+    ) -> ExtractionResult:
+        """
+        在异步方法中解析 LLM 响应
+
+        超大响应放到线程中解析，避免阻塞事件循环；常规响应直接解析。
+
+        Args:
+            parser: 响应解析方法
+            response: LLM 返回的原始响应文本
+
+        Returns:
+            ExtractionResult 包含解析后的结果
+        """
+        if len(response) > self.ASYNC_PARSE_THRESHOLD:
+            return await asyncio.to_thread(parser, response)
+        return parser(response)
+
     def _parse_response(self, response: str) -> ExtractionResult:
         """
         解析 LLM 响应
@@ -248,14 +365,9 @@ class LlmVerificationExtractor:
             ExtractionResult 包含解析后的结果
         """
         try:
-            # 尝试提取 JSON 部分（LLM 可能添加其他文字）
-            start = response.find("{")
-            end = response.rfind("}") + 1
-
-            if start >= 0 and end > start:
-                json_str = response[start:end]
-                data = json.loads(json_str)
+            data = self._load_json(response)
 
+            if data is not None:
                 if data.get("found") and data.get("code"):
                     return ExtractionResult(
                         type=ExtractionType.CODE,
@@ -290,10 +402,9 @@ class LlmVerificationExtractor:
             ExtractionResult 包含提取结果
         """
         try:
-            truncated_content = content[: self.MAX_CONTENT_LENGTH]
-            prompt = self.LINK_PROMPT_TEMPLATE.format(content=truncated_content)
+            prompt = self._build_prompt(self.LINK_PROMPT_TEMPLATE, content)
 
-            response = self._llm.invoke([HumanMessage(content=prompt)])
+            response = self._llm.invoke(self._build_messages(prompt))
             return self._parse_link_response(response.content)
 
         except Exception as e:
@@ -315,11 +426,10 @@ class LlmVerificationExtractor:
             ExtractionResult 包含提取结果
         """
         try:
-            truncated_content = content[: self.MAX_CONTENT_LENGTH]
-            prompt = self.LINK_PROMPT_TEMPLATE.format(content=truncated_content)
+            prompt = self._build_prompt(self.LINK_PROMPT_TEMPLATE, content)
 
-            response = await self._llm.ainvoke([HumanMessage(content=prompt)])
-            return self._parse_link_response(response.content)
+            response = await self._ainvoke(prompt)
+            return await self._parse_async(self._parse_link_response, response.content)
 
         except Exception as e:
             self._logger.error(f"AI link extraction failed (async): {e}")
@@ -343,10 +453,9 @@ class LlmVerificationExtractor:
             ExtractionResult 包含提取结果
         """
         try:
-            truncated_content = content[: self.MAX_CONTENT_LENGTH]
-            prompt = self.UNIFIED_PROMPT_TEMPLATE.format(content=truncated_content)
+            prompt = self._build_prompt(self.UNIFIED_PROMPT_TEMPLATE, content)
 
-            response = self._llm.invoke([HumanMessage(content=prompt)])
+            response = self._llm.invoke(self._build_messages(prompt))
             return self._parse_unified_response(response.content)
 
         except Exception as e:
@@ -371,11 +480,10 @@ class LlmVerificationExtractor:
             ExtractionResult 包含提取结果
         """
         try:
-            truncated_content = content[: self.MAX_CONTENT_LENGTH]
-            prompt = self.UNIFIED_PROMPT_TEMPLATE.format(content=truncated_content)
+            prompt = self._build_prompt(self.UNIFIED_PROMPT_TEMPLATE, content)
 
-            response = await self._llm.ainvoke([HumanMessage(content=prompt)])
-            return self._parse_unified_response(response.content)
+            response = await self._ainvoke(prompt)
+            return await self._parse_async(self._parse_unified_response, response.content)
 
         except Exception as e:
             self._logger.error(f"AI unified extraction failed (async): {e}")
@@ -396,14 +504,9 @@ class LlmVerificationExtractor:
             ExtractionResult 包含解析后的结果
         """
         try:
-            # 尝试提取 JSON 部分（LLM 可能添加其他文字）
-            start = response.find("{")
-            end = response.rfind("}") + 1
-
-            if start >= 0 and end > start:
-                json_str = response[start:end]
-                data = json.loads(json_str)
+            data = self._load_json(response)
 
+            if data is not None:
                 type_str = data.get("type", "unknown").lower()
                 code = data.get("code")
                 link = data.get("link")
@@ -446,6 +549,36 @@ class LlmVerificationExtractor:
                 raw_response=response,
             )
 
+    def _load_json(self, response: str) -> Optional[dict]:
+        """
+        从 LLM 响应中解析 JSON 对象
+
+        LLM 按要求只返回 JSON 时直接解析；否则（前后带有其他文字）
+        截取第一个 { 到最后一个 } 之间的部分再解析。
+
+        Args:
+            response: LLM 返回的原始响应文本
+
+        Returns:
+            解析得到的 dict，响应中不包含 JSON 对象时返回 None
+
+        Raises:
+            json.JSONDecodeError: 截取的内容不是合法 JSON
+        """
+        # LLM 常以纯文字回答"未找到"，不含 { 时无需尝试解析
+        if "{" not in response:
+            return None
+
+        json_str = response.strip()
+        if not (json_str.startswith("{") and json_str.endswith("}")):
+            start = response.find("{")
+            end = response.rfind("}") + 1
+            if end <= start:
+                return None
+            json_str = response[start:end]
+
+        return json.loads(json_str)
+
     def _validate_url(self, url: Optional[str]) -> Optional[str]:
         """
         验证 URL 格式
@@ -456,17 +589,7 @@ class LlmVerificationExtractor:
         Returns:
             验证通过返回原 URL，否则返回 None
         """
-        if not url or not url.strip():
-            return None
-        if not url.startswith(("http://", "https://")):
-            return None
-        # 检查域名
-        protocol_end = url.find("://") + 3
-        path_start = url.find("/", protocol_end)
-        domain = url[protocol_end:path_start] if path_start > 0 else url[protocol_end:]
-        if ":" in domain:
-            domain = domain.split(":")[0]
-        if not domain or "." not in domain:
+        if not url or _URL_PATTERN.match(url) is None:
             return None
         return url
 
@@ -481,15 +604,9 @@ class LlmVerificationExtractor:
             ExtractionResult 包含解析后的结果
         """
         try:
-            # 尝试提取 JSON 部分（LLM 可能添加其他文字）
-            # 使用更健壮的方法：查找第一个 { 和最后一个 }，但需要处理嵌套情况
-            start = response.find("{")
-            end = response.rfind("}") + 1
-
-            if start >= 0 and end > start:
-                json_str = response[start:end]
-                data = json.loads(json_str)
+            data = self._load_json(response)
 
+            if data is not None:
                 if data.get("found") and data.get("link"):
                     link = data["link"]
                     # 使用 _validate_url 进行 URL 格式验证
@@ -105,6 +105,7 @@ class InfraContainer(containers.DeclarativeContainer):
         api_base=config.settings.provided.openai_api_base,
         timeout=config.settings.provided.ai_extraction_timeout,
         max_tokens=config.settings.provided.ai_max_tokens,
+        request_timeout=config.settings.provided.ai_request_timeout,
     )
 
     # ============ 外部服务（后续添加）============
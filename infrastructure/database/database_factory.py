@@ -223,7 +223,7 @@ def init_database(engine: Optional[Engine] = None) -> None:
     初始化数据库（创建所有表）
 
     在应用启动时调用，自动创建所有已注册的表。
-    如果表已存在则跳过。
+    如果表已存在则跳过，但会为已存在的表补建缺失的索引。
 
     Args:
         engine: SQLAlchemy Engine，如果不传则自动创建
@@ -240,3 +240,8 @@ def init_database(engine: Optional[Engine] = None) -> None:
 
     # 创建所有表（如果不存在）
     Base.metadata.create_all(bind=engine)
+
+    # create_all 会跳过已存在的表，也就不会为其补建后来新增的索引
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
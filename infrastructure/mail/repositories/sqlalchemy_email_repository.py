@@ -1,8 +1,9 @@
 """邮件 SQLAlchemy 仓储实现"""
 
-from typing import Optional, List
+from typing import Iterator, Optional, List
 from uuid import UUID
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from domain.mail.entities.email import Email
@@ -15,8 +16,13 @@ class SqlAlchemyEmailRepository(EmailRepository):
     邮件 SQLAlchemy 仓储实现
 
     提供邮件的持久化操作
+
+    Attributes:
+        STREAM_BATCH_SIZE: iter_by_mailbox_id 每批从数据库读取的行数
     """
 
+    STREAM_BATCH_SIZE = 500
+
     def __init__(self, session: Session):
         """
         初始化仓储
@@ -32,11 +38,19 @@ class SqlAlchemyEmailRepository(EmailRepository):
         self._session.add(model)
         self._session.commit()
 
+    def add_many(self, emails: List[Email]) -> None:
+        """
+        批量添加邮件记录（单次提交）
+
+        Args:
+            emails: 邮件实体列表
+        """
+        self._session.add_all([self._to_model(email) for email in emails])
+        self._session.commit()
+
     def get_by_id(self, email_id: UUID) -> Optional[Email]:
         """根据 ID 获取邮件"""
-        model = self._session.query(EmailModel).filter(
-            EmailModel.id == str(email_id)
-        ).first()
+        model = self._session.get(EmailModel, str(email_id))
 
         if model is None:
             return None
@@ -70,6 +84,29 @@ class SqlAlchemyEmailRepository(EmailRepository):
 
         return [self._to_entity(model) for model in models]
 
+    def iter_by_mailbox_id(self, mailbox_id: UUID) -> Iterator[Email]:
+        """
+        逐条迭代指定邮箱的所有邮件
+
+        与 list_by_mailbox_id 结果相同，但每批只读取 STREAM_BATCH_SIZE 行，
+        内存占用与邮件总数无关。
+
+        Args:
+            mailbox_id: 邮箱账号 ID
+
+        Returns:
+            邮件迭代器，按接收时间降序
+        """
+        models = self._session.execute(
+            select(EmailModel)
+            .where(EmailModel.mailbox_id == str(mailbox_id))
+            .order_by(EmailModel.received_at.desc())
+            .execution_options(yield_per=self.STREAM_BATCH_SIZE)
+        ).scalars()
+
+        for model in models:
+            yield self._to_entity(model)
+
     def list_unprocessed(self, limit: int = 100) -> List[Email]:
         """
         获取未处理的邮件
@@ -88,9 +125,7 @@ class SqlAlchemyEmailRepository(EmailRepository):
 
     def update(self, email: Email) -> None:
         """更新邮件记录"""
-        model = self._session.query(EmailModel).filter(
-            EmailModel.id == str(email.id)
-        ).first()
+        model = self._session.get(EmailModel, str(email.id))
 
         if model is not None:
             self._update_model(model, email)
@@ -98,9 +133,7 @@ class SqlAlchemyEmailRepository(EmailRepository):
 
     def remove(self, email: Email) -> None:
         """删除邮件记录"""
-        model = self._session.query(EmailModel).filter(
-            EmailModel.id == str(email.id)
-        ).first()
+        model = self._session.get(EmailModel, str(email.id))
 
         if model is not None:
             self._session.delete(model)
@@ -1,15 +1,18 @@
 """IMAP 邮件收取服务实现"""
 
 import imaplib
+import re
 import ssl
 import email
 import time
 import logging
+import threading
 from contextlib import contextmanager
+from functools import lru_cache
 from datetime import datetime, timezone
 from email.header import decode_header
 from email.utils import parsedate_to_datetime
-from typing import List, Optional, Union, Tuple, Generator
+from typing import Dict, Iterator, List, Optional, Union, Tuple, Generator
 
 from domain.mailbox.entities.mailbox_account import MailboxAccount
 from domain.mail.services.imap_mail_fetch_service import (
@@ -20,6 +23,23 @@ from domain.mail.services.imap_mail_fetch_service import (
 from domain.mail.value_objects.parsed_email import ParsedEmail
 from domain.mail.value_objects.email_content import EmailContent
 
+# UID FETCH 响应头形如 b'3 (UID 1021 BODY[] {2048}'
+_FETCH_UID_PATTERN = re.compile(rb"\bUID (\d+)")
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_header(date_str: str) -> datetime:
+    """
+    解析 Date 头部（带缓存）
+
+    同一线程的回复、批量通知等邮件常带有相同的 Date 头部。
+    datetime 不可变，可安全共享；解析失败抛出的异常不会被缓存。
+
+    Raises:
+        ValueError / TypeError: 日期格式无效
+    """
+    return parsedate_to_datetime(date_str)
+
 
 class ImapMailFetchServiceImpl(ImapMailFetchService):
     """
@@ -30,11 +50,14 @@ class ImapMailFetchServiceImpl(ImapMailFetchService):
     - 未读邮件收取和标记已读
     - HTML 和纯文本邮件解析
     - 自动重连（指数退避策略）
+    - 连接池复用（省去每次收取的 TLS 握手与 LOGIN）
     """
 
     MAX_RETRIES = 3
     BASE_DELAY = 1  # 秒
     DEFAULT_TIMEOUT = 30  # 秒
+    POOL_IDLE_TTL = 300  # 秒，空闲超过该时间的池化连接不再复用
+    FETCH_BATCH_SIZE = 50  # 单次 UID FETCH 的邮件数量上限
 
     def __init__(
         self,
@@ -50,6 +73,9 @@ class ImapMailFetchServiceImpl(ImapMailFetchService):
         """
         self._encryption_key = encryption_key
         self._logger = logger or logging.getLogger(__name__)
+        # (server, port, username) -> (空闲连接, 归还时间)
+        self._pool: Dict[Tuple[str, int, str], Tuple[imaplib.IMAP4_SSL, float]] = {}
+        self._pool_lock = threading.Lock()
 
     def fetch_new_emails(self, mailbox: MailboxAccount) -> List[ParsedEmail]:
         """
@@ -58,51 +84,72 @@ class ImapMailFetchServiceImpl(ImapMailFetchService):
         连接到邮箱的 IMAP 服务器，获取所有未读邮件，
         解析邮件内容，并将邮件标记为已读。
 
+        按 UID 批量 FETCH（每批最多 FETCH_BATCH_SIZE 封）并批量标记已读，
+        N 封邮件只需 N / FETCH_BATCH_SIZE 次往返，而不是每封一次 FETCH 和 STORE。
+
         Args:
             mailbox: 邮箱账号实体
 
         Returns:
             解析后的邮件列表
         """
-        with self._connection(mailbox) as imap:
-            if imap is None:
-                return []
+        # 异常需穿过 _connection 上下文，出错的连接才会被断开而不是归还连接池
+        try:
+            with self._connection(mailbox) as imap:
+                if imap is None:
+                    return []
+                return self._fetch_unseen(imap)
 
-            try:
-                # 选择收件箱
-                imap.select("INBOX")
+        except Exception as e:
+            self._logger.error(f"Error during email fetch: {e}")
+            return []
 
-                # 搜索未读邮件
-                status, messages = imap.search(None, "UNSEEN")
-                if status != "OK":
-                    self._logger.warning(f"Failed to search emails: {status}")
-                    return []
+    def close(self) -> None:
+        """
+        断开连接池中所有空闲连接
 
-                email_ids = messages[0].split()
-                if not email_ids:
-                    self._logger.debug("No unread emails found")
-                    return []
+        正在使用中的连接不在池中，归还时照常入池，之后由 TTL 清理。
+        """
+        with self._pool_lock:
+            idle = [imap for imap, _ in self._pool.values()]
+            self._pool.clear()
 
-                self._logger.info(f"Found {len(email_ids)} unread email(s)")
+        for imap in idle:
+            self._disconnect(imap)
 
-                parsed_emails: List[ParsedEmail] = []
+    def _fetch_unseen(self, imap: imaplib.IMAP4_SSL) -> List[ParsedEmail]:
+        """
+        收取收件箱中的未读邮件
 
-                for email_id in email_ids:
-                    try:
-                        parsed_email = self._fetch_and_parse_email(imap, email_id)
-                        if parsed_email:
-                            parsed_emails.append(parsed_email)
-                            # 标记为已读
-                            imap.store(email_id, "+FLAGS", "\\Seen")
-                    except Exception as e:
-                        self._logger.error(f"Failed to process email {email_id}: {e}")
-                        continue
+        Args:
+            imap: 已登录的 IMAP 连接对象
 
-                return parsed_emails
+        Returns:
+            解析后的邮件列表
+        """
+        # 选择收件箱
+        imap.select("INBOX")
 
-            except Exception as e:
-                self._logger.error(f"Error during email fetch: {e}")
-                return []
+        # 搜索未读邮件
+        status, messages = imap.uid("SEARCH", None, "UNSEEN")
+        if status != "OK":
+            self._logger.warning(f"Failed to search emails: {status}")
+            return []
+
+        uids = messages[0].split()
+        if not uids:
+            self._logger.debug("No unread emails found")
+            return []
+
+        self._logger.info(f"Found {len(uids)} unread email(s)")
+
+        parsed_emails: List[ParsedEmail] = []
+
+        for start in range(0, len(uids), self.FETCH_BATCH_SIZE):
+            batch = uids[start:start + self.FETCH_BATCH_SIZE]
+            parsed_emails.extend(self._fetch_and_parse_batch(imap, batch))
+
+        return parsed_emails
 
     def test_connection(self, mailbox: MailboxAccount) -> bool:
         """
@@ -178,13 +225,79 @@ class ImapMailFetchServiceImpl(ImapMailFetchService):
                     imap.select("INBOX")
                     # ... 操作邮件
         """
-        imap = self._connect_with_retry(mailbox)
+        imap = self._acquire(mailbox)
+        if imap is None:
+            yield None
+            return
+
         try:
             yield imap
-        finally:
-            if imap:
+        except BaseException:
+            # 出错的连接状态不可信，直接断开不归还
+            self._disconnect(imap)
+            raise
+        else:
+            self._release(mailbox, imap)
+
+    @staticmethod
+    def _pool_key(mailbox: MailboxAccount) -> Tuple[str, int, str]:
+        """连接池键：同一服务器端口上的同一账号共享连接"""
+        config = mailbox.imap_config
+        return (config.server, config.port, mailbox.username)
+
+    def _acquire(self, mailbox: MailboxAccount) -> Optional[imaplib.IMAP4_SSL]:
+        """
+        从连接池取出连接，没有可用连接时新建
+
+        取出的连接在归还前不在池中，因此同一账号的并发收取不会共享连接。
+        复用前发送 NOOP 作为保活检查，服务端已断开的连接会被丢弃并重连。
+
+        Args:
+            mailbox: 邮箱账号实体
+
+        Returns:
+            IMAP 连接对象，或 None 如果连接失败
+        """
+        if mailbox.imap_config is not None:
+            with self._pool_lock:
+                entry = self._pool.pop(self._pool_key(mailbox), None)
+
+            if entry is not None:
+                imap, released_at = entry
+                if time.monotonic() - released_at < self.POOL_IDLE_TTL:
+                    try:
+                        imap.noop()
+                        return imap
+                    except (imaplib.IMAP4.error, OSError) as e:
+                        self._logger.debug(f"Pooled IMAP connection is dead: {e}")
                 self._disconnect(imap)
 
+        return self._connect_with_retry(mailbox)
+
+    def _release(self, mailbox: MailboxAccount, imap: imaplib.IMAP4_SSL) -> None:
+        """
+        将连接归还连接池（不 LOGOUT），同时清理已过期的空闲连接
+
+        Args:
+            mailbox: 邮箱账号实体
+            imap: IMAP 连接对象
+        """
+        now = time.monotonic()
+        with self._pool_lock:
+            expired = [
+                key for key, (_, released_at) in self._pool.items()
+                if now - released_at >= self.POOL_IDLE_TTL
+            ]
+            stale = [self._pool.pop(key)[0] for key in expired]
+            # 同一账号已有归还的连接时（并发收取），保留较新的这条
+            previous = self._pool.pop(self._pool_key(mailbox), None)
+            if previous is not None:
+                stale.append(previous[0])
+            self._pool[self._pool_key(mailbox)] = (imap, now)
+
+        for conn in stale:
+            self._disconnect(conn)
+
     def _connect(self, mailbox: MailboxAccount) -> imaplib.IMAP4_SSL:
         """
         建立 IMAP SSL 连接
@@ -266,33 +379,101 @@ class ImapMailFetchServiceImpl(ImapMailFetchService):
         except Exception as e:
             self._logger.debug(f"Error during logout: {e}")
 
-    def _fetch_and_parse_email(
-        self, imap: imaplib.IMAP4_SSL, email_id: bytes
-    ) -> Optional[ParsedEmail]:
+    def _fetch_and_parse_batch(
+        self, imap: imaplib.IMAP4_SSL, uids: List[bytes]
+    ) -> List[ParsedEmail]:
         """
-        获取并解析单封邮件
+        批量获取并解析邮件，解析成功的邮件批量标记为已读
+
+        使用 BODY.PEEK[] 获取，FETCH 本身不会设置 \\Seen，
+        解析失败的邮件保持未读，下次轮询会重试。
 
         Args:
             imap: IMAP 连接对象
-            email_id: 邮件 ID
+            uids: 本批邮件 UID
 
         Returns:
-            解析后的邮件，或 None 如果解析失败
+            解析成功的邮件列表
         """
-        status, msg_data = imap.fetch(email_id, "(RFC822)")
-        if status != "OK" or not msg_data or not msg_data[0]:
-            return None
+        status, msg_data = imap.uid("FETCH", b",".join(uids), "(BODY.PEEK[])")
+        if status != "OK" or not msg_data:
+            self._logger.warning(f"Failed to fetch emails: {status}")
+            return []
+
+        parsed_emails: List[ParsedEmail] = []
+        seen_uids: List[bytes] = []
 
-        raw_email = msg_data[0][1]
-        if not isinstance(raw_email, bytes):
-            return None
+        for uid, raw_email in self._iter_fetched_messages(msg_data):
+            try:
+                parsed_emails.append(self._parse_email(raw_email, uid))
+                seen_uids.append(uid)
+            except Exception as e:
+                self._logger.error(f"Failed to process email {uid}: {e}")
+                continue
 
+        if seen_uids:
+            try:
+                # 标记为已读
+                imap.uid("STORE", b",".join(seen_uids), "+FLAGS", "\\Seen")
+            except (imaplib.IMAP4.abort, OSError):
+                # 连接已断开，交给上层丢弃该连接；邮件保持未读，下次轮询重新收取
+                raise
+            except Exception as e:
+                # 邮件已解析成功，保存时会按 Message-ID 去重，这里只记录日志
+                self._logger.error(f"Failed to mark emails as seen: {e}")
+
+        return parsed_emails
+
+    def _iter_fetched_messages(self, msg_data: list) -> Iterator[Tuple[bytes, bytes]]:
+        """
+        从 UID FETCH 响应中取出 (UID, 原始邮件) 对
+
+        imaplib 将每封邮件返回为 (响应头, 邮件内容) 元组，
+        元组之后跟着 b")" 等收尾项。服务器把 UID 放在邮件内容之后时
+        （如 b" UID 5)"），UID 出现在收尾项而不是响应头中。
+
+        Args:
+            msg_data: imap.uid("FETCH", ...) 返回的数据列表
+
+        Yields:
+            (UID, 原始邮件字节) 元组
+        """
+        for index, item in enumerate(msg_data):
+            if not isinstance(item, tuple) or len(item) < 2:
+                continue
+
+            header, raw_email = item[0], item[1]
+            if not isinstance(raw_email, bytes):
+                continue
+
+            match = _FETCH_UID_PATTERN.search(header)
+            if match is None and index + 1 < len(msg_data):
+                trailer = msg_data[index + 1]
+                if isinstance(trailer, bytes):
+                    match = _FETCH_UID_PATTERN.search(trailer)
+            if match is None:
+                self._logger.warning(f"UID not found in FETCH response: {header!r}")
+                continue
+
+            yield match.group(1), raw_email
+
+    def _parse_email(self, raw_email: bytes, uid: bytes) -> ParsedEmail:
+        """
+        解析单封原始邮件
+
+        Args:
+            raw_email: 原始邮件字节（RFC 822）
+            uid: 邮件 UID，Message-ID 缺失时用于生成占位标识
+
+        Returns:
+            解析后的邮件
+        """
         msg = email.message_from_bytes(raw_email)
 
         # 解析 Message-ID
         message_id = msg.get("Message-ID", "")
         if not message_id:
-            message_id = f"unknown-{email_id.decode()}"
+            message_id = f"unknown-{uid.decode()}"
 
         # 解析发件人
         from_address = self._decode_header_value(msg.get("From", ""))
@@ -327,6 +508,10 @@ class ImapMailFetchServiceImpl(ImapMailFetchService):
         if not value:
             return ""
 
+        # 不含 RFC 2047 编码字（=?charset?...?=）时 decode_header 会原样返回
+        if "=?" not in value:
+            return value
+
         decoded_parts = decode_header(value)
         result_parts = []
 
@@ -356,7 +541,7 @@ class ImapMailFetchServiceImpl(ImapMailFetchService):
             return datetime.now(timezone.utc)
 
         try:
-            return parsedate_to_datetime(date_str)
+            return _parse_date_header(date_str)
         except Exception:
             return datetime.now(timezone.utc)
 
@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import String, Integer, Boolean, DateTime, LargeBinary, Enum
+from sqlalchemy import String, Integer, Boolean, DateTime, LargeBinary, Enum, Index, desc
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 from domain.mailbox.value_objects.mailbox_enums import MailboxType, MailboxStatus
@@ -23,6 +23,16 @@ class MailboxAccountModel(Base):
     """
 
     __tablename__ = "mailbox_accounts"
+    __table_args__ = (
+        # list_filtered: WHERE status = ? AND occupied_by_service = ?
+        # ORDER BY created_at DESC，索引扫描即可完成筛选和排序
+        Index(
+            "ix_mailbox_accounts_status_service_created",
+            "status",
+            "occupied_by_service",
+            desc("created_at"),
+        ),
+    )
 
     # 主键
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
@@ -3,6 +3,7 @@
 from typing import Optional, List, Tuple
 from uuid import UUID
 
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from domain.mailbox.entities.mailbox_account import MailboxAccount
@@ -117,17 +118,30 @@ class SqlAlchemyMailboxAccountRepository(MailboxAccountRepository):
         if status is not None:
             query = query.filter(MailboxAccountModel.status == status.value)
 
-        # 总数统计
-        total = query.count()
-
         # 排序（确保分页结果稳定）
-        query = query.order_by(MailboxAccountModel.created_at.desc())
+        order_by = MailboxAccountModel.created_at.desc()
 
-        # 分页
+        # 窗口 COUNT 在分页前计算，每行都带有筛选后的总数，数据和总数一次查询取回。
+        # 窗口与外层使用相同排序、整段帧，SQLite 可沿索引顺序计算而无需额外排序
+        total_column = func.count().over(order_by=order_by, rows=(None, None))
         offset = (page - 1) * limit
-        models = query.offset(offset).limit(limit).all()
+        rows = (
+            query.add_columns(total_column.label("total"))
+            .order_by(order_by)
+            .offset(offset)
+            .limit(limit)
+            .all()
+        )
+
+        if rows:
+            total = rows[0].total
+        elif offset > 0:
+            # 页码超出范围时没有行可以携带总数，单独统计
+            total = query.count()
+        else:
+            total = 0
 
-        return [self._to_entity(model) for model in models], total
+        return [self._to_entity(model) for model, _ in rows], total
 
     def _to_model(self, entity: MailboxAccount) -> MailboxAccountModel:
         """将领域实体转换为数据模型"""
@@ -35,13 +35,14 @@ class SqlAlchemyWaitRequestRepository(WaitRequestRepository):
         self._session.add(model)
         self._session.commit()
 
+    def add_many(self, wait_requests: List[WaitRequest]) -> None:
+        """批量添加等待请求（单次提交）"""
+        self._session.add_all([self._to_model(r) for r in wait_requests])
+        self._session.commit()
+
     def get_by_id(self, request_id: UUID) -> Optional[WaitRequest]:
         """按 ID 获取等待请求"""
-        model = (
-            self._session.query(WaitRequestModel)
-            .filter(WaitRequestModel.id == str(request_id))
-            .first()
-        )
+        model = self._session.get(WaitRequestModel, str(request_id))
 
         if model is None:
             return None
@@ -115,11 +116,7 @@ class SqlAlchemyWaitRequestRepository(WaitRequestRepository):
 
     def update(self, wait_request: WaitRequest) -> None:
         """更新等待请求"""
-        model = (
-            self._session.query(WaitRequestModel)
-            .filter(WaitRequestModel.id == str(wait_request.id))
-            .first()
-        )
+        model = self._session.get(WaitRequestModel, str(wait_request.id))
 
         if model is not None:
             self._update_model(model, wait_request)
@@ -145,11 +142,7 @@ class SqlAlchemyWaitRequestRepository(WaitRequestRepository):
 
     def delete(self, request_id: UUID) -> bool:
         """删除等待请求"""
-        model = (
-            self._session.query(WaitRequestModel)
-            .filter(WaitRequestModel.id == str(request_id))
-            .first()
-        )
+        model = self._session.get(WaitRequestModel, str(request_id))
 
         if model is None:
             return False
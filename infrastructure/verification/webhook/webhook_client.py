@@ -2,7 +2,7 @@
 
 import time
 import logging
-from typing import Optional, Dict, Any, List
+from typing import Callable, Optional, Dict, Any, List
 
 import httpx
 
@@ -13,6 +13,7 @@ class HttpWebhookClient(WebhookClient):
     """HTTP Webhook 客户端实现
 
     使用 httpx 库发送 HTTP POST 请求，支持指数退避重试机制。
+    客户端持有一个 httpx.Client，多次回调复用连接（keep-alive）。
 
     Attributes:
         RETRY_INTERVALS: 重试间隔列表（秒）
@@ -22,13 +23,26 @@ class HttpWebhookClient(WebhookClient):
     RETRY_INTERVALS: List[int] = [1, 5, 15]  # 重试间隔：1秒, 5秒, 15秒
     TIMEOUT: int = 10  # 请求超时时间
 
-    def __init__(self, logger: Optional[logging.Logger] = None):
+    def __init__(
+        self,
+        logger: Optional[logging.Logger] = None,
+        sleep: Callable[[float], None] = time.sleep,
+        transport: Optional[httpx.BaseTransport] = None,
+    ):
         """初始化客户端
 
         Args:
             logger: 日志记录器（可选）
+            sleep: 重试间隔的等待函数，默认 time.sleep（测试中可注入替身）
+            transport: httpx 传输层（可选，测试中可注入 httpx.MockTransport）
         """
         self._logger = logger or logging.getLogger(__name__)
+        self._sleep = sleep
+        self._client = httpx.Client(transport=transport)
+
+    def close(self) -> None:
+        """关闭底层 HTTP 连接池"""
+        self._client.close()
 
     def send(self, url: str, payload: Dict[str, Any]) -> WebhookResult:
         """发送 Webhook 请求，支持重试
@@ -52,7 +66,7 @@ class HttpWebhookClient(WebhookClient):
         # 首次尝试 + 3 次重试 = 总共 4 次
         for attempt in range(len(self.RETRY_INTERVALS) + 1):
             try:
-                response = httpx.post(
+                response = self._client.post(
                     url,
                     json=payload,
                     timeout=self.TIMEOUT,
@@ -93,7 +107,7 @@ class HttpWebhookClient(WebhookClient):
             if attempt < len(self.RETRY_INTERVALS):
                 wait_time = self.RETRY_INTERVALS[attempt]
                 self._logger.debug(f"Waiting {wait_time}s before retry...")
-                time.sleep(wait_time)
+                self._sleep(wait_time)
 
         # 所有重试都失败
         total_attempts = len(self.RETRY_INTERVALS) + 1
@@ -94,6 +94,18 @@ class TestAsyncMailPollingServiceLifecycle:
 
         assert not polling_service.is_running
 
+    @pytest.mark.asyncio
+    async def test_stop_closes_imap_connections(
+        self, polling_service, mock_mailbox_repository, mock_imap_service
+    ):
+        """测试 stop 断开 IMAP 服务持有的连接"""
+        mock_mailbox_repository.list_all.return_value = []
+
+        await polling_service.start()
+        await polling_service.stop()
+
+        mock_imap_service.close.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_start_when_already_running_does_nothing(
         self, polling_service, mock_mailbox_repository
@@ -1,10 +1,30 @@
 """ExtractionResult 值对象单元测试"""
 
+from dataclasses import FrozenInstanceError
+
 import pytest
 from domain.ai.value_objects.extraction_result import ExtractionResult
 from domain.ai.value_objects.extraction_type import ExtractionType
 
 
+# ExtractionResult 是不可变值对象，只读测试共享同一实例即可
+@pytest.fixture(scope="module")
+def code_result() -> ExtractionResult:
+    """只读测试共享的验证码提取结果"""
+    return ExtractionResult(
+        type=ExtractionType.CODE,
+        code="123456",
+        confidence=0.95,
+        raw_response='{"found": true, "code": "123456"}',
+    )
+
+
+@pytest.fixture(scope="module")
+def unknown_result() -> ExtractionResult:
+    """只读测试共享的 UNKNOWN 提取结果"""
+    return ExtractionResult(type=ExtractionType.UNKNOWN)
+
+
 class TestExtractionType:
     """ExtractionType 枚举测试"""
 
@@ -35,18 +55,13 @@ class TestExtractionType:
 class TestExtractionResult:
     """ExtractionResult 值对象测试"""
 
-    def test_successful_code_extraction(self):
+    def test_successful_code_extraction(self, code_result: ExtractionResult):
         """测试成功提取验证码"""
-        result = ExtractionResult(
-            type=ExtractionType.CODE,
-            code="123456",
-            confidence=0.95,
-        )
-        assert result.is_successful
-        assert result.value == "123456"
-        assert result.code == "123456"
-        assert result.link is None
-        assert result.confidence == 0.95
+        assert code_result.is_successful
+        assert code_result.value == "123456"
+        assert code_result.code == "123456"
+        assert code_result.link is None
+        assert code_result.confidence == 0.95
 
     def test_successful_link_extraction(self):
         """测试成功提取验证链接"""
@@ -60,12 +75,11 @@ class TestExtractionResult:
         assert result.link == "https://example.com/verify?token=abc"
         assert result.code is None
 
-    def test_unknown_type_not_successful(self):
+    def test_unknown_type_not_successful(self, unknown_result: ExtractionResult):
         """测试 UNKNOWN 类型不算成功"""
-        result = ExtractionResult(type=ExtractionType.UNKNOWN)
-        assert not result.is_successful
-        assert result.value is None
-        assert result.confidence == 0.0
+        assert not unknown_result.is_successful
+        assert unknown_result.value is None
+        assert unknown_result.confidence == 0.0
 
     def test_code_type_without_code_not_successful(self):
         """测试 CODE 类型但无 code 值不算成功"""
@@ -76,46 +90,61 @@ class TestExtractionResult:
         )
         assert not result.is_successful
 
-    def test_value_property_prefers_code_over_link(self):
-        """测试 value 属性优先返回 code"""
-        result = ExtractionResult(
-            type=ExtractionType.CODE,
-            code="123456",
-            link="https://example.com",
-            confidence=0.9,
-        )
-        assert result.value == "123456"
-
-    def test_value_property_returns_link_when_no_code(self):
-        """测试无 code 时 value 返回 link"""
+    @pytest.mark.parametrize(
+        "code,link,backup_link,expected",
+        [
+            ("123456", None, None, "123456"),
+            (None, "https://example.com", None, "https://example.com"),
+            ("123456", "https://example.com", None, "123456"),
+            ("123456", None, "https://example.com/verify", "123456"),
+        ],
+        ids=[
+            "code_only",
+            "link_when_no_code",
+            "prefers_code_over_link",
+            "ignores_backup_link",
+        ],
+    )
+    def test_value_resolution(self, code, link, backup_link, expected):
+        """测试 value 属性：优先返回 code，其次 link，不受 backup_link 影响"""
         result = ExtractionResult(
-            type=ExtractionType.LINK,
-            code=None,
-            link="https://example.com",
+            type=ExtractionType.CODE if code else ExtractionType.LINK,
+            code=code,
+            link=link,
+            backup_link=backup_link,
             confidence=0.9,
         )
-        assert result.value == "https://example.com"
+        assert result.value == expected
 
-    def test_raw_response_storage(self):
+    def test_raw_response_storage(self, code_result: ExtractionResult):
         """测试存储原始 LLM 响应"""
-        raw = '{"found": true, "code": "123456"}'
-        result = ExtractionResult(
-            type=ExtractionType.CODE,
-            code="123456",
-            confidence=0.95,
-            raw_response=raw,
-        )
-        assert result.raw_response == raw
-
-    def test_immutability(self):
-        """测试值对象不可变性"""
-        result = ExtractionResult(
-            type=ExtractionType.CODE,
-            code="123456",
-            confidence=0.95,
-        )
-        with pytest.raises(AttributeError):
-            result.code = "654321"
+        assert code_result.raw_response == '{"found": true, "code": "123456"}'
+
+    @pytest.mark.parametrize(
+        "factory,attr,new_value",
+        [
+            (
+                lambda: ExtractionResult(type=ExtractionType.CODE, code="123456"),
+                "code",
+                "654321",
+            ),
+            (
+                lambda: ExtractionResult(
+                    type=ExtractionType.CODE,
+                    code="123456",
+                    backup_link="https://example.com/verify",
+                ),
+                "backup_link",
+                "https://other.com",
+            ),
+        ],
+        ids=["code", "backup_link"],
+    )
+    def test_immutability(self, factory, attr, new_value):
+        """测试值对象不可变性（含 backup_link 字段）"""
+        result = factory()
+        with pytest.raises(FrozenInstanceError, match=f"cannot assign to field '{attr}'"):
+            setattr(result, attr, new_value)
 
     def test_equality(self):
         """测试值对象相等性"""
@@ -131,13 +160,12 @@ class TestExtractionResult:
         )
         assert result1 == result2
 
-    def test_default_values(self):
+    def test_default_values(self, unknown_result: ExtractionResult):
         """测试默认值"""
-        result = ExtractionResult(type=ExtractionType.UNKNOWN)
-        assert result.code is None
-        assert result.link is None
-        assert result.confidence == 0.0
-        assert result.raw_response is None
+        assert unknown_result.code is None
+        assert unknown_result.link is None
+        assert unknown_result.confidence == 0.0
+        assert unknown_result.raw_response is None
 
 
 # ============ Story 3.3: backup_link 字段测试 ============
@@ -146,10 +174,9 @@ class TestExtractionResult:
 class TestExtractionResultBackupLink:
     """backup_link 字段测试（Story 3.3）"""
 
-    def test_backup_link_default_none(self):
+    def test_backup_link_default_none(self, code_result: ExtractionResult):
         """测试 backup_link 默认值为 None"""
-        result = ExtractionResult(type=ExtractionType.CODE, code="123456")
-        assert result.backup_link is None
+        assert code_result.backup_link is None
 
     def test_backup_link_with_code_type(self):
         """测试 CODE 类型带 backup_link"""
@@ -208,24 +235,3 @@ class TestExtractionResultBackupLink:
             confidence=0.9,
         )
         assert result1 != result2
-
-    def test_backup_link_immutability(self):
-        """测试 backup_link 不可变"""
-        result = ExtractionResult(
-            type=ExtractionType.CODE,
-            code="123456",
-            backup_link="https://example.com/verify",
-        )
-        with pytest.raises(AttributeError):
-            result.backup_link = "https://other.com"
-
-    def test_value_property_ignores_backup_link(self):
-        """测试 value 属性不受 backup_link 影响"""
-        result = ExtractionResult(
-            type=ExtractionType.CODE,
-            code="123456",
-            backup_link="https://example.com/verify",
-            confidence=0.9,
-        )
-        # value 应该返回 code，不是 backup_link
-        assert result.value == "123456"
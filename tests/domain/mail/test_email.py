@@ -1,5 +1,7 @@
 """Email 实体单元测试"""
 
+import itertools
+
 import pytest
 from datetime import datetime, timezone
 from uuid import uuid4, UUID
@@ -8,16 +10,27 @@ from domain.mail.entities.email import Email
 from domain.common.exceptions import InvalidOperationException
 
 
+# 预生成的 mailbox_id 池，测试中轮流取用，避免每个用例都调用 uuid4()
+_MAILBOX_IDS = [uuid4() for _ in range(4)]
+_mailbox_ids = itertools.cycle(_MAILBOX_IDS)
+
+# 仅用于往返相等性断言的固定 ID
+_CUSTOM_ID = UUID("00000000-0000-0000-0000-000000000001")
+
+# 测试不依赖"当前时间"，统一使用固定的接收时间
+_NOW = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+
 class TestEmailCreate:
     """Email.create() 工厂方法测试"""
 
     def test_create_email_with_required_fields(self):
         """测试使用必需字段创建邮件"""
-        mailbox_id = uuid4()
+        mailbox_id = next(_mailbox_ids)
         message_id = "<test123@example.com>"
         from_address = "sender@example.com"
         subject = "Test Email"
-        received_at = datetime.now(timezone.utc)
+        received_at = _NOW
 
         email = Email.create(
             mailbox_id=mailbox_id,
@@ -38,7 +51,7 @@ class TestEmailCreate:
 
     def test_create_email_with_text_body(self):
         """测试创建包含纯文本正文的邮件"""
-        mailbox_id = uuid4()
+        mailbox_id = next(_mailbox_ids)
         body_text = "This is plain text content"
 
         email = Email.create(
@@ -46,7 +59,7 @@ class TestEmailCreate:
             message_id="<test@example.com>",
             from_address="sender@example.com",
             subject="Test",
-            received_at=datetime.now(timezone.utc),
+            received_at=_NOW,
             body_text=body_text,
         )
 
@@ -56,7 +69,7 @@ class TestEmailCreate:
 
     def test_create_email_with_html_body(self):
         """测试创建包含 HTML 正文的邮件"""
-        mailbox_id = uuid4()
+        mailbox_id = next(_mailbox_ids)
         body_html = "<html><body><p>HTML content</p></body></html>"
 
         email = Email.create(
@@ -64,7 +77,7 @@ class TestEmailCreate:
             message_id="<test@example.com>",
             from_address="sender@example.com",
             subject="Test",
-            received_at=datetime.now(timezone.utc),
+            received_at=_NOW,
             body_html=body_html,
         )
 
@@ -74,7 +87,7 @@ class TestEmailCreate:
 
     def test_create_email_with_both_bodies(self):
         """测试创建同时包含纯文本和 HTML 正文的邮件"""
-        mailbox_id = uuid4()
+        mailbox_id = next(_mailbox_ids)
         body_text = "Plain text"
         body_html = "<p>HTML</p>"
 
@@ -83,7 +96,7 @@ class TestEmailCreate:
             message_id="<test@example.com>",
             from_address="sender@example.com",
             subject="Test",
-            received_at=datetime.now(timezone.utc),
+            received_at=_NOW,
             body_text=body_text,
             body_html=body_html,
         )
@@ -95,15 +108,15 @@ class TestEmailCreate:
 
     def test_create_email_with_custom_id(self):
         """测试使用自定义 ID 创建邮件"""
-        custom_id = uuid4()
-        mailbox_id = uuid4()
+        custom_id = _CUSTOM_ID
+        mailbox_id = next(_mailbox_ids)
 
         email = Email.create(
             mailbox_id=mailbox_id,
             message_id="<test@example.com>",
             from_address="sender@example.com",
             subject="Test",
-            received_at=datetime.now(timezone.utc),
+            received_at=_NOW,
             id=custom_id,
         )
 
@@ -115,30 +128,26 @@ class TestEmailValidation:
 
     def test_create_email_without_mailbox_id_raises_exception(self):
         """测试缺少 mailbox_id 时抛出异常"""
-        with pytest.raises(InvalidOperationException) as exc_info:
+        with pytest.raises(InvalidOperationException, match="Mailbox ID cannot be None"):
             Email.create(
                 mailbox_id=None,  # type: ignore
                 message_id="<test@example.com>",
                 from_address="sender@example.com",
                 subject="Test",
-                received_at=datetime.now(timezone.utc),
+                received_at=_NOW,
             )
 
-        assert "Mailbox ID cannot be None" in str(exc_info.value)
-
     def test_create_email_without_message_id_raises_exception(self):
         """测试缺少 message_id 时抛出异常"""
-        with pytest.raises(InvalidOperationException) as exc_info:
+        with pytest.raises(InvalidOperationException, match="Message ID cannot be empty"):
             Email.create(
-                mailbox_id=uuid4(),
+                mailbox_id=next(_mailbox_ids),
                 message_id="",
                 from_address="sender@example.com",
                 subject="Test",
-                received_at=datetime.now(timezone.utc),
+                received_at=_NOW,
             )
 
-        assert "Message ID cannot be empty" in str(exc_info.value)
-
 
 class TestEmailMarkAsProcessed:
     """Email.mark_as_processed() 测试"""
@@ -146,11 +155,11 @@ class TestEmailMarkAsProcessed:
     def test_mark_as_processed_success(self):
         """测试成功标记邮件为已处理"""
         email = Email.create(
-            mailbox_id=uuid4(),
+            mailbox_id=next(_mailbox_ids),
             message_id="<test@example.com>",
             from_address="sender@example.com",
             subject="Test",
-            received_at=datetime.now(timezone.utc),
+            received_at=_NOW,
         )
 
         assert email.is_processed is False
@@ -163,20 +172,18 @@ class TestEmailMarkAsProcessed:
     def test_mark_as_processed_twice_raises_exception(self):
         """测试重复标记已处理抛出异常"""
         email = Email.create(
-            mailbox_id=uuid4(),
+            mailbox_id=next(_mailbox_ids),
             message_id="<test@example.com>",
             from_address="sender@example.com",
             subject="Test",
-            received_at=datetime.now(timezone.utc),
+            received_at=_NOW,
         )
 
         email.mark_as_processed()
 
-        with pytest.raises(InvalidOperationException) as exc_info:
+        with pytest.raises(InvalidOperationException, match="already been processed"):
             email.mark_as_processed()
 
-        assert "already been processed" in str(exc_info.value)
-
 
 class TestEmailBody:
     """Email.body 属性测试"""
@@ -184,11 +191,11 @@ class TestEmailBody:
     def test_body_returns_text_when_available(self):
         """测试优先返回纯文本正文"""
         email = Email.create(
-            mailbox_id=uuid4(),
+            mailbox_id=next(_mailbox_ids),
             message_id="<test@example.com>",
             from_address="sender@example.com",
             subject="Test",
-            received_at=datetime.now(timezone.utc),
+            received_at=_NOW,
             body_text="Plain text",
             body_html="<p>HTML</p>",
         )
@@ -198,11 +205,11 @@ class TestEmailBody:
     def test_body_returns_html_when_no_text(self):
         """测试没有纯文本时返回 HTML"""
         email = Email.create(
-            mailbox_id=uuid4(),
+            mailbox_id=next(_mailbox_ids),
             message_id="<test@example.com>",
             from_address="sender@example.com",
             subject="Test",
-            received_at=datetime.now(timezone.utc),
+            received_at=_NOW,
             body_html="<p>HTML only</p>",
         )
 
@@ -211,11 +218,11 @@ class TestEmailBody:
     def test_body_returns_empty_when_no_content(self):
         """测试没有内容时返回空字符串"""
         email = Email.create(
-            mailbox_id=uuid4(),
+            mailbox_id=next(_mailbox_ids),
             message_id="<test@example.com>",
             from_address="sender@example.com",
             subject="Test",
-            received_at=datetime.now(timezone.utc),
+            received_at=_NOW,
         )
 
         assert email.body == ""
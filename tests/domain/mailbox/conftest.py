@@ -0,0 +1,32 @@
+"""邮箱领域测试共享 fixture"""
+
+from functools import lru_cache
+
+import pytest
+from cryptography.fernet import Fernet
+
+from domain.mailbox.value_objects import encrypted_password
+from domain.mailbox.value_objects.imap_config import ImapConfig
+
+
+@pytest.fixture(scope="package", autouse=True)
+def cached_fernet():
+    """测试期间按密钥缓存 Fernet 实例，避免每次加解密都重新拆分密钥
+
+    只在测试会话内生效，生产代码不缓存密钥。
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(encrypted_password, "Fernet", lru_cache(maxsize=None)(Fernet))
+        yield
+
+
+@pytest.fixture(scope="session")
+def encryption_key() -> bytes:
+    """生成测试用加密密钥（整个测试会话只生成一次）"""
+    return Fernet.generate_key()
+
+
+@pytest.fixture(scope="module")
+def imap_config() -> ImapConfig:
+    """创建测试用 IMAP 配置（值对象不可变，模块内共享）"""
+    return ImapConfig(server="imap.example.com", port=993, use_ssl=True)
@@ -1,20 +1,25 @@
 """Tests for EncryptedPassword value object"""
 
 import pytest
-from cryptography.fernet import Fernet
 
 from domain.mailbox.value_objects.encrypted_password import EncryptedPassword
 from domain.common.exceptions import InvalidValueObjectException
 
 
+# 任意合法且与 fixture 密钥不同的 Fernet 密钥（32 字节 url-safe base64）
+_WRONG_KEY = b"d3Jvbmcta2V5LWZvci1kZWNyeXB0LXRlc3RzLTAwMDA="
+
+
+# EncryptedPassword 不可变，只读测试可直接共享同一实例
+@pytest.fixture(scope="module")
+def enc_password(encryption_key: bytes) -> EncryptedPassword:
+    """只读测试共享的加密密码，避免重复执行加密"""
+    return EncryptedPassword.from_plain("my_secret_password", encryption_key)
+
+
 class TestEncryptedPassword:
     """EncryptedPassword 值对象测试"""
 
-    @pytest.fixture
-    def encryption_key(self) -> bytes:
-        """生成测试用加密密钥"""
-        return Fernet.generate_key()
-
     def test_create_from_plain_password(self, encryption_key: bytes):
         """测试从明文密码创建"""
         password = EncryptedPassword.from_plain("my_secret_password", encryption_key)
@@ -24,14 +29,13 @@ class TestEncryptedPassword:
         # 加密后的值应该与原始密码不同
         assert password.encrypted_value != b"my_secret_password"
 
-    def test_decrypt_password(self, encryption_key: bytes):
+    def test_decrypt_password(
+        self, enc_password: EncryptedPassword, encryption_key: bytes
+    ):
         """测试解密密码"""
-        original_password = "my_secret_password"
-        password = EncryptedPassword.from_plain(original_password, encryption_key)
-
-        decrypted = password.decrypt(encryption_key)
+        decrypted = enc_password.decrypt(encryption_key)
 
-        assert decrypted == original_password
+        assert decrypted == "my_secret_password"
 
     def test_create_with_string_key(self, encryption_key: bytes):
         """测试使用字符串密钥创建"""
@@ -44,35 +48,26 @@ class TestEncryptedPassword:
 
     def test_create_with_empty_password_raises_error(self, encryption_key: bytes):
         """测试空密码抛出异常"""
-        with pytest.raises(InvalidValueObjectException) as exc_info:
+        with pytest.raises(InvalidValueObjectException, match="Password cannot be empty"):
             EncryptedPassword.from_plain("", encryption_key)
 
-        assert "Password cannot be empty" in str(exc_info.value.message)
-
-    def test_decrypt_with_wrong_key_raises_error(self, encryption_key: bytes):
+    def test_decrypt_with_wrong_key_raises_error(
+        self, enc_password: EncryptedPassword
+    ):
         """测试使用错误密钥解密抛出异常"""
-        password = EncryptedPassword.from_plain("my_secret_password", encryption_key)
-        wrong_key = Fernet.generate_key()
-
-        with pytest.raises(InvalidValueObjectException) as exc_info:
-            password.decrypt(wrong_key)
-
-        assert "Failed to decrypt password" in str(exc_info.value.message)
+        with pytest.raises(InvalidValueObjectException, match="Failed to decrypt password"):
+            enc_password.decrypt(_WRONG_KEY)
 
-    def test_repr_does_not_expose_value(self, encryption_key: bytes):
+    def test_repr_does_not_expose_value(self, enc_password: EncryptedPassword):
         """测试 repr 不暴露加密值"""
-        password = EncryptedPassword.from_plain("my_secret_password", encryption_key)
-
-        repr_str = repr(password)
+        repr_str = repr(enc_password)
 
         assert "my_secret_password" not in repr_str
         assert "[ENCRYPTED]" in repr_str
 
-    def test_str_does_not_expose_value(self, encryption_key: bytes):
+    def test_str_does_not_expose_value(self, enc_password: EncryptedPassword):
         """测试 str 不暴露加密值"""
-        password = EncryptedPassword.from_plain("my_secret_password", encryption_key)
-
-        str_val = str(password)
+        str_val = str(enc_password)
 
         assert "my_secret_password" not in str_val
         assert "[ENCRYPTED]" in str_val
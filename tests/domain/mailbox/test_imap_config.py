@@ -1,5 +1,7 @@
 """Tests for ImapConfig value object"""
 
+from dataclasses import FrozenInstanceError
+
 import pytest
 
 from domain.mailbox.value_objects.imap_config import ImapConfig
@@ -27,57 +29,54 @@ class TestImapConfig:
 
     def test_create_with_empty_server_raises_error(self):
         """测试空服务器地址抛出异常"""
-        with pytest.raises(InvalidValueObjectException) as exc_info:
+        with pytest.raises(InvalidValueObjectException, match="IMAP server cannot be empty"):
             ImapConfig(server="")
 
-        assert "IMAP server cannot be empty" in str(exc_info.value.message)
-
     def test_create_with_whitespace_server_raises_error(self):
         """测试空白服务器地址抛出异常"""
-        with pytest.raises(InvalidValueObjectException) as exc_info:
+        with pytest.raises(InvalidValueObjectException, match="IMAP server cannot be empty"):
             ImapConfig(server="   ")
 
-        assert "IMAP server cannot be empty" in str(exc_info.value.message)
-
     def test_create_with_invalid_port_zero_raises_error(self):
         """测试端口为0抛出异常"""
-        with pytest.raises(InvalidValueObjectException) as exc_info:
+        with pytest.raises(InvalidValueObjectException, match="Invalid port number"):
             ImapConfig(server="imap.example.com", port=0)
 
-        assert "Invalid port number" in str(exc_info.value.message)
-
     def test_create_with_invalid_port_negative_raises_error(self):
         """测试负数端口抛出异常"""
-        with pytest.raises(InvalidValueObjectException) as exc_info:
+        with pytest.raises(InvalidValueObjectException, match="Invalid port number"):
             ImapConfig(server="imap.example.com", port=-1)
 
-        assert "Invalid port number" in str(exc_info.value.message)
-
     def test_create_with_invalid_port_too_large_raises_error(self):
         """测试端口超出范围抛出异常"""
-        with pytest.raises(InvalidValueObjectException) as exc_info:
+        with pytest.raises(InvalidValueObjectException, match="Invalid port number"):
             ImapConfig(server="imap.example.com", port=65536)
 
-        assert "Invalid port number" in str(exc_info.value.message)
-
-    def test_connection_string_with_ssl(self):
-        """测试 SSL 连接字符串"""
-        config = ImapConfig(server="imap.example.com", port=993, use_ssl=True)
-
-        assert config.connection_string == "imaps://imap.example.com:993"
-
-    def test_connection_string_without_ssl(self):
-        """测试非 SSL 连接字符串"""
-        config = ImapConfig(server="imap.example.com", port=143, use_ssl=False)
-
-        assert config.connection_string == "imap://imap.example.com:143"
-
-    def test_immutability(self):
+    @pytest.mark.parametrize(
+        "port,use_ssl,expected",
+        [
+            (993, True, "imaps://imap.example.com:993"),
+            (143, False, "imap://imap.example.com:143"),
+            (2525, False, "imap://imap.example.com:2525"),
+        ],
+        ids=["ssl", "plain", "custom_port"],
+    )
+    def test_connection_string(self, port, use_ssl, expected):
+        """测试连接字符串格式（SSL/非 SSL）"""
+        config = ImapConfig(server="imap.example.com", port=port, use_ssl=use_ssl)
+
+        assert config.connection_string == expected
+
+    @pytest.mark.parametrize(
+        "attr,new_value",
+        [("server", "other.example.com"), ("port", 143), ("use_ssl", False)],
+    )
+    def test_immutability(self, attr, new_value):
         """测试值对象不可变性"""
         config = ImapConfig(server="imap.example.com")
 
-        with pytest.raises(Exception):  # FrozenInstanceError
-            config.server = "other.example.com"
+        with pytest.raises(FrozenInstanceError, match=f"cannot assign to field '{attr}'"):
+            setattr(config, attr, new_value)
 
     def test_equality(self):
         """测试值对象相等性"""
@@ -1,8 +1,8 @@
 """Tests for MailboxAccount aggregate root"""
 
 import pytest
+from dataclasses import replace
 from uuid import UUID
-from cryptography.fernet import Fernet
 
 from domain.mailbox.entities.mailbox_account import MailboxAccount
 from domain.mailbox.value_objects.mailbox_enums import MailboxType, MailboxStatus
@@ -13,18 +13,20 @@ from domain.common.exceptions import (
 )
 
 
-class TestMailboxAccountCreation:
-    """MailboxAccount 创建测试"""
+@pytest.fixture(scope="module")
+def template_mailbox(encryption_key: bytes, imap_config: ImapConfig) -> MailboxAccount:
+    """可用状态的邮箱模板（整个模块只加密一次密码），使用时需复制"""
+    return MailboxAccount.create_domain_catchall(
+        username="admin@example.com",
+        domain="example.com",
+        imap_config=imap_config,
+        password="secret123",
+        encryption_key=encryption_key,
+    )
 
-    @pytest.fixture
-    def encryption_key(self) -> bytes:
-        """生成测试用加密密钥"""
-        return Fernet.generate_key()
 
-    @pytest.fixture
-    def imap_config(self) -> ImapConfig:
-        """创建测试用 IMAP 配置"""
-        return ImapConfig(server="imap.example.com", port=993, use_ssl=True)
+class TestMailboxAccountCreation:
+    """MailboxAccount 创建测试"""
 
     def test_create_domain_catchall_mailbox(
         self, encryption_key: bytes, imap_config: ImapConfig
@@ -111,20 +113,13 @@ class TestMailboxAccountStatus:
     """MailboxAccount 状态管理测试"""
 
     @pytest.fixture
-    def encryption_key(self) -> bytes:
-        """生成测试用加密密钥"""
-        return Fernet.generate_key()
+    def available_mailbox(self, template_mailbox: MailboxAccount) -> MailboxAccount:
+        """创建可用状态的邮箱
 
-    @pytest.fixture
-    def available_mailbox(self, encryption_key: bytes) -> MailboxAccount:
-        """创建可用状态的邮箱"""
-        return MailboxAccount.create_domain_catchall(
-            username="admin@example.com",
-            domain="example.com",
-            imap_config=ImapConfig(server="imap.example.com"),
-            password="secret123",
-            encryption_key=encryption_key,
-        )
+        状态测试只修改 status/occupied_by_service，浅拷贝模板即可，
+        imap_config 和 encrypted_password 是不可变值对象，可以共享。
+        """
+        return replace(template_mailbox)
 
     def test_occupy_available_mailbox(self, available_mailbox: MailboxAccount):
         """测试占用可用邮箱"""
@@ -169,17 +164,14 @@ class TestMailboxAccountStatus:
 class TestMailboxAccountPassword:
     """MailboxAccount 密码管理测试"""
 
-    @pytest.fixture
-    def encryption_key(self) -> bytes:
-        """生成测试用加密密钥"""
-        return Fernet.generate_key()
-
-    def test_get_decrypted_password(self, encryption_key: bytes):
+    def test_get_decrypted_password(
+        self, encryption_key: bytes, imap_config: ImapConfig
+    ):
         """测试获取解密后的密码"""
         mailbox = MailboxAccount.create_domain_catchall(
             username="admin@example.com",
             domain="example.com",
-            imap_config=ImapConfig(server="imap.example.com"),
+            imap_config=imap_config,
             password="secret123",
             encryption_key=encryption_key,
         )
@@ -189,13 +181,13 @@ class TestMailboxAccountPassword:
         assert decrypted == "secret123"
 
     def test_get_password_without_password_set_raises_error(
-        self, encryption_key: bytes
+        self, encryption_key: bytes, imap_config: ImapConfig
     ):
         """测试没有设置密码时获取密码抛出异常"""
         mailbox = MailboxAccount(
             username="admin@example.com",
             mailbox_type=MailboxType.HOTMAIL,
-            imap_config=ImapConfig(server="imap.example.com"),
+            imap_config=imap_config,
             encrypted_password=None,
         )
 
@@ -206,50 +198,44 @@ class TestMailboxAccountPassword:
 
 
 class TestMailboxAccountEquality:
-    """MailboxAccount 相等性测试"""
+    """MailboxAccount 相等性测试
 
-    @pytest.fixture
-    def encryption_key(self) -> bytes:
-        """生成测试用加密密钥"""
-        return Fernet.generate_key()
+    相等性只比较 ID，直接构造实体，不经过工厂方法的密码加密。
+    """
 
-    def test_same_id_are_equal(self, encryption_key: bytes):
+    def test_same_id_are_equal(self, imap_config: ImapConfig):
         """测试相同 ID 的邮箱相等"""
         custom_id = UUID("12345678-1234-5678-1234-567812345678")
-        mailbox1 = MailboxAccount.create_domain_catchall(
+        mailbox1 = MailboxAccount(
+            id=custom_id,
             username="admin@example.com",
+            mailbox_type=MailboxType.DOMAIN_CATCHALL,
+            imap_config=imap_config,
             domain="example.com",
-            imap_config=ImapConfig(server="imap.example.com"),
-            password="secret123",
-            encryption_key=encryption_key,
-            id=custom_id,
         )
-        mailbox2 = MailboxAccount.create_domain_catchall(
+        mailbox2 = MailboxAccount(
+            id=custom_id,  # 相同 ID
             username="other@example.com",  # 不同用户名
-            domain="other.com",  # 不同域名
+            mailbox_type=MailboxType.DOMAIN_CATCHALL,
             imap_config=ImapConfig(server="imap.other.com"),
-            password="other_password",
-            encryption_key=encryption_key,
-            id=custom_id,  # 相同 ID
+            domain="other.com",  # 不同域名
         )
 
         assert mailbox1 == mailbox2
 
-    def test_different_id_are_not_equal(self, encryption_key: bytes):
+    def test_different_id_are_not_equal(self, imap_config: ImapConfig):
         """测试不同 ID 的邮箱不相等"""
-        mailbox1 = MailboxAccount.create_domain_catchall(
+        mailbox1 = MailboxAccount(
             username="admin@example.com",
+            mailbox_type=MailboxType.DOMAIN_CATCHALL,
+            imap_config=imap_config,
             domain="example.com",
-            imap_config=ImapConfig(server="imap.example.com"),
-            password="secret123",
-            encryption_key=encryption_key,
         )
-        mailbox2 = MailboxAccount.create_domain_catchall(
+        mailbox2 = MailboxAccount(
             username="admin@example.com",  # 相同用户名
+            mailbox_type=MailboxType.DOMAIN_CATCHALL,
+            imap_config=imap_config,
             domain="example.com",  # 相同域名
-            imap_config=ImapConfig(server="imap.example.com"),
-            password="secret123",
-            encryption_key=encryption_key,
         )
 
         assert mailbox1 != mailbox2  # 因为 ID 不同
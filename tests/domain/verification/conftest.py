@@ -0,0 +1,24 @@
+"""验证领域测试共享 fixture"""
+
+from uuid import UUID
+
+import pytest
+
+from domain.verification.entities.wait_request import WaitRequest
+
+
+@pytest.fixture(scope="session")
+def mailbox_id() -> UUID:
+    """固定的邮箱 ID（测试不关心其唯一性）"""
+    return UUID(int=0x1234)
+
+
+@pytest.fixture
+def pending_request(mailbox_id: UUID) -> WaitRequest:
+    """创建一个 PENDING 状态的等待请求（实体可变，每个测试一个新实例）"""
+    return WaitRequest.create(
+        mailbox_id=mailbox_id,
+        email="test@example.com",
+        service_name="claude",
+        callback_url="https://example.com/callback",
+    )
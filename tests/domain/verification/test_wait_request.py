@@ -1,7 +1,7 @@
 """WaitRequest 实体测试"""
 
 import pytest
-from uuid import uuid4
+from uuid import UUID
 from datetime import datetime, timezone
 
 from domain.common.exceptions import InvalidStateTransitionException
@@ -12,9 +12,8 @@ from domain.verification.value_objects.wait_request_status import WaitRequestSta
 class TestWaitRequestCreate:
     """WaitRequest.create() 工厂方法测试"""
 
-    def test_create_with_valid_params(self):
+    def test_create_with_valid_params(self, mailbox_id: UUID):
         """测试使用有效参数创建等待请求"""
-        mailbox_id = uuid4()
         email = "test@example.com"
         service_name = "claude"
         callback_url = "https://api.example.com/callback"
@@ -35,9 +34,8 @@ class TestWaitRequestCreate:
         assert request.extraction_result is None
         assert request.id is not None
 
-    def test_create_generates_unique_id(self):
+    def test_create_generates_unique_id(self, mailbox_id: UUID):
         """测试每次创建生成唯一 ID"""
-        mailbox_id = uuid4()
         request1 = WaitRequest.create(
             mailbox_id=mailbox_id,
             email="test1@example.com",
@@ -57,16 +55,6 @@ class TestWaitRequestCreate:
 class TestWaitRequestComplete:
     """WaitRequest.complete() 状态转换测试"""
 
-    @pytest.fixture
-    def pending_request(self):
-        """创建一个 PENDING 状态的等待请求"""
-        return WaitRequest.create(
-            mailbox_id=uuid4(),
-            email="test@example.com",
-            service_name="claude",
-            callback_url="https://example.com/callback",
-        )
-
     def test_complete_from_pending(self, pending_request):
         """测试从 PENDING 状态完成请求"""
         extraction_result = "123456"
@@ -77,41 +65,10 @@ class TestWaitRequestComplete:
         assert pending_request.completed_at is not None
         assert pending_request.is_completed
 
-    def test_complete_from_completed_raises_exception(self, pending_request):
-        """测试从 COMPLETED 状态完成请求抛出异常"""
-        pending_request.complete("123456")
-
-        with pytest.raises(InvalidStateTransitionException):
-            pending_request.complete("654321")
-
-    def test_complete_from_cancelled_raises_exception(self, pending_request):
-        """测试从 CANCELLED 状态完成请求抛出异常"""
-        pending_request.cancel()
-
-        with pytest.raises(InvalidStateTransitionException):
-            pending_request.complete("123456")
-
-    def test_complete_from_failed_raises_exception(self, pending_request):
-        """测试从 FAILED 状态完成请求抛出异常"""
-        pending_request.fail()
-
-        with pytest.raises(InvalidStateTransitionException):
-            pending_request.complete("123456")
-
 
 class TestWaitRequestCancel:
     """WaitRequest.cancel() 状态转换测试"""
 
-    @pytest.fixture
-    def pending_request(self):
-        """创建一个 PENDING 状态的等待请求"""
-        return WaitRequest.create(
-            mailbox_id=uuid4(),
-            email="test@example.com",
-            service_name="claude",
-            callback_url="https://example.com/callback",
-        )
-
     def test_cancel_from_pending(self, pending_request):
         """测试从 PENDING 状态取消请求"""
         pending_request.cancel()
@@ -119,41 +76,10 @@ class TestWaitRequestCancel:
         assert pending_request.status == WaitRequestStatus.CANCELLED
         assert pending_request.is_cancelled
 
-    def test_cancel_from_completed_raises_exception(self, pending_request):
-        """测试从 COMPLETED 状态取消请求抛出异常"""
-        pending_request.complete("123456")
-
-        with pytest.raises(InvalidStateTransitionException):
-            pending_request.cancel()
-
-    def test_cancel_from_cancelled_raises_exception(self, pending_request):
-        """测试从 CANCELLED 状态再次取消抛出异常"""
-        pending_request.cancel()
-
-        with pytest.raises(InvalidStateTransitionException):
-            pending_request.cancel()
-
-    def test_cancel_from_failed_raises_exception(self, pending_request):
-        """测试从 FAILED 状态取消抛出异常"""
-        pending_request.fail()
-
-        with pytest.raises(InvalidStateTransitionException):
-            pending_request.cancel()
-
 
 class TestWaitRequestFail:
     """WaitRequest.fail() 状态转换测试"""
 
-    @pytest.fixture
-    def pending_request(self):
-        """创建一个 PENDING 状态的等待请求"""
-        return WaitRequest.create(
-            mailbox_id=uuid4(),
-            email="test@example.com",
-            service_name="claude",
-            callback_url="https://example.com/callback",
-        )
-
     def test_fail_from_pending(self, pending_request):
         """测试从 PENDING 状态标记失败"""
         pending_request.fail()
@@ -171,41 +97,32 @@ class TestWaitRequestFail:
         assert pending_request.is_failed
         assert pending_request.failure_reason == failure_reason
 
-    def test_fail_from_completed_raises_exception(self, pending_request):
-        """测试从 COMPLETED 状态标记失败抛出异常"""
-        pending_request.complete("123456")
 
-        with pytest.raises(InvalidStateTransitionException):
-            pending_request.fail()
+class TestWaitRequestInvalidTransition:
+    """WaitRequest 非法状态转换测试"""
 
-    def test_fail_from_cancelled_raises_exception(self, pending_request):
-        """测试从 CANCELLED 状态标记失败抛出异常"""
-        pending_request.cancel()
+    # 各状态转换方法调用时使用的参数
+    _ACTION_ARGS = {
+        "complete": ("123456",),
+        "cancel": (),
+        "fail": (),
+    }
 
-        with pytest.raises(InvalidStateTransitionException):
-            pending_request.fail()
-
-    def test_fail_from_failed_raises_exception(self, pending_request):
-        """测试从 FAILED 状态再次标记失败抛出异常"""
-        pending_request.fail()
+    @pytest.mark.parametrize("pre", ["complete", "cancel", "fail"])
+    @pytest.mark.parametrize("action", ["complete", "cancel", "fail"])
+    def test_transition_from_terminal_state_raises_exception(
+        self, pending_request, pre, action
+    ):
+        """测试从终态（COMPLETED/CANCELLED/FAILED）再次转换抛出异常"""
+        getattr(pending_request, pre)(*self._ACTION_ARGS[pre])
 
         with pytest.raises(InvalidStateTransitionException):
-            pending_request.fail()
+            getattr(pending_request, action)(*self._ACTION_ARGS[action])
 
 
 class TestWaitRequestProperties:
     """WaitRequest 属性测试"""
 
-    @pytest.fixture
-    def pending_request(self):
-        """创建一个 PENDING 状态的等待请求"""
-        return WaitRequest.create(
-            mailbox_id=uuid4(),
-            email="test@example.com",
-            service_name="claude",
-            callback_url="https://example.com/callback",
-        )
-
     def test_is_pending_true(self, pending_request):
         """测试 PENDING 状态 is_pending 为 True"""
         assert pending_request.is_pending is True
@@ -1,73 +1,67 @@
 """Tests for WebhookPayload value object"""
 
 import pytest
+from dataclasses import FrozenInstanceError
 from datetime import datetime
 from uuid import UUID
 
 from domain.verification.value_objects.webhook_payload import WebhookPayload
 
 
-class TestWebhookPayloadCreation:
-    """WebhookPayload 创建测试"""
+_REQ_ID = UUID("12345678-1234-5678-1234-567812345678")
+_TS = datetime(2024, 1, 15, 10, 30, 0)
 
-    def test_create_webhook_payload(self):
-        """测试创建 WebhookPayload"""
-        request_id = UUID("12345678-1234-5678-1234-567812345678")
-        received_at = datetime(2024, 1, 15, 10, 30, 0)
 
-        payload = WebhookPayload(
-            request_id=request_id,
-            type="code",
-            value="123456",
-            email="test@example.com",
-            service="claude",
-            received_at=received_at,
-        )
+# WebhookPayload 是 frozen dataclass，模块内共享无需复制
+@pytest.fixture(scope="module")
+def sample_payload() -> WebhookPayload:
+    """只读测试共享的 code 类型载荷"""
+    return WebhookPayload(
+        request_id=_REQ_ID,
+        type="code",
+        value="123456",
+        email="test@example.com",
+        service="claude",
+        received_at=_TS,
+    )
 
-        assert payload.request_id == request_id
-        assert payload.type == "code"
-        assert payload.value == "123456"
-        assert payload.email == "test@example.com"
-        assert payload.service == "claude"
-        assert payload.received_at == received_at
 
-    def test_create_link_type_payload(self):
-        """测试创建 link 类型的 WebhookPayload"""
-        request_id = UUID("12345678-1234-5678-1234-567812345678")
-        received_at = datetime(2024, 1, 15, 10, 30, 0)
+class TestWebhookPayloadCreation:
+    """WebhookPayload 创建测试"""
 
+    @pytest.mark.parametrize(
+        "payload_type,value,service",
+        [
+            ("code", "123456", "claude"),
+            ("link", "https://example.com/verify?token=abc123", "github"),
+        ],
+        ids=["code", "link"],
+    )
+    def test_create_webhook_payload(self, payload_type, value, service):
+        """测试创建 code/link 类型的 WebhookPayload"""
         payload = WebhookPayload(
-            request_id=request_id,
-            type="link",
-            value="https://example.com/verify?token=abc123",
+            request_id=_REQ_ID,
+            type=payload_type,
+            value=value,
             email="test@example.com",
-            service="github",
-            received_at=received_at,
+            service=service,
+            received_at=_TS,
         )
 
-        assert payload.type == "link"
-        assert payload.value == "https://example.com/verify?token=abc123"
-        assert payload.service == "github"
+        assert payload.request_id == _REQ_ID
+        assert payload.type == payload_type
+        assert payload.value == value
+        assert payload.email == "test@example.com"
+        assert payload.service == service
+        assert payload.received_at == _TS
 
 
 class TestWebhookPayloadToDict:
     """WebhookPayload to_dict() 测试"""
 
-    def test_to_dict_returns_correct_structure(self):
+    def test_to_dict_returns_correct_structure(self, sample_payload: WebhookPayload):
         """测试 to_dict() 返回正确的字典结构"""
-        request_id = UUID("12345678-1234-5678-1234-567812345678")
-        received_at = datetime(2024, 1, 15, 10, 30, 0)
-
-        payload = WebhookPayload(
-            request_id=request_id,
-            type="code",
-            value="123456",
-            email="test@example.com",
-            service="claude",
-            received_at=received_at,
-        )
-
-        result = payload.to_dict()
+        result = sample_payload.to_dict()
 
         assert result["request_id"] == "12345678-1234-5678-1234-567812345678"
         assert result["type"] == "code"
@@ -78,11 +72,10 @@ class TestWebhookPayloadToDict:
 
     def test_to_dict_with_microseconds(self):
         """测试带微秒的时间戳转换"""
-        request_id = UUID("12345678-1234-5678-1234-567812345678")
         received_at = datetime(2024, 1, 15, 10, 30, 0, 123456)
 
         payload = WebhookPayload(
-            request_id=request_id,
+            request_id=_REQ_ID,
             type="code",
             value="123456",
             email="test@example.com",
@@ -98,68 +91,37 @@ class TestWebhookPayloadToDict:
 class TestWebhookPayloadImmutability:
     """WebhookPayload 不可变性测试"""
 
-    def test_payload_is_frozen(self):
+    def test_payload_is_frozen(self, sample_payload: WebhookPayload):
         """测试 WebhookPayload 是不可变的"""
-        payload = WebhookPayload(
-            request_id=UUID("12345678-1234-5678-1234-567812345678"),
-            type="code",
-            value="123456",
-            email="test@example.com",
-            service="claude",
-            received_at=datetime(2024, 1, 15, 10, 30, 0),
-        )
-
-        with pytest.raises(Exception):  # FrozenInstanceError
-            payload.value = "654321"
+        with pytest.raises(FrozenInstanceError, match="cannot assign to field 'value'"):
+            sample_payload.value = "654321"
 
 
 class TestWebhookPayloadEquality:
     """WebhookPayload 相等性测试"""
 
-    def test_same_values_are_equal(self):
+    def test_same_values_are_equal(self, sample_payload: WebhookPayload):
         """测试相同值的 WebhookPayload 相等"""
-        request_id = UUID("12345678-1234-5678-1234-567812345678")
-        received_at = datetime(2024, 1, 15, 10, 30, 0)
-
-        payload1 = WebhookPayload(
-            request_id=request_id,
-            type="code",
-            value="123456",
-            email="test@example.com",
-            service="claude",
-            received_at=received_at,
-        )
-        payload2 = WebhookPayload(
-            request_id=request_id,
+        payload = WebhookPayload(
+            request_id=_REQ_ID,
             type="code",
             value="123456",
             email="test@example.com",
             service="claude",
-            received_at=received_at,
+            received_at=_TS,
         )
 
-        assert payload1 == payload2
+        assert sample_payload == payload
 
-    def test_different_values_are_not_equal(self):
+    def test_different_values_are_not_equal(self, sample_payload: WebhookPayload):
         """测试不同值的 WebhookPayload 不相等"""
-        request_id = UUID("12345678-1234-5678-1234-567812345678")
-        received_at = datetime(2024, 1, 15, 10, 30, 0)
-
-        payload1 = WebhookPayload(
-            request_id=request_id,
-            type="code",
-            value="123456",
-            email="test@example.com",
-            service="claude",
-            received_at=received_at,
-        )
-        payload2 = WebhookPayload(
-            request_id=request_id,
+        payload = WebhookPayload(
+            request_id=_REQ_ID,
             type="code",
             value="654321",  # 不同的值
             email="test@example.com",
             service="claude",
-            received_at=received_at,
+            received_at=_TS,
         )
 
-        assert payload1 != payload2
+        assert sample_payload != payload
@@ -0,0 +1,41 @@
+"""AI 基础设施测试共享 fixture"""
+
+import copy
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from infrastructure.ai import llm_verification_extractor
+from infrastructure.ai.llm_verification_extractor import LlmVerificationExtractor
+
+
+@pytest.fixture(scope="package", autouse=True)
+def chat_openai():
+    """整个测试包只 patch 一次 ChatOpenAI，避免每个测试重复进入 patch 上下文
+
+    使用 package 作用域，离开本目录后即恢复，不影响其他测试。
+    """
+    with patch.object(llm_verification_extractor, "ChatOpenAI") as mock_cls:
+        yield mock_cls
+
+
+@pytest.fixture(scope="package")
+def extractor(chat_openai):
+    """解析/Prompt 测试共享的提取器（无状态，整个测试包只构造一次）"""
+    return LlmVerificationExtractor(api_key="test-key")
+
+
+@pytest.fixture
+def mock_llm():
+    """每个测试独立的 LLM mock"""
+    mock = MagicMock()
+    mock.ainvoke = AsyncMock()
+    return mock
+
+
+@pytest.fixture
+def llm_extractor(extractor, mock_llm):
+    """共享提取器的浅拷贝，只替换 _llm 为当前测试的 mock"""
+    ext = copy.copy(extractor)
+    ext._llm = mock_llm
+    return ext
@@ -1,39 +1,46 @@
 """LlmVerificationExtractor 单元测试"""
 
+import asyncio
+import time
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import Mock, patch, AsyncMock, MagicMock
+from unittest.mock import patch
 
 from infrastructure.ai.llm_verification_extractor import LlmVerificationExtractor
 from domain.ai.value_objects.extraction_type import ExtractionType
 from domain.ai.value_objects.extraction_result import ExtractionResult
 
 
+def _resp(content: str) -> SimpleNamespace:
+    """构造 LLM 响应桩（只需要 content 属性，无需 MagicMock）"""
+    return SimpleNamespace(content=content)
+
+
 class TestLlmVerificationExtractorInit:
     """初始化测试"""
 
     def test_init_with_required_params(self):
         """测试使用必需参数初始化"""
-        with patch("infrastructure.ai.llm_verification_extractor.ChatOpenAI"):
-            extractor = LlmVerificationExtractor(api_key="test-key")
-            assert extractor._api_key == "test-key"
-            assert extractor._model == "gpt-4o-mini"  # 默认模型
-            assert extractor._api_base == "https://api.openai.com/v1"
+        extractor = LlmVerificationExtractor(api_key="test-key")
+        assert extractor._api_key == "test-key"
+        assert extractor._model == "gpt-4o-mini"  # 默认模型
+        assert extractor._api_base == "https://api.openai.com/v1"
 
     def test_init_with_custom_params(self):
         """测试使用自定义参数初始化"""
-        with patch("infrastructure.ai.llm_verification_extractor.ChatOpenAI"):
-            extractor = LlmVerificationExtractor(
-                api_key="custom-key",
-                model="gpt-4",
-                api_base="https://custom.api.com/v1",
-                timeout=60.0,
-                max_retries=5,
-            )
-            assert extractor._api_key == "custom-key"
-            assert extractor._model == "gpt-4"
-            assert extractor._api_base == "https://custom.api.com/v1"
-            assert extractor._timeout == 60.0
-            assert extractor._max_retries == 5
+        extractor = LlmVerificationExtractor(
+            api_key="custom-key",
+            model="gpt-4",
+            api_base="https://custom.api.com/v1",
+            timeout=60.0,
+            max_retries=5,
+        )
+        assert extractor._api_key == "custom-key"
+        assert extractor._model == "gpt-4"
+        assert extractor._api_base == "https://custom.api.com/v1"
+        assert extractor._timeout == 60.0
+        assert extractor._max_retries == 5
 
     def test_init_empty_api_key_raises_error(self):
         """测试空 API Key 抛出 ValueError"""
@@ -57,11 +64,6 @@ class TestLlmVerificationExtractorInit:
 class TestLlmVerificationExtractorParseResponse:
     """响应解析测试"""
 
-    @pytest.fixture
-    def extractor(self):
-        with patch("infrastructure.ai.llm_verification_extractor.ChatOpenAI"):
-            return LlmVerificationExtractor(api_key="test-key")
-
     def test_parse_valid_code_response(self, extractor):
         """测试解析有效的验证码响应"""
         response = '{"found": true, "code": "123456", "confidence": 0.95}'
@@ -100,6 +102,15 @@ The code was found in the email body.'''
         assert result.code == "583921"
         assert result.confidence == 0.85
 
+    def test_parse_response_with_surrounding_whitespace(self, extractor):
+        """测试解析前后带空白的纯 JSON 响应"""
+        response = '\n  {"found": true, "code": "246810", "confidence": 0.8}\n'
+        result = extractor._parse_response(response)
+
+        assert result.type == ExtractionType.CODE
+        assert result.code == "246810"
+        assert result.raw_response == response
+
     def test_parse_invalid_json_response(self, extractor):
         """测试解析无效 JSON 响应"""
         response = "This is not valid JSON"
@@ -109,6 +120,21 @@ The code was found in the email body.'''
         assert result.code is None
         assert result.raw_response == response
 
+    @pytest.mark.parametrize(
+        "parse_method",
+        ["_parse_response", "_parse_link_response", "_parse_unified_response"],
+    )
+    def test_parse_prose_response_skips_json_parsing(self, extractor, parse_method):
+        """测试不含 JSON 的纯文字响应直接返回 UNKNOWN，不记录解析失败"""
+        response = "No verification code was found in this email."
+
+        with patch.object(extractor._logger, "warning") as warning:
+            result = getattr(extractor, parse_method)(response)
+
+        assert result.type == ExtractionType.UNKNOWN
+        assert result.raw_response == response
+        warning.assert_not_called()
+
     def test_parse_empty_response(self, extractor):
         """测试解析空响应"""
         response = ""
@@ -130,11 +156,6 @@ The code was found in the email body.'''
 class TestLlmVerificationExtractorPrompt:
     """Prompt 生成测试"""
 
-    @pytest.fixture
-    def extractor(self):
-        with patch("infrastructure.ai.llm_verification_extractor.ChatOpenAI"):
-            return LlmVerificationExtractor(api_key="test-key")
-
     def test_prompt_template_exists(self, extractor):
         """测试 Prompt 模板存在"""
         assert hasattr(extractor, "PROMPT_TEMPLATE")
@@ -148,62 +169,67 @@ class TestLlmVerificationExtractorPrompt:
         assert "confidence" in extractor.PROMPT_TEMPLATE
 
 
-class TestLlmVerificationExtractorExtractCode:
-    """extract_code 方法测试（同步）"""
+class TestLlmVerificationExtractorBuildPrompt:
+    """Prompt 构造测试"""
 
-    @pytest.fixture
-    def mock_llm(self):
-        mock = MagicMock()
-        return mock
+    @pytest.mark.parametrize(
+        "template",
+        ["PROMPT_TEMPLATE", "LINK_PROMPT_TEMPLATE", "UNIFIED_PROMPT_TEMPLATE"],
+    )
+    def test_build_prompt_truncates_content(self, extractor, template):
+        """测试邮件内容被截断到 MAX_CONTENT_LENGTH"""
+        limit = extractor.MAX_CONTENT_LENGTH
 
-    @pytest.fixture
-    def extractor(self, mock_llm):
-        with patch("infrastructure.ai.llm_verification_extractor.ChatOpenAI", return_value=mock_llm):
-            ext = LlmVerificationExtractor(api_key="test-key")
-            ext._llm = mock_llm
-            return ext
+        prompt = extractor._build_prompt(getattr(extractor, template), "y" * (limit * 2))
+
+        assert "y" * limit in prompt
+        assert "y" * (limit + 1) not in prompt
+
+    def test_build_prompt_keeps_short_content(self, extractor):
+        """测试短内容完整保留"""
+        prompt = extractor._build_prompt(extractor.PROMPT_TEMPLATE, "验证码 123456")
+
+        assert "验证码 123456" in prompt
 
-    def test_extract_code_success(self, extractor, mock_llm):
+
+class TestLlmVerificationExtractorExtractCode:
+    """extract_code 方法测试（同步）"""
+
+    def test_extract_code_success(self, llm_extractor, mock_llm):
         """测试成功提取验证码"""
-        mock_response = MagicMock()
-        mock_response.content = '{"found": true, "code": "AB12CD", "confidence": 0.9}'
-        mock_llm.invoke.return_value = mock_response
+        mock_llm.invoke.return_value = _resp('{"found": true, "code": "AB12CD", "confidence": 0.9}')
 
-        result = extractor.extract_code("Your verification code is AB12CD")
+        result = llm_extractor.extract_code("Your verification code is AB12CD")
 
         assert result.type == ExtractionType.CODE
         assert result.code == "AB12CD"
         mock_llm.invoke.assert_called_once()
 
-    def test_extract_code_not_found(self, extractor, mock_llm):
+    def test_extract_code_not_found(self, llm_extractor, mock_llm):
         """测试未找到验证码"""
-        mock_response = MagicMock()
-        mock_response.content = '{"found": false, "code": null, "confidence": 0.0}'
-        mock_llm.invoke.return_value = mock_response
+        mock_llm.invoke.return_value = _resp('{"found": false, "code": null, "confidence": 0.0}')
 
-        result = extractor.extract_code("This is a regular email without code")
+        result = llm_extractor.extract_code("This is a regular email without code")
 
         assert result.type == ExtractionType.UNKNOWN
         assert result.code is None
 
-    def test_extract_code_llm_error(self, extractor, mock_llm):
+    def test_extract_code_llm_error(self, llm_extractor, mock_llm):
         """测试 LLM 调用失败时优雅降级"""
         mock_llm.invoke.side_effect = Exception("API Error")
 
-        result = extractor.extract_code("Some email content")
+        result = llm_extractor.extract_code("Some email content")
 
         assert result.type == ExtractionType.UNKNOWN
         assert result.code is None
         assert "API Error" in result.raw_response
 
-    def test_extract_code_truncates_long_content(self, extractor, mock_llm):
+    def test_extract_code_truncates_long_content(self, llm_extractor, mock_llm):
         """测试长内容被截断"""
-        mock_response = MagicMock()
-        mock_response.content = '{"found": false, "code": null, "confidence": 0.0}'
-        mock_llm.invoke.return_value = mock_response
+        mock_llm.invoke.return_value = _resp('{"found": false, "code": null, "confidence": 0.0}')
         long_content = "x" * 10000
 
-        extractor.extract_code(long_content)
+        llm_extractor.extract_code(long_content)
 
         # 验证传给 LLM 的内容被截断（通过检查调用参数）
         call_args = mock_llm.invoke.call_args[0][0]
@@ -214,85 +240,186 @@ class TestLlmVerificationExtractorExtractCode:
 class TestLlmVerificationExtractorExtractCodeAsync:
     """extract_code_async 方法测试（异步）"""
 
-    @pytest.fixture
-    def mock_llm(self):
-        mock = MagicMock()
-        mock.ainvoke = AsyncMock()
-        return mock
-
-    @pytest.fixture
-    def extractor(self, mock_llm):
-        with patch("infrastructure.ai.llm_verification_extractor.ChatOpenAI", return_value=mock_llm):
-            ext = LlmVerificationExtractor(api_key="test-key")
-            ext._llm = mock_llm
-            return ext
-
-    @pytest.mark.asyncio
-    async def test_extract_code_async_success(self, extractor, mock_llm):
-        """测试异步成功提取验证码"""
-        mock_response = MagicMock()
-        mock_response.content = '{"found": true, "code": "ASYNC123", "confidence": 0.95}'
-        mock_llm.ainvoke.return_value = mock_response
-
-        result = await extractor.extract_code_async("Your code is ASYNC123")
-
-        assert result.type == ExtractionType.CODE
-        assert result.code == "ASYNC123"
+    @pytest.mark.asyncio(loop_scope="module")
+    @pytest.mark.parametrize(
+        "response, expected_type, expected_code",
+        [
+            ('{"found": true, "code": "ASYNC123", "confidence": 0.95}', ExtractionType.CODE, "ASYNC123"),
+            ('{"found": false, "code": null, "confidence": 0.0}', ExtractionType.UNKNOWN, None),
+        ],
+        ids=["found", "not_found"],
+    )
+    async def test_extract_code_async(
+        self, llm_extractor, mock_llm, response, expected_type, expected_code
+    ):
+        """测试异步提取验证码（找到/未找到）"""
+        mock_llm.ainvoke.return_value = _resp(response)
+
+        result = await llm_extractor.extract_code_async("Your code is ASYNC123")
+
+        assert result.type == expected_type
+        assert result.code == expected_code
         mock_llm.ainvoke.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_extract_code_async_not_found(self, extractor, mock_llm):
-        """测试异步未找到验证码"""
-        mock_response = MagicMock()
-        mock_response.content = '{"found": false, "code": null, "confidence": 0.0}'
-        mock_llm.ainvoke.return_value = mock_response
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_extract_code_async_large_response(self, llm_extractor, mock_llm):
+        """测试异步解析超大响应（在线程中解析）"""
+        padding = "x" * 500_000
+        mock_llm.ainvoke.return_value = _resp(
+            f'{padding}\n{{"found": true, "code": "BIG123", "confidence": 0.9}}'
+        )
 
-        result = await extractor.extract_code_async("Regular email")
+        with patch(
+            "infrastructure.ai.llm_verification_extractor.asyncio.to_thread",
+            wraps=asyncio.to_thread,
+        ) as to_thread:
+            result = await llm_extractor.extract_code_async("Your code is BIG123")
 
-        assert result.type == ExtractionType.UNKNOWN
-        assert result.code is None
+        assert result.type == ExtractionType.CODE
+        assert result.code == "BIG123"
+        to_thread.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_extract_code_async_error(self, extractor, mock_llm):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_extract_code_async_error(self, llm_extractor, mock_llm):
         """测试异步 LLM 调用失败时优雅降级"""
         mock_llm.ainvoke.side_effect = Exception("Async API Error")
 
-        result = await extractor.extract_code_async("Content")
+        result = await llm_extractor.extract_code_async("Content")
 
         assert result.type == ExtractionType.UNKNOWN
         assert "Async API Error" in result.raw_response
 
 
-class TestLlmVerificationExtractorIntegration:
-    """集成测试 - Mock LLM 响应验证完整提取流程"""
+class TestLlmVerificationExtractorRequestTimeout:
+    """异步请求超时测试"""
 
     @pytest.fixture
-    def mock_llm(self):
-        mock = MagicMock()
-        mock.ainvoke = AsyncMock()
-        return mock
+    def timeout_extractor(self, mock_llm):
+        ext = LlmVerificationExtractor(
+            api_key="test-key", timeout=0.01, request_timeout=0.01
+        )
+        ext._llm = mock_llm
+        return ext
 
-    @pytest.fixture
-    def extractor(self, mock_llm):
-        with patch("infrastructure.ai.llm_verification_extractor.ChatOpenAI", return_value=mock_llm):
-            ext = LlmVerificationExtractor(api_key="test-key")
-            ext._llm = mock_llm
-            return ext
+    @staticmethod
+    async def _hang(messages):
+        await asyncio.sleep(10)
+
+    def test_default_request_timeout(self, extractor):
+        """测试默认请求超时时间"""
+        assert extractor._request_timeout == LlmVerificationExtractor.DEFAULT_REQUEST_TIMEOUT
+
+    def test_request_timeout_not_below_client_timeout(self):
+        """测试请求超时低于客户端超时时按客户端超时计算"""
+        ext = LlmVerificationExtractor(
+            api_key="test-key", timeout=30.0, request_timeout=15.0
+        )
+
+        assert ext._request_timeout == 30.0
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_extract_code_async_timeout(self, timeout_extractor, mock_llm):
+        """测试请求超时重试一次后优雅降级"""
+        mock_llm.ainvoke.side_effect = self._hang
+
+        result = await timeout_extractor.extract_code_async("Your code is 123456")
+
+        assert result.type == ExtractionType.UNKNOWN
+        assert "timed out" in result.raw_response
+        assert mock_llm.ainvoke.call_count == 2
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_extract_code_async_timeout_retry_success(self, timeout_extractor, mock_llm):
+        """测试首次超时后重试成功"""
+        responses = iter([None, _resp('{"found": true, "code": "RETRY1", "confidence": 0.9}')])
+
+        async def first_hangs(messages):
+            response = next(responses)
+            if response is None:
+                await asyncio.sleep(10)
+            return response
+
+        mock_llm.ainvoke.side_effect = first_hangs
+
+        result = await timeout_extractor.extract_code_async("Your code is RETRY1")
+
+        assert result.type == ExtractionType.CODE
+        assert result.code == "RETRY1"
+        assert mock_llm.ainvoke.call_count == 2
+
+
+class TestLlmVerificationExtractorExtractCodeBatchAsync:
+    """extract_code_batch_async 方法测试（异步批量）"""
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_extract_code_batch_async_results_in_order(self, llm_extractor, mock_llm):
+        """测试批量提取结果与输入顺序一致"""
+        mock_llm.ainvoke.side_effect = [
+            _resp('{"found": true, "code": "111111", "confidence": 0.9}'),
+            _resp('{"found": false, "code": null, "confidence": 0.0}'),
+            _resp('{"found": true, "code": "333333", "confidence": 0.8}'),
+        ]
+
+        results = await llm_extractor.extract_code_batch_async(["a", "b", "c"])
+
+        assert [r.code for r in results] == ["111111", None, "333333"]
+        assert results[1].type == ExtractionType.UNKNOWN
+        assert mock_llm.ainvoke.call_count == 3
 
-    def test_full_extraction_flow_numeric_code(self, extractor, mock_llm):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_extract_code_batch_async_error_isolated(self, llm_extractor, mock_llm):
+        """测试单封邮件失败不影响其他邮件"""
+        mock_llm.ainvoke.side_effect = [
+            Exception("API Error"),
+            _resp('{"found": true, "code": "222222", "confidence": 0.9}'),
+        ]
+
+        results = await llm_extractor.extract_code_batch_async(["a", "b"])
+
+        assert results[0].type == ExtractionType.UNKNOWN
+        assert "API Error" in results[0].raw_response
+        assert results[1].code == "222222"
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_extract_code_batch_async_parallel(self, llm_extractor, mock_llm):
+        """测试批量提取并发执行"""
+
+        async def slow_ainvoke(messages):
+            await asyncio.sleep(0.1)
+            return _resp('{"found": true, "code": "123456", "confidence": 0.9}')
+
+        mock_llm.ainvoke.side_effect = slow_ainvoke
+
+        start = time.perf_counter()
+        results = await llm_extractor.extract_code_batch_async(["content"] * 10)
+        elapsed = time.perf_counter() - start
+
+        assert len(results) == 10
+        assert all(r.code == "123456" for r in results)
+        assert elapsed < 0.5  # 串行执行需要 1 秒
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_extract_code_batch_async_empty(self, llm_extractor, mock_llm):
+        """测试空列表直接返回"""
+        assert await llm_extractor.extract_code_batch_async([]) == []
+        mock_llm.ainvoke.assert_not_called()
+
+
+class TestLlmVerificationExtractorIntegration:
+    """集成测试 - Mock LLM 响应验证完整提取流程"""
+
+    def test_full_extraction_flow_numeric_code(self, llm_extractor, mock_llm):
         """测试完整提取流程 - 纯数字验证码"""
-        mock_response = MagicMock()
-        mock_response.content = '{"found": true, "code": "583921", "confidence": 0.95}'
-        mock_llm.invoke.return_value = mock_response
+        mock_llm.invoke.return_value = _resp('{"found": true, "code": "583921", "confidence": 0.95}')
 
-        result = extractor.extract_code("您的验证码是 583921，5分钟内有效")
+        result = llm_extractor.extract_code("您的验证码是 583921，5分钟内有效")
 
         assert result.type == ExtractionType.CODE
         assert result.code == "583921"
         assert result.confidence == 0.95
         assert result.is_successful
 
-    def test_full_extraction_flow_html_email(self, extractor, mock_llm):
+    def test_full_extraction_flow_html_email(self, llm_extractor, mock_llm):
         """测试完整提取流程 - HTML 邮件"""
         html_content = """
         <html>
@@ -303,35 +430,29 @@ class TestLlmVerificationExtractorIntegration:
         </body>
         </html>
         """
-        mock_response = MagicMock()
-        mock_response.content = '{"found": true, "code": "AB12CD", "confidence": 0.9}'
-        mock_llm.invoke.return_value = mock_response
+        mock_llm.invoke.return_value = _resp('{"found": true, "code": "AB12CD", "confidence": 0.9}')
 
-        result = extractor.extract_code(html_content)
+        result = llm_extractor.extract_code(html_content)
 
         assert result.type == ExtractionType.CODE
         assert result.code == "AB12CD"
 
-    def test_full_extraction_flow_no_code(self, extractor, mock_llm):
+    def test_full_extraction_flow_no_code(self, llm_extractor, mock_llm):
         """测试完整提取流程 - 无验证码邮件"""
-        mock_response = MagicMock()
-        mock_response.content = '{"found": false, "code": null, "confidence": 0.0}'
-        mock_llm.invoke.return_value = mock_response
+        mock_llm.invoke.return_value = _resp('{"found": false, "code": null, "confidence": 0.0}')
 
-        result = extractor.extract_code("感谢您的购买，订单已发货。")
+        result = llm_extractor.extract_code("感谢您的购买，订单已发货。")
 
         assert result.type == ExtractionType.UNKNOWN
         assert result.code is None
         assert not result.is_successful
 
-    @pytest.mark.asyncio
-    async def test_full_async_extraction_flow(self, extractor, mock_llm):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_full_async_extraction_flow(self, llm_extractor, mock_llm):
         """测试完整异步提取流程"""
-        mock_response = MagicMock()
-        mock_response.content = '{"found": true, "code": "ASYNCTEST", "confidence": 0.92}'
-        mock_llm.ainvoke.return_value = mock_response
+        mock_llm.ainvoke.return_value = _resp('{"found": true, "code": "ASYNCTEST", "confidence": 0.92}')
 
-        result = await extractor.extract_code_async("Your async code: ASYNCTEST")
+        result = await llm_extractor.extract_code_async("Your async code: ASYNCTEST")
 
         assert result.type == ExtractionType.CODE
         assert result.code == "ASYNCTEST"
@@ -345,11 +466,6 @@ class TestLlmVerificationExtractorIntegration:
 class TestLlmVerificationExtractorParseLinkResponse:
     """链接响应解析测试"""
 
-    @pytest.fixture
-    def extractor(self):
-        with patch("infrastructure.ai.llm_verification_extractor.ChatOpenAI"):
-            return LlmVerificationExtractor(api_key="test-key")
-
     def test_parse_valid_link_response(self, extractor):
         """测试解析有效的验证链接响应"""
         response = '{"found": true, "link": "https://claude.ai/verify?token=abc123", "confidence": 0.95}'
@@ -447,14 +563,46 @@ The link was found in the email body.'''
         assert result.confidence == 0.9  # 默认值
 
 
+class TestLlmVerificationExtractorValidateUrl:
+    """URL 格式验证测试"""
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "https://example.com",
+            "http://example.com/verify",
+            "https://example.com:8080/verify?token=abc",
+            "https://example.com:/verify",
+            "https://auth.example.co.uk/email-verification/token123",
+            "https://example.com?token=abc",
+        ],
+    )
+    def test_valid_url(self, extractor, url):
+        """测试合法 URL 原样返回"""
+        assert extractor._validate_url(url) == url
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            None,
+            "",
+            "   ",
+            "not-a-valid-url",
+            "ftp://example.com/file",
+            "https://",
+            "https://localhost/verify",
+            "https://example.com:port/verify",
+            " https://example.com",
+        ],
+    )
+    def test_invalid_url(self, extractor, url):
+        """测试非法 URL 返回 None"""
+        assert extractor._validate_url(url) is None
+
+
 class TestLlmVerificationExtractorLinkPrompt:
     """链接 Prompt 模板测试"""
 
-    @pytest.fixture
-    def extractor(self):
-        with patch("infrastructure.ai.llm_verification_extractor.ChatOpenAI"):
-            return LlmVerificationExtractor(api_key="test-key")
-
     def test_link_prompt_template_exists(self, extractor):
         """测试链接 Prompt 模板存在"""
         assert hasattr(extractor, "LINK_PROMPT_TEMPLATE")
@@ -482,52 +630,36 @@ class TestLlmVerificationExtractorLinkPrompt:
 class TestLlmVerificationExtractorExtractLink:
     """extract_link 方法测试（同步）"""
 
-    @pytest.fixture
-    def mock_llm(self):
-        mock = MagicMock()
-        return mock
-
-    @pytest.fixture
-    def extractor(self, mock_llm):
-        with patch("infrastructure.ai.llm_verification_extractor.ChatOpenAI", return_value=mock_llm):
-            ext = LlmVerificationExtractor(api_key="test-key")
-            ext._llm = mock_llm
-            return ext
-
-    def test_extract_link_success(self, extractor, mock_llm):
+    def test_extract_link_success(self, llm_extractor, mock_llm):
         """测试成功提取验证链接"""
-        mock_response = MagicMock()
-        mock_response.content = '{"found": true, "link": "https://claude.ai/verify?token=abc123", "confidence": 0.95}'
-        mock_llm.invoke.return_value = mock_response
+        mock_llm.invoke.return_value = _resp('{"found": true, "link": "https://claude.ai/verify?token=abc123", "confidence": 0.95}')
 
-        result = extractor.extract_link("Please click the link to verify your email")
+        result = llm_extractor.extract_link("Please click the link to verify your email")
 
         assert result.type == ExtractionType.LINK
         assert result.link == "https://claude.ai/verify?token=abc123"
         mock_llm.invoke.assert_called_once()
 
-    def test_extract_link_not_found(self, extractor, mock_llm):
+    def test_extract_link_not_found(self, llm_extractor, mock_llm):
         """测试未找到验证链接"""
-        mock_response = MagicMock()
-        mock_response.content = '{"found": false, "link": null, "confidence": 0.0}'
-        mock_llm.invoke.return_value = mock_response
+        mock_llm.invoke.return_value = _resp('{"found": false, "link": null, "confidence": 0.0}')
 
-        result = extractor.extract_link("This is a regular email without verification link")
+        result = llm_extractor.extract_link("This is a regular email without verification link")
 
         assert result.type == ExtractionType.UNKNOWN
         assert result.link is None
 
-    def test_extract_link_llm_error(self, extractor, mock_llm):
+    def test_extract_link_llm_error(self, llm_extractor, mock_llm):
         """测试 LLM 调用失败时优雅降级"""
         mock_llm.invoke.side_effect = Exception("API Error")
 
-        result = extractor.extract_link("Some email content")
+        result = llm_extractor.extract_link("Some email content")
 
         assert result.type == ExtractionType.UNKNOWN
         assert result.link is None
         assert "API Error" in result.raw_response
 
-    def test_extract_link_from_html_email(self, extractor, mock_llm):
+    def test_extract_link_from_html_email(self, llm_extractor, mock_llm):
         """测试从 HTML 邮件提取链接"""
         html_content = """
         <html>
@@ -537,23 +669,19 @@ class TestLlmVerificationExtractorExtractLink:
         </body>
         </html>
         """
-        mock_response = MagicMock()
-        mock_response.content = '{"found": true, "link": "https://example.com/verify?token=xyz", "confidence": 0.92}'
-        mock_llm.invoke.return_value = mock_response
+        mock_llm.invoke.return_value = _resp('{"found": true, "link": "https://example.com/verify?token=xyz", "confidence": 0.92}')
 
-        result = extractor.extract_link(html_content)
+        result = llm_extractor.extract_link(html_content)
 
         assert result.type == ExtractionType.LINK
         assert "verify?token=xyz" in result.link
 
-    def test_extract_link_truncates_long_content(self, extractor, mock_llm):
+    def test_extract_link_truncates_long_content(self, llm_extractor, mock_llm):
         """测试长内容被截断 (H1)"""
-        mock_response = MagicMock()
-        mock_response.content = '{"found": false, "link": null, "confidence": 0.0}'
-        mock_llm.invoke.return_value = mock_response
+        mock_llm.invoke.return_value = _resp('{"found": false, "link": null, "confidence": 0.0}')
         long_content = "x" * 10000
 
-        extractor.extract_link(long_content)
+        llm_extractor.extract_link(long_content)
 
         # 验证传给 LLM 的内容被截断（通过检查调用参数）
         call_args = mock_llm.invoke.call_args[0][0]
@@ -564,50 +692,33 @@ class TestLlmVerificationExtractorExtractLink:
 class TestLlmVerificationExtractorExtractLinkAsync:
     """extract_link_async 方法测试（异步）"""
 
-    @pytest.fixture
-    def mock_llm(self):
-        mock = MagicMock()
-        mock.ainvoke = AsyncMock()
-        return mock
-
-    @pytest.fixture
-    def extractor(self, mock_llm):
-        with patch("infrastructure.ai.llm_verification_extractor.ChatOpenAI", return_value=mock_llm):
-            ext = LlmVerificationExtractor(api_key="test-key")
-            ext._llm = mock_llm
-            return ext
-
-    @pytest.mark.asyncio
-    async def test_extract_link_async_success(self, extractor, mock_llm):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_extract_link_async_success(self, llm_extractor, mock_llm):
         """测试异步成功提取验证链接"""
-        mock_response = MagicMock()
-        mock_response.content = '{"found": true, "link": "https://verify.example.com/token123", "confidence": 0.9}'
-        mock_llm.ainvoke.return_value = mock_response
+        mock_llm.ainvoke.return_value = _resp('{"found": true, "link": "https://verify.example.com/token123", "confidence": 0.9}')
 
-        result = await extractor.extract_link_async("Please verify your email by clicking the link")
+        result = await llm_extractor.extract_link_async("Please verify your email by clicking the link")
 
         assert result.type == ExtractionType.LINK
         assert result.link == "https://verify.example.com/token123"
         mock_llm.ainvoke.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_extract_link_async_not_found(self, extractor, mock_llm):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_extract_link_async_not_found(self, llm_extractor, mock_llm):
         """测试异步未找到验证链接"""
-        mock_response = MagicMock()
-        mock_response.content = '{"found": false, "link": null, "confidence": 0.0}'
-        mock_llm.ainvoke.return_value = mock_response
+        mock_llm.ainvoke.return_value = _resp('{"found": false, "link": null, "confidence": 0.0}')
 
-        result = await extractor.extract_link_async("Regular newsletter email")
+        result = await llm_extractor.extract_link_async("Regular newsletter email")
 
         assert result.type == ExtractionType.UNKNOWN
         assert result.link is None
 
-    @pytest.mark.asyncio
-    async def test_extract_link_async_error(self, extractor, mock_llm):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_extract_link_async_error(self, llm_extractor, mock_llm):
         """测试异步 LLM 调用失败时优雅降级"""
         mock_llm.ainvoke.side_effect = Exception("Async API Error")
 
-        result = await extractor.extract_link_async("Content")
+        result = await llm_extractor.extract_link_async("Content")
 
         assert result.type == ExtractionType.UNKNOWN
         assert "Async API Error" in result.raw_response
@@ -616,70 +727,49 @@ class TestLlmVerificationExtractorExtractLinkAsync:
 class TestLlmVerificationExtractorLinkIntegration:
     """链接提取集成测试"""
 
-    @pytest.fixture
-    def mock_llm(self):
-        mock = MagicMock()
-        mock.ainvoke = AsyncMock()
-        return mock
-
-    @pytest.fixture
-    def extractor(self, mock_llm):
-        with patch("infrastructure.ai.llm_verification_extractor.ChatOpenAI", return_value=mock_llm):
-            ext = LlmVerificationExtractor(api_key="test-key")
-            ext._llm = mock_llm
-            return ext
-
-    def test_full_link_extraction_flow(self, extractor, mock_llm):
+    def test_full_link_extraction_flow(self, llm_extractor, mock_llm):
         """测试完整链接提取流程"""
-        mock_response = MagicMock()
-        mock_response.content = '{"found": true, "link": "https://claude.ai/verify?token=abc123def456", "confidence": 0.95}'
-        mock_llm.invoke.return_value = mock_response
+        mock_llm.invoke.return_value = _resp('{"found": true, "link": "https://claude.ai/verify?token=abc123def456", "confidence": 0.95}')
 
-        result = extractor.extract_link("请点击以下链接验证您的邮箱：https://claude.ai/verify?token=abc123def456")
+        result = llm_extractor.extract_link("请点击以下链接验证您的邮箱：https://claude.ai/verify?token=abc123def456")
 
         assert result.type == ExtractionType.LINK
         assert result.link == "https://claude.ai/verify?token=abc123def456"
         assert result.confidence == 0.95
         assert result.is_successful
 
-    def test_full_link_extraction_multiple_links(self, extractor, mock_llm):
+    def test_full_link_extraction_multiple_links(self, llm_extractor, mock_llm):
         """测试多链接场景智能识别"""
-        mock_response = MagicMock()
-        mock_response.content = '{"found": true, "link": "https://auth.example.com/email-verification/token123", "confidence": 0.92}'
-        mock_llm.invoke.return_value = mock_response
+        mock_llm.invoke.return_value = _resp('{"found": true, "link": "https://auth.example.com/email-verification/token123", "confidence": 0.92}')
 
         email_content = """
         点击验证: https://auth.example.com/email-verification/token123
         退订: https://example.com/unsubscribe
         关注我们: https://facebook.com/example
         """
-        result = extractor.extract_link(email_content)
+        result = llm_extractor.extract_link(email_content)
 
         assert result.type == ExtractionType.LINK
         assert "email-verification" in result.link
         assert "unsubscribe" not in result.link
         assert "facebook" not in result.link
 
-    def test_full_link_extraction_no_verification_link(self, extractor, mock_llm):
+    def test_full_link_extraction_no_verification_link(self, llm_extractor, mock_llm):
         """测试无验证链接邮件"""
-        mock_response = MagicMock()
-        mock_response.content = '{"found": false, "link": null, "confidence": 0.0}'
-        mock_llm.invoke.return_value = mock_response
+        mock_llm.invoke.return_value = _resp('{"found": false, "link": null, "confidence": 0.0}')
 
-        result = extractor.extract_link("感谢您的购买，订单已发货。查看订单详情请访问我们的网站。")
+        result = llm_extractor.extract_link("感谢您的购买，订单已发货。查看订单详情请访问我们的网站。")
 
         assert result.type == ExtractionType.UNKNOWN
         assert result.link is None
         assert not result.is_successful
 
-    @pytest.mark.asyncio
-    async def test_full_async_link_extraction_flow(self, extractor, mock_llm):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_full_async_link_extraction_flow(self, llm_extractor, mock_llm):
         """测试完整异步链接提取流程"""
-        mock_response = MagicMock()
-        mock_response.content = '{"found": true, "link": "https://accounts.google.com/signin/v2/challenge/key=xyz", "confidence": 0.88}'
-        mock_llm.ainvoke.return_value = mock_response
+        mock_llm.ainvoke.return_value = _resp('{"found": true, "link": "https://accounts.google.com/signin/v2/challenge/key=xyz", "confidence": 0.88}')
 
-        result = await extractor.extract_link_async("Verify your Google account by clicking the link below")
+        result = await llm_extractor.extract_link_async("Verify your Google account by clicking the link below")
 
         assert result.type == ExtractionType.LINK
         assert "accounts.google.com" in result.link
@@ -692,11 +782,6 @@ class TestLlmVerificationExtractorLinkIntegration:
 class TestLlmVerificationExtractorUnifiedPrompt:
     """统一 Prompt 模板测试"""
 
-    @pytest.fixture
-    def extractor(self):
-        with patch("infrastructure.ai.llm_verification_extractor.ChatOpenAI"):
-            return LlmVerificationExtractor(api_key="test-key")
-
     def test_unified_prompt_template_exists(self, extractor):
         """测试统一 Prompt 模板存在"""
         assert hasattr(extractor, "UNIFIED_PROMPT_TEMPLATE")
@@ -728,189 +813,139 @@ class TestLlmVerificationExtractorUnifiedPrompt:
 class TestLlmVerificationExtractorParseUnifiedResponse:
     """统一响应解析测试"""
 
-    @pytest.fixture
-    def extractor(self):
-        with patch("infrastructure.ai.llm_verification_extractor.ChatOpenAI"):
-            return LlmVerificationExtractor(api_key="test-key")
-
-    def test_parse_code_only_response(self, extractor):
-        """测试解析仅验证码响应"""
-        response = '{"type": "code", "code": "123456", "link": null, "backup_link": null, "confidence": 0.95}'
+    @pytest.mark.parametrize(
+        "response, expected_type, expected_code, expected_link, expected_backup_link, expected_confidence",
+        [
+            (
+                '{"type": "code", "code": "123456", "link": null, "backup_link": null, "confidence": 0.95}',
+                ExtractionType.CODE, "123456", None, None, 0.95,
+            ),
+            (
+                '{"type": "link", "code": null, "link": "https://example.com/verify?token=abc", "backup_link": null, "confidence": 0.9}',
+                ExtractionType.LINK, None, "https://example.com/verify?token=abc", None, 0.9,
+            ),
+            (
+                '{"type": "code", "code": "789012", "link": null, "backup_link": "https://example.com/verify?token=xyz", "confidence": 0.92}',
+                ExtractionType.CODE, "789012", None, "https://example.com/verify?token=xyz", 0.92,
+            ),
+            (
+                '{"type": "unknown", "code": null, "link": null, "backup_link": null, "confidence": 0.0}',
+                ExtractionType.UNKNOWN, None, None, None, 0.0,
+            ),
+            (
+                'Here is the analysis:\n'
+                '{"type": "code", "code": "ABCD12", "link": null, "backup_link": null, "confidence": 0.88}\n'
+                'This appears to be a verification code.',
+                ExtractionType.CODE, "ABCD12", None, None, 0.88,
+            ),
+            ("This is not valid JSON", ExtractionType.UNKNOWN, None, None, None, 0.0),
+            ("", ExtractionType.UNKNOWN, None, None, None, 0.0),
+            (
+                '{"type": "link", "code": null, "link": "not-a-valid-url", "backup_link": null, "confidence": 0.5}',
+                ExtractionType.UNKNOWN, None, None, None, 0.0,
+            ),
+            (
+                '{"type": "code", "code": "123456", "link": null, "backup_link": "invalid-url", "confidence": 0.9}',
+                ExtractionType.CODE, "123456", None, None, 0.9,  # 无效备用链接应被过滤
+            ),
+            ('{"type": "code", "code": "999888"}', ExtractionType.CODE, "999888", None, None, 0.9),  # 默认置信度
+            (
+                '{"type": "CODE", "code": "ABC123", "link": null, "backup_link": null, "confidence": 0.9}',
+                ExtractionType.CODE, "ABC123", None, None, 0.9,
+            ),
+        ],
+        ids=[
+            "code_only",
+            "link_only",
+            "code_with_backup_link",  # AC3
+            "unknown",  # AC4
+            "extra_text",
+            "invalid_json",
+            "empty",
+            "invalid_link_format",
+            "invalid_backup_link_format",
+            "missing_confidence",
+            "uppercase_type",
+        ],
+    )
+    def test_parse_unified_response(
+        self,
+        extractor,
+        response,
+        expected_type,
+        expected_code,
+        expected_link,
+        expected_backup_link,
+        expected_confidence,
+    ):
+        """测试解析统一提取响应"""
         result = extractor._parse_unified_response(response)
 
-        assert result.type == ExtractionType.CODE
-        assert result.code == "123456"
-        assert result.link is None
-        assert result.backup_link is None
-        assert result.confidence == 0.95
-
-    def test_parse_link_only_response(self, extractor):
-        """测试解析仅验证链接响应"""
-        response = '{"type": "link", "code": null, "link": "https://example.com/verify?token=abc", "backup_link": null, "confidence": 0.9}'
-        result = extractor._parse_unified_response(response)
-
-        assert result.type == ExtractionType.LINK
-        assert result.code is None
-        assert result.link == "https://example.com/verify?token=abc"
-        assert result.backup_link is None
-
-    def test_parse_code_with_backup_link_response(self, extractor):
-        """测试解析验证码带备用链接响应（AC3）"""
-        response = '{"type": "code", "code": "789012", "link": null, "backup_link": "https://example.com/verify?token=xyz", "confidence": 0.92}'
-        result = extractor._parse_unified_response(response)
-
-        assert result.type == ExtractionType.CODE
-        assert result.code == "789012"
-        assert result.link is None
-        assert result.backup_link == "https://example.com/verify?token=xyz"
-
-    def test_parse_unknown_response(self, extractor):
-        """测试解析无验证信息响应（AC4）"""
-        response = '{"type": "unknown", "code": null, "link": null, "backup_link": null, "confidence": 0.0}'
-        result = extractor._parse_unified_response(response)
-
-        assert result.type == ExtractionType.UNKNOWN
-        assert result.code is None
-        assert result.link is None
-        assert result.backup_link is None
-
-    def test_parse_response_with_extra_text(self, extractor):
-        """测试解析带有额外文字的响应"""
-        response = '''Here is the analysis:
-{"type": "code", "code": "ABCD12", "link": null, "backup_link": null, "confidence": 0.88}
-This appears to be a verification code.'''
-        result = extractor._parse_unified_response(response)
-
-        assert result.type == ExtractionType.CODE
-        assert result.code == "ABCD12"
-
-    def test_parse_invalid_json_response(self, extractor):
-        """测试解析无效 JSON 响应"""
-        response = "This is not valid JSON"
-        result = extractor._parse_unified_response(response)
-
-        assert result.type == ExtractionType.UNKNOWN
-
-    def test_parse_empty_response(self, extractor):
-        """测试解析空响应"""
-        response = ""
-        result = extractor._parse_unified_response(response)
-
-        assert result.type == ExtractionType.UNKNOWN
-
-    def test_parse_invalid_link_format(self, extractor):
-        """测试解析无效链接格式"""
-        response = '{"type": "link", "code": null, "link": "not-a-valid-url", "backup_link": null, "confidence": 0.5}'
-        result = extractor._parse_unified_response(response)
-
-        assert result.type == ExtractionType.UNKNOWN
-
-    def test_parse_invalid_backup_link_format(self, extractor):
-        """测试解析无效备用链接格式"""
-        response = '{"type": "code", "code": "123456", "link": null, "backup_link": "invalid-url", "confidence": 0.9}'
-        result = extractor._parse_unified_response(response)
-
-        assert result.type == ExtractionType.CODE
-        assert result.code == "123456"
-        assert result.backup_link is None  # 无效链接应被过滤
-
-    def test_parse_missing_confidence(self, extractor):
-        """测试解析缺少 confidence 字段的响应"""
-        response = '{"type": "code", "code": "999888"}'
-        result = extractor._parse_unified_response(response)
-
-        assert result.type == ExtractionType.CODE
-        assert result.code == "999888"
-        assert result.confidence == 0.9  # 默认值
-
-    def test_parse_uppercase_type(self, extractor):
-        """测试解析大写类型"""
-        response = '{"type": "CODE", "code": "ABC123", "link": null, "backup_link": null, "confidence": 0.9}'
-        result = extractor._parse_unified_response(response)
-
-        assert result.type == ExtractionType.CODE
-        assert result.code == "ABC123"
+        assert result.type == expected_type
+        assert result.code == expected_code
+        assert result.link == expected_link
+        assert result.backup_link == expected_backup_link
+        assert result.confidence == expected_confidence
+        assert result.raw_response == response
 
 
 class TestLlmVerificationExtractorExtract:
     """extract 方法测试（同步）"""
 
-    @pytest.fixture
-    def mock_llm(self):
-        mock = MagicMock()
-        return mock
-
-    @pytest.fixture
-    def extractor(self, mock_llm):
-        with patch("infrastructure.ai.llm_verification_extractor.ChatOpenAI", return_value=mock_llm):
-            ext = LlmVerificationExtractor(api_key="test-key")
-            ext._llm = mock_llm
-            return ext
-
-    def test_extract_code_success(self, extractor, mock_llm):
+    def test_extract_code_success(self, llm_extractor, mock_llm):
         """测试成功提取验证码（AC1）"""
-        mock_response = MagicMock()
-        mock_response.content = '{"type": "code", "code": "123456", "link": null, "backup_link": null, "confidence": 0.95}'
-        mock_llm.invoke.return_value = mock_response
+        mock_llm.invoke.return_value = _resp('{"type": "code", "code": "123456", "link": null, "backup_link": null, "confidence": 0.95}')
 
-        result = extractor.extract("您的验证码是 123456")
+        result = llm_extractor.extract("您的验证码是 123456")
 
         assert result.type == ExtractionType.CODE
         assert result.code == "123456"
         mock_llm.invoke.assert_called_once()
 
-    def test_extract_link_success(self, extractor, mock_llm):
+    def test_extract_link_success(self, llm_extractor, mock_llm):
         """测试成功提取验证链接（AC2）"""
-        mock_response = MagicMock()
-        mock_response.content = '{"type": "link", "code": null, "link": "https://example.com/verify?token=abc", "backup_link": null, "confidence": 0.9}'
-        mock_llm.invoke.return_value = mock_response
+        mock_llm.invoke.return_value = _resp('{"type": "link", "code": null, "link": "https://example.com/verify?token=abc", "backup_link": null, "confidence": 0.9}')
 
-        result = extractor.extract("请点击链接验证：https://example.com/verify?token=abc")
+        result = llm_extractor.extract("请点击链接验证：https://example.com/verify?token=abc")
 
         assert result.type == ExtractionType.LINK
         assert result.link == "https://example.com/verify?token=abc"
 
-    def test_extract_code_with_backup_link(self, extractor, mock_llm):
+    def test_extract_code_with_backup_link(self, llm_extractor, mock_llm):
         """测试同时存在时优先返回验证码并带备用链接（AC3）"""
-        mock_response = MagicMock()
-        mock_response.content = '{"type": "code", "code": "789012", "link": null, "backup_link": "https://example.com/verify?token=xyz", "confidence": 0.92}'
-        mock_llm.invoke.return_value = mock_response
+        mock_llm.invoke.return_value = _resp('{"type": "code", "code": "789012", "link": null, "backup_link": "https://example.com/verify?token=xyz", "confidence": 0.92}')
 
-        result = extractor.extract("验证码 789012，或点击 https://example.com/verify?token=xyz")
+        result = llm_extractor.extract("验证码 789012，或点击 https://example.com/verify?token=xyz")
 
         assert result.type == ExtractionType.CODE
         assert result.code == "789012"
         assert result.backup_link == "https://example.com/verify?token=xyz"
 
-    def test_extract_unknown(self, extractor, mock_llm):
+    def test_extract_unknown(self, llm_extractor, mock_llm):
         """测试无验证信息时返回 UNKNOWN（AC4）"""
-        mock_response = MagicMock()
-        mock_response.content = '{"type": "unknown", "code": null, "link": null, "backup_link": null, "confidence": 0.0}'
-        mock_llm.invoke.return_value = mock_response
+        mock_llm.invoke.return_value = _resp('{"type": "unknown", "code": null, "link": null, "backup_link": null, "confidence": 0.0}')
 
-        result = extractor.extract("欢迎订阅我们的新闻通讯")
+        result = llm_extractor.extract("欢迎订阅我们的新闻通讯")
 
         assert result.type == ExtractionType.UNKNOWN
         assert result.code is None
         assert result.link is None
 
-    def test_extract_llm_error(self, extractor, mock_llm):
+    def test_extract_llm_error(self, llm_extractor, mock_llm):
         """测试 LLM 调用失败时优雅降级"""
         mock_llm.invoke.side_effect = Exception("API Error")
 
-        result = extractor.extract("Some email content")
+        result = llm_extractor.extract("Some email content")
 
         assert result.type == ExtractionType.UNKNOWN
         assert "API Error" in result.raw_response
 
-    def test_extract_truncates_long_content(self, extractor, mock_llm):
+    def test_extract_truncates_long_content(self, llm_extractor, mock_llm):
         """测试长内容被截断"""
-        mock_response = MagicMock()
-        mock_response.content = '{"type": "unknown", "code": null, "link": null, "backup_link": null, "confidence": 0.0}'
-        mock_llm.invoke.return_value = mock_response
+        mock_llm.invoke.return_value = _resp('{"type": "unknown", "code": null, "link": null, "backup_link": null, "confidence": 0.0}')
         long_content = "x" * 10000
 
-        extractor.extract(long_content)
+        llm_extractor.extract(long_content)
 
         call_args = mock_llm.invoke.call_args[0][0]
         assert len(call_args[0].content) < len(long_content) + 500
@@ -919,74 +954,71 @@ class TestLlmVerificationExtractorExtract:
 class TestLlmVerificationExtractorExtractAsync:
     """extract_async 方法测试（异步）"""
 
-    @pytest.fixture
-    def mock_llm(self):
-        mock = MagicMock()
-        mock.ainvoke = AsyncMock()
-        return mock
-
-    @pytest.fixture
-    def extractor(self, mock_llm):
-        with patch("infrastructure.ai.llm_verification_extractor.ChatOpenAI", return_value=mock_llm):
-            ext = LlmVerificationExtractor(api_key="test-key")
-            ext._llm = mock_llm
-            return ext
-
-    @pytest.mark.asyncio
-    async def test_extract_async_code_success(self, extractor, mock_llm):
-        """测试异步成功提取验证码"""
-        mock_response = MagicMock()
-        mock_response.content = '{"type": "code", "code": "ASYNC123", "link": null, "backup_link": null, "confidence": 0.95}'
-        mock_llm.ainvoke.return_value = mock_response
-
-        result = await extractor.extract_async("Your code is ASYNC123")
-
-        assert result.type == ExtractionType.CODE
-        assert result.code == "ASYNC123"
-        mock_llm.ainvoke.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_extract_async_link_success(self, extractor, mock_llm):
-        """测试异步成功提取验证链接"""
-        mock_response = MagicMock()
-        mock_response.content = '{"type": "link", "code": null, "link": "https://verify.example.com/token", "backup_link": null, "confidence": 0.9}'
-        mock_llm.ainvoke.return_value = mock_response
-
-        result = await extractor.extract_async("Click to verify: https://verify.example.com/token")
-
-        assert result.type == ExtractionType.LINK
-        assert result.link == "https://verify.example.com/token"
-
-    @pytest.mark.asyncio
-    async def test_extract_async_code_with_backup_link(self, extractor, mock_llm):
-        """测试异步同时存在时优先返回验证码并带备用链接"""
-        mock_response = MagicMock()
-        mock_response.content = '{"type": "code", "code": "ABC789", "link": null, "backup_link": "https://example.com/alt-verify", "confidence": 0.88}'
-        mock_llm.ainvoke.return_value = mock_response
-
-        result = await extractor.extract_async("Code: ABC789 or click https://example.com/alt-verify")
-
-        assert result.type == ExtractionType.CODE
-        assert result.code == "ABC789"
-        assert result.backup_link == "https://example.com/alt-verify"
-
-    @pytest.mark.asyncio
-    async def test_extract_async_unknown(self, extractor, mock_llm):
-        """测试异步无验证信息时返回 UNKNOWN"""
-        mock_response = MagicMock()
-        mock_response.content = '{"type": "unknown", "code": null, "link": null, "backup_link": null, "confidence": 0.0}'
-        mock_llm.ainvoke.return_value = mock_response
-
-        result = await extractor.extract_async("Regular newsletter content")
-
-        assert result.type == ExtractionType.UNKNOWN
-
-    @pytest.mark.asyncio
-    async def test_extract_async_error(self, extractor, mock_llm):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_extract_async_scenarios_concurrently(self, llm_extractor, mock_llm):
+        """测试并发提取多种邮件（验证码 / 链接 / 验证码带备用链接 / 无验证信息）"""
+        # 按邮件内容返回对应响应，不依赖并发调用顺序
+        responses = {
+            "Your code is ASYNC123": '{"type": "code", "code": "ASYNC123", "link": null, "backup_link": null, "confidence": 0.95}',
+            "Click to verify: https://verify.example.com/token": '{"type": "link", "code": null, "link": "https://verify.example.com/token", "backup_link": null, "confidence": 0.9}',
+            "Code: ABC789 or click https://example.com/alt-verify": '{"type": "code", "code": "ABC789", "link": null, "backup_link": "https://example.com/alt-verify", "confidence": 0.88}',
+            "Regular newsletter content": '{"type": "unknown", "code": null, "link": null, "backup_link": null, "confidence": 0.0}',
+        }
+
+        async def ainvoke(messages):
+            prompt = messages[0].content
+            return _resp(next(r for c, r in responses.items() if c in prompt))
+
+        mock_llm.ainvoke.side_effect = ainvoke
+
+        code, link, code_with_backup, unknown = await asyncio.gather(
+            *(llm_extractor.extract_async(content) for content in responses)
+        )
+
+        assert code.type == ExtractionType.CODE
+        assert code.code == "ASYNC123"
+        assert link.type == ExtractionType.LINK
+        assert link.link == "https://verify.example.com/token"
+        assert code_with_backup.type == ExtractionType.CODE
+        assert code_with_backup.code == "ABC789"
+        assert code_with_backup.backup_link == "https://example.com/alt-verify"
+        assert unknown.type == ExtractionType.UNKNOWN
+        assert mock_llm.ainvoke.await_count == 4
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_extract_async_gathered_concurrency(self, llm_extractor, mock_llm):
+        """测试信号量限流下的批量并发提取"""
+        sem = asyncio.Semaphore(10)
+        in_flight = 0
+        max_in_flight = 0
+
+        async def ainvoke(messages):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return _resp('{"type": "unknown", "code": null, "link": null, "backup_link": null, "confidence": 0.0}')
+
+        mock_llm.ainvoke.side_effect = ainvoke
+
+        async def bound(content):
+            async with sem:
+                return await llm_extractor.extract_async(content)
+
+        results = await asyncio.gather(*(bound(f"msg {i}") for i in range(50)))
+
+        assert len(results) == 50
+        assert all(r.type == ExtractionType.UNKNOWN for r in results)
+        assert mock_llm.ainvoke.await_count == 50
+        assert 1 < max_in_flight <= 10
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_extract_async_error(self, llm_extractor, mock_llm):
         """测试异步 LLM 调用失败时优雅降级"""
         mock_llm.ainvoke.side_effect = Exception("Async API Error")
 
-        result = await extractor.extract_async("Content")
+        result = await llm_extractor.extract_async("Content")
 
         assert result.type == ExtractionType.UNKNOWN
         assert "Async API Error" in result.raw_response
@@ -995,80 +1027,57 @@ class TestLlmVerificationExtractorExtractAsync:
 class TestLlmVerificationExtractorUnifiedIntegration:
     """统一提取集成测试"""
 
-    @pytest.fixture
-    def mock_llm(self):
-        mock = MagicMock()
-        mock.ainvoke = AsyncMock()
-        return mock
-
-    @pytest.fixture
-    def extractor(self, mock_llm):
-        with patch("infrastructure.ai.llm_verification_extractor.ChatOpenAI", return_value=mock_llm):
-            ext = LlmVerificationExtractor(api_key="test-key")
-            ext._llm = mock_llm
-            return ext
-
-    def test_full_unified_extraction_code_chinese(self, extractor, mock_llm):
+    def test_full_unified_extraction_code_chinese(self, llm_extractor, mock_llm):
         """测试完整统一提取流程 - 中文验证码邮件"""
-        mock_response = MagicMock()
-        mock_response.content = '{"type": "code", "code": "583921", "link": null, "backup_link": null, "confidence": 0.95}'
-        mock_llm.invoke.return_value = mock_response
+        mock_llm.invoke.return_value = _resp('{"type": "code", "code": "583921", "link": null, "backup_link": null, "confidence": 0.95}')
 
-        result = extractor.extract("您的验证码是 583921，5分钟内有效。")
+        result = llm_extractor.extract("您的验证码是 583921，5分钟内有效。")
 
         assert result.type == ExtractionType.CODE
         assert result.code == "583921"
         assert result.is_successful
 
-    def test_full_unified_extraction_link_english(self, extractor, mock_llm):
+    def test_full_unified_extraction_link_english(self, llm_extractor, mock_llm):
         """测试完整统一提取流程 - 英文验证链接邮件"""
-        mock_response = MagicMock()
-        mock_response.content = '{"type": "link", "code": null, "link": "https://accounts.google.com/verify?token=abc123", "backup_link": null, "confidence": 0.9}'
-        mock_llm.invoke.return_value = mock_response
+        mock_llm.invoke.return_value = _resp('{"type": "link", "code": null, "link": "https://accounts.google.com/verify?token=abc123", "backup_link": null, "confidence": 0.9}')
 
-        result = extractor.extract("Please verify your account by clicking: https://accounts.google.com/verify?token=abc123")
+        result = llm_extractor.extract("Please verify your account by clicking: https://accounts.google.com/verify?token=abc123")
 
         assert result.type == ExtractionType.LINK
         assert "accounts.google.com" in result.link
         assert result.is_successful
 
-    def test_full_unified_extraction_code_and_link(self, extractor, mock_llm):
+    def test_full_unified_extraction_code_and_link(self, llm_extractor, mock_llm):
         """测试完整统一提取流程 - 同时包含验证码和链接"""
-        mock_response = MagicMock()
-        mock_response.content = '{"type": "code", "code": "123456", "link": null, "backup_link": "https://example.com/verify?token=xyz789", "confidence": 0.92}'
-        mock_llm.invoke.return_value = mock_response
+        mock_llm.invoke.return_value = _resp('{"type": "code", "code": "123456", "link": null, "backup_link": "https://example.com/verify?token=xyz789", "confidence": 0.92}')
 
         content = """
         您的验证码是 123456。
         如果验证码输入不便，也可以点击以下链接完成验证：
         https://example.com/verify?token=xyz789
         """
-        result = extractor.extract(content)
+        result = llm_extractor.extract(content)
 
         assert result.type == ExtractionType.CODE
         assert result.code == "123456"
         assert result.backup_link == "https://example.com/verify?token=xyz789"
         assert result.is_successful
 
-    def test_full_unified_extraction_no_verification(self, extractor, mock_llm):
+    def test_full_unified_extraction_no_verification(self, llm_extractor, mock_llm):
         """测试完整统一提取流程 - 无验证信息邮件"""
-        mock_response = MagicMock()
-        mock_response.content = '{"type": "unknown", "code": null, "link": null, "backup_link": null, "confidence": 0.0}'
-        mock_llm.invoke.return_value = mock_response
+        mock_llm.invoke.return_value = _resp('{"type": "unknown", "code": null, "link": null, "backup_link": null, "confidence": 0.0}')
 
-        result = extractor.extract("欢迎订阅我们的新闻通讯！查看最新优惠请访问 https://shop.com/deals")
+        result = llm_extractor.extract("欢迎订阅我们的新闻通讯！查看最新优惠请访问 https://shop.com/deals")
 
         assert result.type == ExtractionType.UNKNOWN
         assert not result.is_successful
 
-    @pytest.mark.asyncio
-    async def test_full_async_unified_extraction(self, extractor, mock_llm):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_full_async_unified_extraction(self, llm_extractor, mock_llm):
         """测试完整异步统一提取流程"""
-        mock_response = MagicMock()
-        mock_response.content = '{"type": "code", "code": "ASYNCTEST", "link": null, "backup_link": null, "confidence": 0.88}'
-        mock_llm.ainvoke.return_value = mock_response
+        mock_llm.ainvoke.return_value = _resp('{"type": "code", "code": "ASYNCTEST", "link": null, "backup_link": null, "confidence": 0.88}')
 
-        result = await extractor.extract_async("Your verification code is ASYNCTEST")
+        result = await llm_extractor.extract_async("Your verification code is ASYNCTEST")
 
         assert result.type == ExtractionType.CODE
         assert result.code == "ASYNCTEST"
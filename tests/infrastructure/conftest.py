@@ -0,0 +1,40 @@
+"""基础设施测试共享 fixture"""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+# 导入所有模型，保证 create_all 时 Base.metadata 中包含全部表
+from infrastructure.mailbox.models.mailbox_account_model import Base
+from infrastructure.mail.models.email_model import EmailModel  # noqa: F401
+from infrastructure.verification.models.wait_request_model import WaitRequestModel  # noqa: F401
+
+
+@pytest.fixture(scope="module")
+def engine():
+    """创建 SQLite 内存数据库引擎（模块内共享，只建一次表）
+
+    StaticPool 保证所有 Session 使用同一个连接，即同一个内存数据库。
+    """
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session(engine):
+    """创建数据库会话，测试结束后清空所有表"""
+    SessionLocal = sessionmaker(bind=engine)
+    session = SessionLocal()
+    yield session
+    session.close()
+    # 仓储方法内部会 commit，无法通过回滚隔离，直接清空数据
+    with engine.begin() as conn:
+        for table in reversed(Base.metadata.sorted_tables):
+            conn.execute(table.delete())
@@ -0,0 +1 @@
+"""Database infrastructure tests"""
@@ -0,0 +1,27 @@
+"""数据库工厂测试"""
+
+from sqlalchemy import inspect
+
+from infrastructure.database.database_factory import init_database
+
+
+_INDEX_NAME = "ix_mailbox_accounts_status_service_created"
+
+
+class TestInitDatabase:
+    """init_database() 测试"""
+
+    def test_creates_missing_index_on_existing_table(self, engine):
+        """测试表已存在时仍补建缺失的索引（模拟升级前部署的数据库）"""
+        with engine.begin() as conn:
+            conn.exec_driver_sql(f"DROP INDEX {_INDEX_NAME}")
+
+        init_database(engine)
+
+        indexes = inspect(engine).get_indexes("mailbox_accounts")
+        assert _INDEX_NAME in [index["name"] for index in indexes]
+
+    def test_is_idempotent(self, engine):
+        """测试重复初始化不报错"""
+        init_database(engine)
+        init_database(engine)
@@ -1,14 +1,10 @@
 """SqlAlchemyEmailRepository 集成测试"""
 
 import pytest
-from datetime import datetime, timezone
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
 from uuid import uuid4
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-
-from infrastructure.mailbox.models.mailbox_account_model import Base
-from infrastructure.mail.models.email_model import EmailModel
 from infrastructure.mail.repositories.sqlalchemy_email_repository import (
     SqlAlchemyEmailRepository,
 )
@@ -16,34 +12,27 @@ from domain.mail.entities.email import Email
 
 
 @pytest.fixture
-def db_session():
-    """创建测试用的内存数据库 Session"""
-    engine = create_engine("sqlite:///:memory:")
-    Base.metadata.create_all(engine)
-    Session = sessionmaker(bind=engine)
-    session = Session()
-    yield session
-    session.close()
+def repository(session):
+    """创建仓储实例"""
+    return SqlAlchemyEmailRepository(session)
 
 
-@pytest.fixture
-def repository(db_session):
-    """创建仓储实例"""
-    return SqlAlchemyEmailRepository(db_session)
+_NOW = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+_SAMPLE_EMAIL_KWARGS = dict(
+    message_id="<test123@example.com>",
+    from_address="sender@example.com",
+    subject="Test Email Subject",
+    received_at=_NOW,
+    body_text="This is the plain text body",
+    body_html="<p>This is the HTML body</p>",
+)
 
 
 @pytest.fixture
 def sample_email():
-    """创建测试用邮件实体"""
-    return Email.create(
-        mailbox_id=uuid4(),
-        message_id="<test123@example.com>",
-        from_address="sender@example.com",
-        subject="Test Email Subject",
-        received_at=datetime.now(timezone.utc),
-        body_text="This is the plain text body",
-        body_html="<p>This is the HTML body</p>",
-    )
+    """创建测试用邮件实体（实体可变，每个测试一个新实例）"""
+    return Email.create(mailbox_id=uuid4(), **_SAMPLE_EMAIL_KWARGS)
 
 
 class TestSqlAlchemyEmailRepositoryAdd:
@@ -72,6 +61,36 @@ class TestSqlAlchemyEmailRepositoryAdd:
         assert retrieved.is_processed == sample_email.is_processed
 
 
+class TestSqlAlchemyEmailRepositoryAddMany:
+    """add_many() 方法测试"""
+
+    def test_add_many_emails(self, repository):
+        """测试批量添加邮件"""
+        mailbox_id = uuid4()
+        emails = [
+            Email.create(
+                mailbox_id=mailbox_id,
+                message_id=f"<batch{i}@example.com>",
+                from_address="sender@example.com",
+                subject=f"Batch {i}",
+                received_at=_NOW,
+            )
+            for i in range(3)
+        ]
+
+        repository.add_many(emails)
+
+        for email in emails:
+            assert repository.get_by_id(email.id) is not None
+        assert len(repository.list_by_mailbox_id(mailbox_id)) == 3
+
+    def test_add_many_empty(self, repository):
+        """测试批量添加空列表"""
+        repository.add_many([])
+
+        assert repository.list_unprocessed() == []
+
+
 class TestSqlAlchemyEmailRepositoryGetById:
     """get_by_id() 方法测试"""
 
@@ -140,26 +159,24 @@ class TestSqlAlchemyEmailRepositoryListByMailboxId:
             message_id="<email1@example.com>",
             from_address="sender1@example.com",
             subject="Email 1",
-            received_at=datetime.now(timezone.utc),
+            received_at=_NOW,
         )
         email2 = Email.create(
             mailbox_id=mailbox_id,
             message_id="<email2@example.com>",
             from_address="sender2@example.com",
             subject="Email 2",
-            received_at=datetime.now(timezone.utc),
+            received_at=_NOW,
         )
         email3 = Email.create(
             mailbox_id=uuid4(),  # 不同的邮箱
             message_id="<email3@example.com>",
             from_address="sender3@example.com",
             subject="Email 3",
-            received_at=datetime.now(timezone.utc),
+            received_at=_NOW,
         )
 
-        repository.add(email1)
-        repository.add(email2)
-        repository.add(email3)
+        repository.add_many([email1, email2, email3])
 
         result = repository.list_by_mailbox_id(mailbox_id)
 
@@ -175,6 +192,52 @@ class TestSqlAlchemyEmailRepositoryListByMailboxId:
         assert result == []
 
 
+class TestSqlAlchemyEmailRepositoryIterByMailboxId:
+    """iter_by_mailbox_id() 方法测试"""
+
+    def test_iter_by_mailbox_id_matches_list(self, repository):
+        """测试迭代结果与 list_by_mailbox_id 一致（顺序相同）"""
+        mailbox_id = uuid4()
+        repository.add_many([
+            Email.create(
+                mailbox_id=mailbox_id,
+                message_id=f"<iter{i}@example.com>",
+                from_address="sender@example.com",
+                subject=f"Iter {i}",
+                received_at=_NOW + timedelta(minutes=i),
+            )
+            for i in range(3)
+        ])
+
+        result = repository.iter_by_mailbox_id(mailbox_id)
+
+        assert isinstance(result, Iterator)
+        assert [e.id for e in result] == [e.id for e in repository.list_by_mailbox_id(mailbox_id)]
+
+    def test_iter_by_mailbox_id_streams_large_result(self, repository):
+        """测试大量邮件分批读取，跨越多个批次仍完整返回"""
+        mailbox_id = uuid4()
+        total = SqlAlchemyEmailRepository.STREAM_BATCH_SIZE * 4
+        repository.add_many([
+            Email.create(
+                mailbox_id=mailbox_id,
+                message_id=f"<stream{i}@example.com>",
+                from_address="sender@example.com",
+                subject=f"Stream {i}",
+                received_at=_NOW,
+            )
+            for i in range(total)
+        ])
+
+        count = sum(1 for _ in repository.iter_by_mailbox_id(mailbox_id))
+
+        assert count == total
+
+    def test_iter_by_mailbox_id_empty(self, repository):
+        """测试没有匹配邮件时迭代为空"""
+        assert list(repository.iter_by_mailbox_id(uuid4())) == []
+
+
 class TestSqlAlchemyEmailRepositoryListUnprocessed:
     """list_unprocessed() 方法测试"""
 
@@ -185,14 +248,14 @@ class TestSqlAlchemyEmailRepositoryListUnprocessed:
             message_id="<unprocessed1@example.com>",
             from_address="sender@example.com",
             subject="Unprocessed 1",
-            received_at=datetime.now(timezone.utc),
+            received_at=_NOW,
         )
         email2 = Email.create(
             mailbox_id=uuid4(),
             message_id="<processed@example.com>",
             from_address="sender@example.com",
             subject="Processed",
-            received_at=datetime.now(timezone.utc),
+            received_at=_NOW,
         )
         email2.mark_as_processed()
 
@@ -201,12 +264,10 @@ class TestSqlAlchemyEmailRepositoryListUnprocessed:
             message_id="<unprocessed2@example.com>",
             from_address="sender@example.com",
             subject="Unprocessed 2",
-            received_at=datetime.now(timezone.utc),
+            received_at=_NOW,
         )
 
-        repository.add(email1)
-        repository.add(email2)
-        repository.add(email3)
+        repository.add_many([email1, email2, email3])
 
         result = repository.list_unprocessed()
 
@@ -217,15 +278,16 @@ class TestSqlAlchemyEmailRepositoryListUnprocessed:
     def test_list_unprocessed_respects_limit(self, repository):
         """测试 limit 参数限制返回数量"""
         # 创建 5 封未处理邮件
-        for i in range(5):
-            email = Email.create(
+        repository.add_many([
+            Email.create(
                 mailbox_id=uuid4(),
                 message_id=f"<unprocessed{i}@example.com>",
                 from_address="sender@example.com",
                 subject=f"Unprocessed {i}",
-                received_at=datetime.now(timezone.utc),
+                received_at=_NOW,
             )
-            repository.add(email)
+            for i in range(5)
+        ])
 
         # 请求只返回 3 封
         result = repository.list_unprocessed(limit=3)
@@ -1,18 +1,17 @@
 """ImapMailFetchServiceImpl 单元测试"""
 
+import copy
 import pytest
-from unittest.mock import Mock, MagicMock, patch
-from datetime import datetime, timezone
-from uuid import uuid4
+from functools import lru_cache
+from unittest.mock import Mock, call, patch
 import imaplib
 
 from infrastructure.mail.services.imap_mail_fetch_service_impl import (
     ImapMailFetchServiceImpl,
+    _parse_date_header,
 )
 from domain.mailbox.entities.mailbox_account import MailboxAccount
 from domain.mailbox.value_objects.imap_config import ImapConfig
-from domain.mailbox.value_objects.encrypted_password import EncryptedPassword
-from domain.mailbox.value_objects.mailbox_enums import MailboxType, MailboxStatus
 from domain.mail.services.imap_mail_fetch_service import (
     ImapConnectionError,
     ImapAuthenticationError,
@@ -24,13 +23,11 @@ from domain.mail.services.imap_mail_fetch_service import (
 TEST_ENCRYPTION_KEY = "xiJ-vQsN3KaewjOgc0qvuNE831TgyRAPSs-8X14qHes="
 
 
-def create_test_mailbox(
-    username: str = "test@example.com",
-    password: str = "test_password",
-    server: str = "imap.example.com",
-    port: int = 993,
+@lru_cache(maxsize=32)
+def _cached_mailbox(
+    username: str, password: str, server: str, port: int
 ) -> MailboxAccount:
-    """创建测试用的邮箱账号"""
+    """按参数缓存邮箱账号，相同参数只做一次 Fernet 加密"""
     return MailboxAccount.create_hotmail(
         username=username,
         imap_config=ImapConfig(server=server, port=port),
@@ -39,6 +36,22 @@ def create_test_mailbox(
     )
 
 
+def create_test_mailbox(
+    username: str = "test@example.com",
+    password: str = "test_password",
+    server: str = "imap.example.com",
+    port: int = 993,
+) -> MailboxAccount:
+    """创建测试用的邮箱账号（缓存实例的浅拷贝，测试修改状态不会相互影响）"""
+    return copy.copy(_cached_mailbox(username, password, server, port))
+
+
+@pytest.fixture(scope="module")
+def service():
+    """解析类测试共享的服务实例（解析方法无状态，不涉及连接池）"""
+    return ImapMailFetchServiceImpl(encryption_key=TEST_ENCRYPTION_KEY)
+
+
 def create_mock_email_data(
     message_id: str = "<test@example.com>",
     from_address: str = "sender@example.com",
@@ -58,6 +71,57 @@ Content-Type: text/plain; charset="utf-8"
     return email_content.encode("utf-8")
 
 
+# 默认参数的原始邮件数据，导入时构造一次
+_DEFAULT_EMAIL_BYTES = create_mock_email_data()
+
+
+# 导入时保存真实类：测试中 imaplib.IMAP4_SSL 会被 patch 成 MagicMock，不能作为 spec
+_IMAP4_SSL_SPEC = imaplib.IMAP4_SSL
+
+
+def _make_imap_mock() -> Mock:
+    """创建按 IMAP4_SSL 接口约束的 mock，预置登录成功、收件箱无未读邮件
+
+    spec 限定可访问的属性，调用不存在的方法会抛出 AttributeError。
+    """
+    mock_imap = Mock(spec=_IMAP4_SSL_SPEC)
+    mock_imap.state = "AUTH"
+    mock_imap.login.return_value = ("OK", [b"Logged in"])
+    mock_imap.select.return_value = ("OK", [b"0"])
+    mock_imap.uid.side_effect = _uid_responder()
+    return mock_imap
+
+
+def _uid_responder(uids: bytes = b"", messages: dict = None, uid_after_literal=False):
+    """模拟 imap.uid() 的 SEARCH / FETCH / STORE 响应
+
+    Args:
+        uids: UID SEARCH 返回的 UID 列表，如 b"1 2"
+        messages: UID -> 原始邮件字节，按 imaplib 的 FETCH 响应格式返回
+        uid_after_literal: 为 True 时把 UID 放在邮件内容之后的收尾项中
+    """
+    messages = messages or {}
+
+    def respond(command, *args):
+        if command == "SEARCH":
+            return ("OK", [uids])
+        if command == "FETCH":
+            data = []
+            for uid in args[0].split(b","):
+                if uid in messages:
+                    raw = messages[uid]
+                    if uid_after_literal:
+                        header = b"%s (BODY[] {%d}" % (uid, len(raw))
+                        data.extend([(header, raw), b" UID %s)" % uid])
+                    else:
+                        header = b"%s (UID %s BODY[] {%d}" % (uid, uid, len(raw))
+                        data.extend([(header, raw), b")"])
+            return ("OK", data)
+        return ("OK", [b""])
+
+    return respond
+
+
 class TestImapMailFetchServiceImplInit:
     """初始化测试"""
 
@@ -82,8 +146,7 @@ class TestImapMailFetchServiceImplConnect:
     @patch("infrastructure.mail.services.imap_mail_fetch_service_impl.imaplib.IMAP4_SSL")
     def test_connect_success(self, mock_imap_class):
         """测试成功连接 IMAP 服务器"""
-        mock_imap = MagicMock()
-        mock_imap.login.return_value = ("OK", [b"Logged in"])
+        mock_imap = _make_imap_mock()
         mock_imap_class.return_value = mock_imap
 
         service = ImapMailFetchServiceImpl(encryption_key=TEST_ENCRYPTION_KEY)
@@ -111,7 +174,7 @@ class TestImapMailFetchServiceImplConnect:
     @patch("infrastructure.mail.services.imap_mail_fetch_service_impl.imaplib.IMAP4_SSL")
     def test_connect_auth_failure_raises_auth_error(self, mock_imap_class):
         """测试认证失败抛出 ImapAuthenticationError"""
-        mock_imap = MagicMock()
+        mock_imap = _make_imap_mock()
         mock_imap.login.side_effect = imaplib.IMAP4.error("Invalid credentials")
         mock_imap_class.return_value = mock_imap
 
@@ -133,8 +196,7 @@ class TestImapMailFetchServiceImplRetry:
         self, mock_imap_class, mock_sleep
     ):
         """测试第二次尝试成功连接"""
-        mock_imap = MagicMock()
-        mock_imap.login.return_value = ("OK", [b"Logged in"])
+        mock_imap = _make_imap_mock()
 
         # 第一次失败，第二次成功
         mock_imap_class.side_effect = [Exception("Temporary failure"), mock_imap]
@@ -170,12 +232,12 @@ class TestImapMailFetchServiceImplFetchEmails:
     @patch("infrastructure.mail.services.imap_mail_fetch_service_impl.imaplib.IMAP4_SSL")
     def test_fetch_new_emails_success(self, mock_imap_class):
         """测试成功收取新邮件"""
-        mock_imap = MagicMock()
-        mock_imap.login.return_value = ("OK", [b"Logged in"])
-        mock_imap.select.return_value = ("OK", [b"1"])
-        mock_imap.search.return_value = ("OK", [b"1 2"])
-        mock_imap.fetch.return_value = ("OK", [(b"1", create_mock_email_data())])
-        mock_imap.store.return_value = ("OK", [b""])
+        mock_imap = _make_imap_mock()
+        mock_imap.select.return_value = ("OK", [b"2"])
+        mock_imap.uid.side_effect = _uid_responder(b"1 2", {
+            b"1": _DEFAULT_EMAIL_BYTES,
+            b"2": create_mock_email_data(message_id="<test2@example.com>"),
+        })
         mock_imap_class.return_value = mock_imap
 
         service = ImapMailFetchServiceImpl(encryption_key=TEST_ENCRYPTION_KEY)
@@ -183,17 +245,76 @@ class TestImapMailFetchServiceImplFetchEmails:
 
         emails = service.fetch_new_emails(mailbox)
 
-        assert len(emails) >= 1
+        assert [e.message_id for e in emails] == [
+            "<test@example.com>", "<test2@example.com>"
+        ]
         mock_imap.select.assert_called_once_with("INBOX")
-        mock_imap.search.assert_called_once_with(None, "UNSEEN")
+        # 一次 SEARCH、一次批量 FETCH、一次批量 STORE
+        assert mock_imap.uid.call_args_list == [
+            call("SEARCH", None, "UNSEEN"),
+            call("FETCH", b"1,2", "(BODY.PEEK[])"),
+            call("STORE", b"1,2", "+FLAGS", "\\Seen"),
+        ]
+
+    @patch("infrastructure.mail.services.imap_mail_fetch_service_impl.imaplib.IMAP4_SSL")
+    def test_fetch_new_emails_uid_after_literal(self, mock_imap_class):
+        """测试 UID 位于邮件内容之后时仍能收取并标记已读"""
+        mock_imap = _make_imap_mock()
+        mock_imap.uid.side_effect = _uid_responder(
+            b"5", {b"5": _DEFAULT_EMAIL_BYTES}, uid_after_literal=True
+        )
+        mock_imap_class.return_value = mock_imap
+
+        service = ImapMailFetchServiceImpl(encryption_key=TEST_ENCRYPTION_KEY)
+
+        emails = service.fetch_new_emails(create_test_mailbox())
+
+        assert [e.message_id for e in emails] == ["<test@example.com>"]
+        mock_imap.uid.assert_any_call("STORE", b"5", "+FLAGS", "\\Seen")
+
+    @patch.object(ImapMailFetchServiceImpl, "FETCH_BATCH_SIZE", 2)
+    @patch("infrastructure.mail.services.imap_mail_fetch_service_impl.imaplib.IMAP4_SSL")
+    def test_fetch_new_emails_in_batches(self, mock_imap_class):
+        """测试未读邮件按 FETCH_BATCH_SIZE 分批获取"""
+        mock_imap = _make_imap_mock()
+        mock_imap.uid.side_effect = _uid_responder(b"1 2 3", {
+            uid: create_mock_email_data(message_id=f"<{uid.decode()}@example.com>")
+            for uid in (b"1", b"2", b"3")
+        })
+        mock_imap_class.return_value = mock_imap
+
+        service = ImapMailFetchServiceImpl(encryption_key=TEST_ENCRYPTION_KEY)
+
+        emails = service.fetch_new_emails(create_test_mailbox())
+
+        assert len(emails) == 3
+        fetched = [c.args[1] for c in mock_imap.uid.call_args_list if c.args[0] == "FETCH"]
+        assert fetched == [b"1,2", b"3"]
+
+    @patch("infrastructure.mail.services.imap_mail_fetch_service_impl.imaplib.IMAP4_SSL")
+    def test_fetch_new_emails_returns_parsed_when_store_fails(self, mock_imap_class):
+        """测试标记已读失败时仍返回已解析的邮件"""
+        mock_imap = _make_imap_mock()
+        respond = _uid_responder(b"1", {b"1": _DEFAULT_EMAIL_BYTES})
+
+        def uid(command, *args):
+            if command == "STORE":
+                raise imaplib.IMAP4.error("STORE failed")
+            return respond(command, *args)
+
+        mock_imap.uid.side_effect = uid
+        mock_imap_class.return_value = mock_imap
+
+        service = ImapMailFetchServiceImpl(encryption_key=TEST_ENCRYPTION_KEY)
+
+        emails = service.fetch_new_emails(create_test_mailbox())
+
+        assert len(emails) == 1
 
     @patch("infrastructure.mail.services.imap_mail_fetch_service_impl.imaplib.IMAP4_SSL")
     def test_fetch_new_emails_no_unread(self, mock_imap_class):
         """测试没有未读邮件"""
-        mock_imap = MagicMock()
-        mock_imap.login.return_value = ("OK", [b"Logged in"])
-        mock_imap.select.return_value = ("OK", [b"0"])
-        mock_imap.search.return_value = ("OK", [b""])  # 无未读邮件
+        mock_imap = _make_imap_mock()  # 无未读邮件
         mock_imap_class.return_value = mock_imap
 
         service = ImapMailFetchServiceImpl(encryption_key=TEST_ENCRYPTION_KEY)
@@ -217,14 +338,142 @@ class TestImapMailFetchServiceImplFetchEmails:
         assert emails == []
 
 
+class TestImapMailFetchServiceImplConnectionPool:
+    """连接池测试"""
+
+    @patch("infrastructure.mail.services.imap_mail_fetch_service_impl.imaplib.IMAP4_SSL")
+    def test_fetch_new_emails_reuses_pooled_connection(self, mock_imap_class):
+        """测试多次收取复用同一连接，只建立一次 SSL 连接"""
+        mock_imap = _make_imap_mock()
+        mock_imap_class.return_value = mock_imap
+
+        service = ImapMailFetchServiceImpl(encryption_key=TEST_ENCRYPTION_KEY)
+        mailbox = create_test_mailbox()
+
+        for _ in range(3):
+            service.fetch_new_emails(mailbox)
+
+        assert mock_imap_class.call_count == 1
+        mock_imap.login.assert_called_once()
+        assert mock_imap.noop.call_count == 2
+        mock_imap.logout.assert_not_called()
+
+    @patch("infrastructure.mail.services.imap_mail_fetch_service_impl.time.monotonic")
+    @patch("infrastructure.mail.services.imap_mail_fetch_service_impl.imaplib.IMAP4_SSL")
+    def test_pool_evicts_after_ttl(self, mock_imap_class, mock_monotonic):
+        """测试空闲超过 TTL 的连接被断开并重新连接"""
+        first, second = _make_imap_mock(), _make_imap_mock()
+        mock_imap_class.side_effect = [first, second]
+
+        service = ImapMailFetchServiceImpl(encryption_key=TEST_ENCRYPTION_KEY)
+        mailbox = create_test_mailbox()
+
+        mock_monotonic.return_value = 0.0
+        service.fetch_new_emails(mailbox)
+        mock_monotonic.return_value = float(ImapMailFetchServiceImpl.POOL_IDLE_TTL)
+        service.fetch_new_emails(mailbox)
+
+        assert mock_imap_class.call_count == 2
+        first.noop.assert_not_called()
+        first.logout.assert_called_once()
+
+    @patch("infrastructure.mail.services.imap_mail_fetch_service_impl.imaplib.IMAP4_SSL")
+    def test_pool_reconnects_when_noop_fails(self, mock_imap_class):
+        """测试池化连接被服务端断开时丢弃并重新连接"""
+        first, second = _make_imap_mock(), _make_imap_mock()
+        first.noop.side_effect = imaplib.IMAP4.abort("connection closed")
+        mock_imap_class.side_effect = [first, second]
+
+        service = ImapMailFetchServiceImpl(encryption_key=TEST_ENCRYPTION_KEY)
+        mailbox = create_test_mailbox()
+
+        service.fetch_new_emails(mailbox)
+        service.fetch_new_emails(mailbox)
+
+        assert mock_imap_class.call_count == 2
+        first.logout.assert_called_once()
+        second.uid.assert_called_once_with("SEARCH", None, "UNSEEN")
+
+    @pytest.mark.parametrize("command", ["SEARCH", "FETCH"])
+    @patch("infrastructure.mail.services.imap_mail_fetch_service_impl.imaplib.IMAP4_SSL")
+    def test_pool_drops_connection_aborted_during_fetch(self, mock_imap_class, command):
+        """测试收取过程中连接中断时断开连接，不归还连接池"""
+        mock_imap = _make_imap_mock()
+        respond = _uid_responder(b"1", {b"1": _DEFAULT_EMAIL_BYTES})
+
+        def uid(cmd, *args):
+            if cmd == command:
+                raise imaplib.IMAP4.abort("socket error: EOF")
+            return respond(cmd, *args)
+
+        mock_imap.uid.side_effect = uid
+        mock_imap_class.return_value = mock_imap
+
+        service = ImapMailFetchServiceImpl(encryption_key=TEST_ENCRYPTION_KEY)
+
+        emails = service.fetch_new_emails(create_test_mailbox())
+
+        assert emails == []
+        assert service._pool == {}
+        mock_imap.logout.assert_called_once()
+
+    @patch("infrastructure.mail.services.imap_mail_fetch_service_impl.imaplib.IMAP4_SSL")
+    def test_pool_drops_connection_aborted_during_store(self, mock_imap_class):
+        """测试标记已读时连接中断同样丢弃连接"""
+        mock_imap = _make_imap_mock()
+        respond = _uid_responder(b"1", {b"1": _DEFAULT_EMAIL_BYTES})
+
+        def uid(cmd, *args):
+            if cmd == "STORE":
+                raise imaplib.IMAP4.abort("connection closed")
+            return respond(cmd, *args)
+
+        mock_imap.uid.side_effect = uid
+        mock_imap_class.return_value = mock_imap
+
+        service = ImapMailFetchServiceImpl(encryption_key=TEST_ENCRYPTION_KEY)
+
+        service.fetch_new_emails(create_test_mailbox())
+
+        assert service._pool == {}
+        mock_imap.logout.assert_called_once()
+
+    @patch("infrastructure.mail.services.imap_mail_fetch_service_impl.imaplib.IMAP4_SSL")
+    def test_close_disconnects_idle_connections(self, mock_imap_class):
+        """测试 close 断开并清空连接池中的空闲连接"""
+        first, second = _make_imap_mock(), _make_imap_mock()
+        mock_imap_class.side_effect = [first, second]
+
+        service = ImapMailFetchServiceImpl(encryption_key=TEST_ENCRYPTION_KEY)
+        service.fetch_new_emails(create_test_mailbox(username="a@example.com"))
+        service.fetch_new_emails(create_test_mailbox(username="b@example.com"))
+
+        service.close()
+
+        assert service._pool == {}
+        first.logout.assert_called_once()
+        second.logout.assert_called_once()
+
+    @patch("infrastructure.mail.services.imap_mail_fetch_service_impl.imaplib.IMAP4_SSL")
+    def test_pool_is_keyed_by_account(self, mock_imap_class):
+        """测试不同账号不共享连接"""
+        mock_imap_class.side_effect = [_make_imap_mock(), _make_imap_mock()]
+
+        service = ImapMailFetchServiceImpl(encryption_key=TEST_ENCRYPTION_KEY)
+
+        service.fetch_new_emails(create_test_mailbox(username="a@example.com"))
+        service.fetch_new_emails(create_test_mailbox(username="b@example.com"))
+
+        assert mock_imap_class.call_count == 2
+
+
 class TestImapMailFetchServiceImplTestConnection:
     """连接测试功能测试"""
 
     @patch("infrastructure.mail.services.imap_mail_fetch_service_impl.imaplib.IMAP4_SSL")
     def test_test_connection_success(self, mock_imap_class):
         """测试连接测试成功"""
-        mock_imap = MagicMock()
-        mock_imap.login.return_value = ("OK", [b"Logged in"])
+        mock_imap = _make_imap_mock()
         mock_imap_class.return_value = mock_imap
 
         service = ImapMailFetchServiceImpl(encryption_key=TEST_ENCRYPTION_KEY)
@@ -250,36 +499,38 @@ class TestImapMailFetchServiceImplTestConnection:
 class TestEmailParsing:
     """邮件解析测试"""
 
-    def test_decode_header_value_plain_text(self):
+    def test_decode_header_value_plain_text(self, service):
         """测试解码普通文本头部"""
-        service = ImapMailFetchServiceImpl(encryption_key=TEST_ENCRYPTION_KEY)
-
         result = service._decode_header_value("Simple Subject")
 
         assert result == "Simple Subject"
 
-    def test_decode_header_value_encoded(self):
-        """测试解码编码的头部"""
-        service = ImapMailFetchServiceImpl(encryption_key=TEST_ENCRYPTION_KEY)
+    def test_decode_header_value_plain_ascii_skips_decode(self, service):
+        """测试不含编码字的头部不调用 decode_header"""
+        with patch(
+            "infrastructure.mail.services.imap_mail_fetch_service_impl.decode_header"
+        ) as mock_decode:
+            result = service._decode_header_value("Sender <sender@example.com>")
 
+        assert result == "Sender <sender@example.com>"
+        mock_decode.assert_not_called()
+
+    def test_decode_header_value_encoded(self, service):
+        """测试解码编码的头部"""
         # Base64 编码的 "测试" (中文)
         encoded = "=?utf-8?b?5rWL6K+V?="
         result = service._decode_header_value(encoded)
 
         assert result == "测试"
 
-    def test_decode_header_value_none(self):
+    def test_decode_header_value_none(self, service):
         """测试解码 None 值"""
-        service = ImapMailFetchServiceImpl(encryption_key=TEST_ENCRYPTION_KEY)
-
         result = service._decode_header_value(None)
 
         assert result == ""
 
-    def test_parse_date_valid(self):
+    def test_parse_date_valid(self, service):
         """测试解析有效日期"""
-        service = ImapMailFetchServiceImpl(encryption_key=TEST_ENCRYPTION_KEY)
-
         result = service._parse_date("Mon, 16 Dec 2024 10:00:00 +0000")
 
         assert result is not None
@@ -287,19 +538,25 @@ class TestEmailParsing:
         assert result.month == 12
         assert result.day == 16
 
-    def test_parse_date_invalid(self):
-        """测试解析无效日期返回当前时间"""
-        service = ImapMailFetchServiceImpl(encryption_key=TEST_ENCRYPTION_KEY)
+    def test_parse_date_caches_repeated_headers(self, service):
+        """测试相同 Date 头部只解析一次"""
+        _parse_date_header.cache_clear()
+
+        first = service._parse_date("Mon, 16 Dec 2024 10:00:00 +0000")
+        second = service._parse_date("Mon, 16 Dec 2024 10:00:00 +0000")
+
+        assert first == second
+        assert _parse_date_header.cache_info().hits == 1
 
+    def test_parse_date_invalid(self, service):
+        """测试解析无效日期返回当前时间"""
         result = service._parse_date("invalid date")
 
         assert result is not None
         # 应该返回当前时间
 
-    def test_parse_date_none(self):
+    def test_parse_date_none(self, service):
         """测试解析 None 返回当前时间"""
-        service = ImapMailFetchServiceImpl(encryption_key=TEST_ENCRYPTION_KEY)
-
         result = service._parse_date(None)
 
         assert result is not None
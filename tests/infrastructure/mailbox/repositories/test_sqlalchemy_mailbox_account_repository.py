@@ -5,33 +5,21 @@
 
 import pytest
 from datetime import datetime, timezone
-from uuid import uuid4
+from typing import List
+from uuid import UUID, uuid4
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy import bindparam, event, select
+from sqlalchemy.orm import Session
 
-from infrastructure.mailbox.models.mailbox_account_model import Base, MailboxAccountModel
+from infrastructure.mailbox.models.mailbox_account_model import MailboxAccountModel
 from infrastructure.mailbox.repositories.sqlalchemy_mailbox_account_repository import (
     SqlAlchemyMailboxAccountRepository,
 )
 from domain.mailbox.value_objects.mailbox_enums import MailboxStatus
 
 
-@pytest.fixture
-def engine():
-    """创建 SQLite 内存数据库引擎"""
-    engine = create_engine("sqlite:///:memory:", echo=False)
-    Base.metadata.create_all(engine)
-    return engine
-
-
-@pytest.fixture
-def session(engine):
-    """创建数据库会话"""
-    SessionLocal = sessionmaker(bind=engine)
-    session = SessionLocal()
-    yield session
-    session.close()
+# 按主键直接查询数据库（绕过仓储），语句在导入时构造一次
+_BY_ID_STMT = select(MailboxAccountModel).where(MailboxAccountModel.id == bindparam("id"))
 
 
 @pytest.fixture
@@ -40,16 +28,15 @@ def repository(session: Session) -> SqlAlchemyMailboxAccountRepository:
     return SqlAlchemyMailboxAccountRepository(session)
 
 
-def create_mailbox_model(
-    session: Session,
+def _build_mailbox_model(
     username: str,
     mailbox_type: str = "hotmail",
     status: str = "available",
     occupied_by_service: str = None,
     created_at: datetime = None,
 ) -> MailboxAccountModel:
-    """创建并保存测试用邮箱模型"""
-    model = MailboxAccountModel(
+    """构造测试用邮箱模型（不保存）"""
+    return MailboxAccountModel(
         id=str(uuid4()),
         username=username,
         mailbox_type=mailbox_type,
@@ -62,11 +49,29 @@ def create_mailbox_model(
         occupied_by_service=occupied_by_service,
         created_at=created_at or datetime.now(timezone.utc),
     )
+
+
+def create_mailbox_model(session: Session, username: str, **kwargs) -> MailboxAccountModel:
+    """创建并保存测试用邮箱模型"""
+    model = _build_mailbox_model(username, **kwargs)
     session.add(model)
     session.commit()
     return model
 
 
+def create_mailbox_models(session: Session, specs: List[dict]) -> List[MailboxAccountModel]:
+    """批量创建测试用邮箱模型，add_all 后只提交一次
+
+    Args:
+        session: 数据库会话
+        specs: 每个模型的参数（同 create_mailbox_model 的关键字参数）
+    """
+    models = [_build_mailbox_model(**spec) for spec in specs]
+    session.add_all(models)
+    session.commit()
+    return models
+
+
 class TestListFilteredIntegration:
     """list_filtered 方法集成测试"""
 
@@ -180,6 +185,77 @@ class TestListFilteredIntegration:
         assert total == 1
         assert items[0].occupied_by_service == "service_a"
 
+    def test_list_filtered_by_service_and_status_uses_index(
+        self,
+        engine,
+        repository: SqlAlchemyMailboxAccountRepository,
+    ):
+        """测试组合筛选走复合索引，排序无需临时 B 树"""
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            if "ORDER BY" in statement:
+                statements.append((statement, parameters))
+
+        event.listen(engine, "before_cursor_execute", capture)
+        try:
+            repository.list_filtered(
+                service="service_a", status=MailboxStatus.OCCUPIED, page=2, limit=3
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", capture)
+
+        statement, parameters = statements[0]
+        with engine.connect() as conn:
+            plan = " ".join(
+                row[-1] for row in conn.exec_driver_sql(
+                    f"EXPLAIN QUERY PLAN {statement}", parameters
+                )
+            )
+
+        assert "USING INDEX ix_mailbox_accounts_status_service_created" in plan
+        assert "TEMP B-TREE" not in plan
+
+    def test_list_filtered_issues_single_query(
+        self,
+        engine,
+        session: Session,
+        repository: SqlAlchemyMailboxAccountRepository,
+    ):
+        """测试数据和总数通过一条 SELECT 取回"""
+        create_mailbox_models(
+            session, [{"username": f"user{i}@example.com"} for i in range(3)]
+        )
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", capture)
+        try:
+            items, total = repository.list_filtered(page=1, limit=2)
+        finally:
+            event.remove(engine, "before_cursor_execute", capture)
+
+        assert len(items) == 2
+        assert total == 3
+        assert len(statements) == 1
+
+    def test_list_filtered_page_out_of_range_keeps_total(
+        self,
+        session: Session,
+        repository: SqlAlchemyMailboxAccountRepository,
+    ):
+        """测试页码超出范围时仍返回正确的总数"""
+        create_mailbox_models(
+            session, [{"username": f"user{i}@example.com"} for i in range(3)]
+        )
+
+        items, total = repository.list_filtered(page=5, limit=2)
+
+        assert items == []
+        assert total == 3
+
     def test_list_filtered_pagination(
         self,
         session: Session,
@@ -187,8 +263,9 @@ class TestListFilteredIntegration:
     ):
         """测试分页"""
         # 创建 5 个邮箱
-        for i in range(5):
-            create_mailbox_model(session, f"user{i}@example.com")
+        create_mailbox_models(
+            session, [{"username": f"user{i}@example.com"} for i in range(5)]
+        )
 
         # 第一页，每页 2 条
         items, total = repository.list_filtered(page=1, limit=2)
@@ -251,18 +328,16 @@ class TestListFilteredIntegration:
         repository: SqlAlchemyMailboxAccountRepository,
     ):
         """测试组合筛选和分页"""
-        # 创建 10 个由 service_a 占用的邮箱
-        for i in range(10):
-            create_mailbox_model(
-                session, f"service_a_user{i}@example.com",
-                status="occupied", occupied_by_service="service_a"
-            )
-        # 创建 5 个由 service_b 占用的邮箱
-        for i in range(5):
-            create_mailbox_model(
-                session, f"service_b_user{i}@example.com",
-                status="occupied", occupied_by_service="service_b"
-            )
+        # 创建 10 个由 service_a 占用、5 个由 service_b 占用的邮箱
+        create_mailbox_models(session, [
+            {
+                "username": f"{service}_user{i}@example.com",
+                "status": "occupied",
+                "occupied_by_service": service,
+            }
+            for service, count in (("service_a", 10), ("service_b", 5))
+            for i in range(count)
+        ])
 
         # 筛选 service_a，第 2 页，每页 3 条
         items, total = repository.list_filtered(
@@ -289,7 +364,6 @@ class TestRemoveIntegration:
         mailbox_id = model.id
 
         # 使用 get_by_id 获取实体
-        from uuid import UUID
         mailbox = repository.get_by_id(UUID(mailbox_id))
         assert mailbox is not None
 
@@ -310,8 +384,6 @@ class TestRemoveIntegration:
         model2 = create_mailbox_model(session, "delete@example.com")
         model3 = create_mailbox_model(session, "also-keep@example.com")
 
-        from uuid import UUID
-
         # 删除 model2
         mailbox = repository.get_by_id(UUID(model2.id))
         repository.remove(mailbox)
@@ -333,8 +405,6 @@ class TestRemoveIntegration:
         model2 = create_mailbox_model(session, "user2@example.com")
         create_mailbox_model(session, "user3@example.com")
 
-        from uuid import UUID
-
         # 初始数量
         items, total = repository.list_filtered()
         assert total == 3
@@ -358,8 +428,6 @@ class TestRemoveIntegration:
             session, "available@example.com", status="available"
         )
 
-        from uuid import UUID
-
         mailbox = repository.get_by_id(UUID(model.id))
         assert mailbox.status == MailboxStatus.AVAILABLE
 
@@ -378,14 +446,10 @@ class TestRemoveIntegration:
         model = create_mailbox_model(session, "persist-test@example.com")
         mailbox_id = model.id
 
-        from uuid import UUID
-
         # 删除
         mailbox = repository.get_by_id(UUID(mailbox_id))
         repository.remove(mailbox)
 
         # 直接查询数据库验证
-        db_result = session.query(MailboxAccountModel).filter(
-            MailboxAccountModel.id == mailbox_id
-        ).first()
+        db_result = session.execute(_BY_ID_STMT, {"id": mailbox_id}).scalar_one_or_none()
         assert db_result is None
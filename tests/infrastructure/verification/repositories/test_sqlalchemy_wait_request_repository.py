@@ -7,10 +7,9 @@ import pytest
 from datetime import datetime, timezone
 from uuid import uuid4
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy import event
+from sqlalchemy.orm import Session
 
-from infrastructure.mailbox.models.mailbox_account_model import Base
 from infrastructure.verification.models.wait_request_model import WaitRequestModel
 from infrastructure.verification.repositories.sqlalchemy_wait_request_repository import (
     SqlAlchemyWaitRequestRepository,
@@ -20,26 +19,22 @@ from domain.verification.value_objects.wait_request_status import WaitRequestSta
 
 
 @pytest.fixture
-def engine():
-    """创建 SQLite 内存数据库引擎"""
-    engine = create_engine("sqlite:///:memory:", echo=False)
-    Base.metadata.create_all(engine)
-    return engine
+def repository(session: Session) -> SqlAlchemyWaitRequestRepository:
+    """创建仓储实例"""
+    return SqlAlchemyWaitRequestRepository(session)
 
 
 @pytest.fixture
-def session(engine):
-    """创建数据库会话"""
-    SessionLocal = sessionmaker(bind=engine)
-    session = SessionLocal()
-    yield session
-    session.close()
+def statements(engine):
+    """记录测试期间执行的 SQL 语句，用于断言查询次数（防止 N+1 回归）"""
+    captured = []
 
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        captured.append(statement)
 
-@pytest.fixture
-def repository(session: Session) -> SqlAlchemyWaitRequestRepository:
-    """创建仓储实例"""
-    return SqlAlchemyWaitRequestRepository(session)
+    event.listen(engine, "before_cursor_execute", capture)
+    yield captured
+    event.remove(engine, "before_cursor_execute", capture)
 
 
 def create_wait_request_entity(
@@ -71,9 +66,7 @@ class TestAddIntegration:
         repository.add(wait_request)
 
         # 验证数据库中存在
-        model = session.query(WaitRequestModel).filter(
-            WaitRequestModel.id == str(wait_request.id)
-        ).first()
+        model = session.get(WaitRequestModel, str(wait_request.id))
         assert model is not None
         assert model.email == "test@example.com"
         assert model.service_name == "claude"
@@ -95,6 +88,21 @@ class TestAddIntegration:
         count = session.query(WaitRequestModel).count()
         assert count == 2
 
+    def test_add_many_wait_requests(
+        self,
+        session: Session,
+        repository: SqlAlchemyWaitRequestRepository,
+    ):
+        """测试批量添加等待请求"""
+        requests = [
+            create_wait_request_entity(email=f"user{i}@example.com") for i in range(3)
+        ]
+
+        repository.add_many(requests)
+
+        emails = {m.email for m in session.query(WaitRequestModel).all()}
+        assert emails == {r.email for r in requests}
+
 
 class TestGetByIdIntegration:
     """get_by_id 方法集成测试"""
@@ -204,6 +212,35 @@ class TestGetPendingByEmailIntegration:
         assert result is None
 
 
+class TestReadQueryCount:
+    """读取方法的 SQL 语句数量测试"""
+
+    @pytest.mark.parametrize(
+        "read",
+        [
+            lambda repo, r: repo.get_by_id(r.id),
+            lambda repo, r: repo.get_pending_by_mailbox_id(r.mailbox_id),
+            lambda repo, r: repo.get_pending_by_email(r.email),
+        ],
+        ids=["get_by_id", "get_pending_by_mailbox_id", "get_pending_by_email"],
+    )
+    def test_read_issues_single_statement(
+        self,
+        repository: SqlAlchemyWaitRequestRepository,
+        statements,
+        read,
+    ):
+        """测试读取单个等待请求只执行一条 SQL"""
+        wait_request = create_wait_request_entity()
+        repository.add(wait_request)
+        statements.clear()
+
+        result = read(repository, wait_request)
+
+        assert result is not None
+        assert len(statements) == 1
+
+
 class TestUpdateIntegration:
     """update 方法集成测试"""
 
@@ -261,9 +298,7 @@ class TestListByStatusIntegration:
         completed = create_wait_request_entity(email="completed@example.com")
         completed.complete("code")
 
-        repository.add(pending1)
-        repository.add(pending2)
-        repository.add(completed)
+        repository.add_many([pending1, pending2, completed])
 
         result = repository.list_by_status(WaitRequestStatus.PENDING)
 
@@ -277,9 +312,9 @@ class TestListByStatusIntegration:
     ):
         """测试列出请求时的分页"""
         # 创建 5 个 PENDING 请求
-        for i in range(5):
-            wait_request = create_wait_request_entity(email=f"user{i}@example.com")
-            repository.add(wait_request)
+        repository.add_many([
+            create_wait_request_entity(email=f"user{i}@example.com") for i in range(5)
+        ])
 
         # 获取前 2 个
         result = repository.list_by_status(WaitRequestStatus.PENDING, limit=2, offset=0)
@@ -1,23 +1,70 @@
 """Tests for HttpWebhookClient implementation"""
 
+import json
+import logging
+from typing import List, Tuple, Union
+
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import MagicMock
 import httpx
 
 from infrastructure.verification.webhook.webhook_client import HttpWebhookClient
 
 
+def _transport(
+    *outcomes: Union[int, Exception],
+) -> Tuple[httpx.MockTransport, List[httpx.Request]]:
+    """创建按顺序返回结果的 MockTransport，并记录收到的请求
+
+    Args:
+        outcomes: 每次请求的结果，int 为响应状态码，异常实例则直接抛出；
+            用完后重复最后一个结果
+
+    Returns:
+        (transport, 已收到的请求列表)
+    """
+    requests: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        outcome = outcomes[min(len(requests), len(outcomes)) - 1]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return httpx.Response(outcome)
+
+    return httpx.MockTransport(handler), requests
+
+
+@pytest.fixture
+def mock_sleep():
+    """注入客户端的等待函数替身，重试时不真正等待"""
+    return MagicMock()
+
+
+@pytest.fixture(scope="class")
+def _shared_ok_client():
+    """始终返回 200 的客户端，每个测试类只构造一次"""
+    transport, requests = _transport(200)
+    client = HttpWebhookClient(transport=transport)
+    yield client, requests
+    client.close()
+
+
+@pytest.fixture
+def ok_client(_shared_ok_client):
+    """共享的 200 客户端，每个测试开始前清空已记录的请求"""
+    client, requests = _shared_ok_client
+    requests.clear()
+    return client, requests
+
+
 class TestHttpWebhookClientSuccess:
     """HttpWebhookClient 成功场景测试"""
 
-    @patch("infrastructure.verification.webhook.webhook_client.httpx.post")
-    def test_successful_send_returns_success(self, mock_post: MagicMock):
+    def test_successful_send_returns_success(self, ok_client):
         """测试成功发送 Webhook 返回成功结果"""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_post.return_value = mock_response
+        client, requests = ok_client
 
-        client = HttpWebhookClient()
         result = client.send(
             url="https://example.com/webhook",
             payload={"request_id": "123", "type": "code", "value": "123456"},
@@ -27,16 +74,13 @@ class TestHttpWebhookClientSuccess:
         assert result.status_code == 200
         assert result.retry_count == 0
         assert result.error_message == ""
-        mock_post.assert_called_once()
+        assert len(requests) == 1
 
-    @patch("infrastructure.verification.webhook.webhook_client.httpx.post")
-    def test_successful_send_with_201_status(self, mock_post: MagicMock):
+    def test_successful_send_with_201_status(self):
         """测试 201 状态码也视为成功"""
-        mock_response = MagicMock()
-        mock_response.status_code = 201
-        mock_post.return_value = mock_response
+        transport, _ = _transport(201)
 
-        client = HttpWebhookClient()
+        client = HttpWebhookClient(transport=transport)
         result = client.send(
             url="https://example.com/webhook",
             payload={"request_id": "123"},
@@ -45,53 +89,51 @@ class TestHttpWebhookClientSuccess:
         assert result.success is True
         assert result.status_code == 201
 
-    @patch("infrastructure.verification.webhook.webhook_client.httpx.post")
-    def test_send_uses_correct_headers(self, mock_post: MagicMock):
+    def test_send_uses_correct_headers(self, ok_client):
         """测试发送时使用正确的 Content-Type 头"""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_post.return_value = mock_response
+        client, requests = ok_client
 
-        client = HttpWebhookClient()
         client.send(
             url="https://example.com/webhook",
             payload={"test": "data"},
         )
 
-        call_kwargs = mock_post.call_args.kwargs
-        assert call_kwargs["headers"]["Content-Type"] == "application/json"
+        assert requests[0].headers["Content-Type"] == "application/json"
 
-    @patch("infrastructure.verification.webhook.webhook_client.httpx.post")
-    def test_send_uses_correct_timeout(self, mock_post: MagicMock):
+    def test_send_uses_correct_timeout(self, ok_client):
         """测试发送时使用正确的超时时间"""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_post.return_value = mock_response
+        client, requests = ok_client
 
-        client = HttpWebhookClient()
         client.send(
             url="https://example.com/webhook",
             payload={"test": "data"},
         )
 
-        call_kwargs = mock_post.call_args.kwargs
-        assert call_kwargs["timeout"] == HttpWebhookClient.TIMEOUT
+        timeout = requests[0].extensions["timeout"]
+        assert timeout["read"] == HttpWebhookClient.TIMEOUT
+
+    def test_send_posts_json_payload(self, ok_client):
+        """测试以 JSON 形式 POST 载荷"""
+        client, requests = ok_client
+
+        client.send(
+            url="https://example.com/webhook",
+            payload={"request_id": "123"},
+        )
+
+        assert requests[0].method == "POST"
+        assert requests[0].url == "https://example.com/webhook"
+        assert json.loads(requests[0].content) == {"request_id": "123"}
 
 
 class TestHttpWebhookClientHttpErrors:
     """HttpWebhookClient HTTP 错误测试"""
 
-    @patch("infrastructure.verification.webhook.webhook_client.httpx.post")
-    @patch("infrastructure.verification.webhook.webhook_client.time.sleep")
-    def test_http_400_error_after_retries(
-        self, mock_sleep: MagicMock, mock_post: MagicMock
-    ):
+    def test_http_400_error_after_retries(self, mock_sleep: MagicMock):
         """测试 400 错误在所有重试后返回失败"""
-        mock_response = MagicMock()
-        mock_response.status_code = 400
-        mock_post.return_value = mock_response
+        transport, requests = _transport(400)
 
-        client = HttpWebhookClient()
+        client = HttpWebhookClient(sleep=mock_sleep, transport=transport)
         result = client.send(
             url="https://example.com/webhook",
             payload={"test": "data"},
@@ -101,21 +143,15 @@ class TestHttpWebhookClientHttpErrors:
         assert result.status_code == 400
         assert "HTTP 400" in result.error_message
         # 首次 + 3 次重试 = 4 次调用
-        assert mock_post.call_count == 4
+        assert len(requests) == 4
         # 3 次重试间等待
         assert mock_sleep.call_count == 3
 
-    @patch("infrastructure.verification.webhook.webhook_client.httpx.post")
-    @patch("infrastructure.verification.webhook.webhook_client.time.sleep")
-    def test_http_500_error_after_retries(
-        self, mock_sleep: MagicMock, mock_post: MagicMock
-    ):
+    def test_http_500_error_after_retries(self, mock_sleep: MagicMock):
         """测试 500 服务器错误在所有重试后返回失败"""
-        mock_response = MagicMock()
-        mock_response.status_code = 500
-        mock_post.return_value = mock_response
+        transport, _ = _transport(500)
 
-        client = HttpWebhookClient()
+        client = HttpWebhookClient(sleep=mock_sleep, transport=transport)
         result = client.send(
             url="https://example.com/webhook",
             payload={"test": "data"},
@@ -129,15 +165,11 @@ class TestHttpWebhookClientHttpErrors:
 class TestHttpWebhookClientNetworkErrors:
     """HttpWebhookClient 网络错误测试"""
 
-    @patch("infrastructure.verification.webhook.webhook_client.httpx.post")
-    @patch("infrastructure.verification.webhook.webhook_client.time.sleep")
-    def test_timeout_exception_after_retries(
-        self, mock_sleep: MagicMock, mock_post: MagicMock
-    ):
+    def test_timeout_exception_after_retries(self, mock_sleep: MagicMock):
         """测试超时异常在所有重试后返回失败"""
-        mock_post.side_effect = httpx.TimeoutException("Connection timed out")
+        transport, requests = _transport(httpx.ReadTimeout("Connection timed out"))
 
-        client = HttpWebhookClient()
+        client = HttpWebhookClient(sleep=mock_sleep, transport=transport)
         result = client.send(
             url="https://example.com/webhook",
             payload={"test": "data"},
@@ -146,17 +178,13 @@ class TestHttpWebhookClientNetworkErrors:
         assert result.success is False
         assert result.status_code is None
         assert "Request timeout" in result.error_message
-        assert mock_post.call_count == 4  # 首次 + 3 次重试
+        assert len(requests) == 4  # 首次 + 3 次重试
 
-    @patch("infrastructure.verification.webhook.webhook_client.httpx.post")
-    @patch("infrastructure.verification.webhook.webhook_client.time.sleep")
-    def test_request_error_after_retries(
-        self, mock_sleep: MagicMock, mock_post: MagicMock
-    ):
+    def test_request_error_after_retries(self, mock_sleep: MagicMock):
         """测试请求错误在所有重试后返回失败"""
-        mock_post.side_effect = httpx.RequestError("Connection refused")
+        transport, _ = _transport(httpx.ConnectError("Connection refused"))
 
-        client = HttpWebhookClient()
+        client = HttpWebhookClient(sleep=mock_sleep, transport=transport)
         result = client.send(
             url="https://example.com/webhook",
             payload={"test": "data"},
@@ -170,105 +198,39 @@ class TestHttpWebhookClientNetworkErrors:
 class TestHttpWebhookClientRetryBehavior:
     """HttpWebhookClient 重试行为测试"""
 
-    @patch("infrastructure.verification.webhook.webhook_client.httpx.post")
-    @patch("infrastructure.verification.webhook.webhook_client.time.sleep")
-    def test_retry_intervals_are_correct(
-        self, mock_sleep: MagicMock, mock_post: MagicMock
-    ):
+    def test_retry_intervals_are_correct(self, mock_sleep: MagicMock):
         """测试重试间隔符合预期 (1s, 5s, 15s)"""
-        mock_response = MagicMock()
-        mock_response.status_code = 500
-        mock_post.return_value = mock_response
+        transport, _ = _transport(500)
 
-        client = HttpWebhookClient()
+        client = HttpWebhookClient(sleep=mock_sleep, transport=transport)
         client.send(url="https://example.com/webhook", payload={})
 
         # 检查重试间隔
         sleep_calls = [call[0][0] for call in mock_sleep.call_args_list]
         assert sleep_calls == [1, 5, 15]
 
-    @patch("infrastructure.verification.webhook.webhook_client.httpx.post")
-    @patch("infrastructure.verification.webhook.webhook_client.time.sleep")
-    def test_success_on_second_attempt(
-        self, mock_sleep: MagicMock, mock_post: MagicMock
-    ):
-        """测试第二次尝试成功"""
-        fail_response = MagicMock()
-        fail_response.status_code = 500
-
-        success_response = MagicMock()
-        success_response.status_code = 200
-
-        mock_post.side_effect = [fail_response, success_response]
+    @pytest.mark.parametrize(
+        "fail_count",
+        [1, 2, 3],
+        ids=["second_attempt", "third_attempt", "fourth_attempt"],
+    )
+    def test_success_after_retries(self, mock_sleep: MagicMock, fail_count: int):
+        """测试前 fail_count 次失败后重试成功"""
+        transport, requests = _transport(*[500] * fail_count, 200)
 
-        client = HttpWebhookClient()
+        client = HttpWebhookClient(sleep=mock_sleep, transport=transport)
         result = client.send(url="https://example.com/webhook", payload={})
 
         assert result.success is True
-        assert result.retry_count == 1  # 一次重试后成功
-        assert mock_post.call_count == 2
-        assert mock_sleep.call_count == 1
+        assert result.retry_count == fail_count  # fail_count 次重试后成功
+        assert len(requests) == fail_count + 1
+        assert mock_sleep.call_count == fail_count
 
-    @patch("infrastructure.verification.webhook.webhook_client.httpx.post")
-    @patch("infrastructure.verification.webhook.webhook_client.time.sleep")
-    def test_success_on_third_attempt(
-        self, mock_sleep: MagicMock, mock_post: MagicMock
-    ):
-        """测试第三次尝试成功"""
-        fail_response = MagicMock()
-        fail_response.status_code = 500
-
-        success_response = MagicMock()
-        success_response.status_code = 200
-
-        mock_post.side_effect = [fail_response, fail_response, success_response]
-
-        client = HttpWebhookClient()
-        result = client.send(url="https://example.com/webhook", payload={})
-
-        assert result.success is True
-        assert result.retry_count == 2  # 两次重试后成功
-        assert mock_post.call_count == 3
-        assert mock_sleep.call_count == 2
-
-    @patch("infrastructure.verification.webhook.webhook_client.httpx.post")
-    @patch("infrastructure.verification.webhook.webhook_client.time.sleep")
-    def test_success_on_fourth_attempt(
-        self, mock_sleep: MagicMock, mock_post: MagicMock
-    ):
-        """测试第四次尝试（最后一次重试）成功"""
-        fail_response = MagicMock()
-        fail_response.status_code = 500
-
-        success_response = MagicMock()
-        success_response.status_code = 200
-
-        mock_post.side_effect = [
-            fail_response,
-            fail_response,
-            fail_response,
-            success_response,
-        ]
-
-        client = HttpWebhookClient()
-        result = client.send(url="https://example.com/webhook", payload={})
-
-        assert result.success is True
-        assert result.retry_count == 3  # 三次重试后成功
-        assert mock_post.call_count == 4
-        assert mock_sleep.call_count == 3
-
-    @patch("infrastructure.verification.webhook.webhook_client.httpx.post")
-    @patch("infrastructure.verification.webhook.webhook_client.time.sleep")
-    def test_retry_count_on_all_failures(
-        self, mock_sleep: MagicMock, mock_post: MagicMock
-    ):
+    def test_retry_count_on_all_failures(self, mock_sleep: MagicMock):
         """测试所有尝试都失败时的重试次数"""
-        mock_response = MagicMock()
-        mock_response.status_code = 500
-        mock_post.return_value = mock_response
+        transport, _ = _transport(500)
 
-        client = HttpWebhookClient()
+        client = HttpWebhookClient(sleep=mock_sleep, transport=transport)
         result = client.send(url="https://example.com/webhook", payload={})
 
         assert result.success is False
@@ -278,17 +240,12 @@ class TestHttpWebhookClientRetryBehavior:
 class TestHttpWebhookClientLogging:
     """HttpWebhookClient 日志测试"""
 
-    @patch("infrastructure.verification.webhook.webhook_client.httpx.post")
-    def test_custom_logger(self, mock_post: MagicMock):
+    def test_custom_logger(self):
         """测试使用自定义日志记录器"""
-        import logging
-
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_post.return_value = mock_response
+        transport, _ = _transport(200)
 
         custom_logger = logging.getLogger("custom_webhook")
-        client = HttpWebhookClient(logger=custom_logger)
+        client = HttpWebhookClient(logger=custom_logger, transport=transport)
 
         result = client.send(url="https://example.com/webhook", payload={})
 